@@ -9,6 +9,7 @@ from parsel import Selector
 from scrape_schema import BaseSchema, Nested
 from scrape_schema import Parsel as F  # type: ignore
 from scrape_schema import Sc, sc_param
+from scrape_schema.hooks import enable_logging
 
 
 class Book(BaseSchema):
@@ -127,8 +128,7 @@ def original_parsel(resp: str):
 
 if __name__ == "__main__":
     # optional logging configuration
-    logger = logging.getLogger("scrape_schema")
-    logger.setLevel(logging.INFO)
+    enable_logging(logging.INFO)
 
     response = requests.get("https://books.toscrape.com/catalogue/page-2.html").text
     result = MainPage(response)
@@ -2,6 +2,8 @@
 from scrape_schema._typing import Annotated as Sc  # pragma: no cover
 from scrape_schema.base import BaseSchema, sc_param
 from scrape_schema.field import Callback, JMESPath, Parsel, Text
+from scrape_schema.multi import parse_all
 from scrape_schema.nested import Nested
+from scrape_schema.router import SchemaRouter
 
 __version__ = "0.6.3"
@@ -0,0 +1,110 @@
+"""Adaptive alternative methods chains for `first_of` special method.
+
+Alternatives are tried in order of their recent success rate: when a site
+switches layout, the stale chain moves down after a few failures, and the
+working chain is tried first. So if several chains match the document,
+any of them can be returned.
+
+Chains are compiled in guarded mode, so most failures (empty query result,
+missed index) are detected without exceptions raising.
+
+Counters belong to the field object, so every schema class, which declares
+the field, has own counters. Counters are updated under lock once per call:
+alternatives are shared by threads and `parse_all` parses.
+"""
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+from scrape_schema._compiler import FieldPlan, Miss, compile_plan
+from scrape_schema._optimizer import optimize_methods
+from scrape_schema.special_methods.base import SpecialMethods
+
+if TYPE_CHECKING:
+    from scrape_schema.base import Field
+
+__all__ = ["Alternatives"]
+
+# success score decay: recent results are more important
+_DECAY = 0.9
+# chain methods errors on missed or unexpected markup, which fail the chain.
+# Errors of `fn` callables are raised
+_MISS_ERRORS = (IndexError, KeyError, AttributeError, TypeError, ValueError)
+
+
+class Alternatives:
+    """Alternative methods chains, ordered by recent success
+
+    Attributes:
+        chains: alternative fields
+        order: current chains indexes order
+        hits: success count of every chain
+        tries: evaluations count of every chain
+    """
+
+    __slots__ = ("chains", "order", "hits", "tries", "_plans", "_scores", "_lock")
+
+    def __init__(self, chains: Sequence["Field"]):
+        if not chains:
+            raise TypeError("first_of required at least one methods chain")
+        self.chains: Tuple["Field", ...] = tuple(chains)
+        self._plans: Tuple[FieldPlan, ...] = tuple(
+            compile_plan(
+                optimize_methods(list(chain._stack_methods)),
+                chain._spec_method_handler,
+                guarded=True,
+            )
+            for chain in self.chains
+        )
+        for chain in self.chains:
+            chain._freeze()
+        self.order: Tuple[int, ...] = tuple(range(len(self.chains)))
+        self.hits: List[int] = [0] * len(self.chains)
+        self.tries: List[int] = [0] * len(self.chains)
+        self._scores: List[float] = [0.0] * len(self.chains)
+        self._lock = threading.Lock()
+
+    def __call__(self, markup: Any) -> Any:
+        """Evaluate chains and return the first successful result
+
+        Returns:
+            not empty result of any chain or None, if all chains failed
+
+        Raises:
+            Exception: error of `fn` method callable
+        """
+        order = self.order
+        for n, i in enumerate(order):
+            plan = self._plans[i]
+            try:
+                result = plan(markup)
+            except _MISS_ERRORS as e:
+                method = plan.failed_method(e)
+                if method is not None and method.METHOD_NAME is SpecialMethods.FN:
+                    raise
+                continue
+            if type(result) is Miss or result is None or result == []:
+                continue
+            self._update(order[:n], i)
+            return result
+        self._update(order, None)
+        return None
+
+    def _update(self, failed: Tuple[int, ...], hit: Optional[int]) -> None:
+        """count evaluated chains and reorder them by success score"""
+        with self._lock:
+            scores = self._scores
+            for i in failed:
+                self.tries[i] += 1
+                scores[i] *= _DECAY
+            if hit is None:
+                return
+            self.tries[hit] += 1
+            self.hits[hit] += 1
+            scores[hit] = scores[hit] * _DECAY + 1
+            order = self.order
+            if hit != order[0] and scores[hit] > scores[order[0]]:
+                # sorted is stable: same scores keep previous order
+                self.order = tuple(sorted(order, key=lambda j: -scores[j]))
+
+    def __repr__(self):
+        return ", ".join(repr(chain) for chain in self.chains)
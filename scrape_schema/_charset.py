@@ -0,0 +1,63 @@
+"""Bytes markup charset detection.
+
+Detected encoding is shared between the parser and `BaseSchema.__raw__`,
+so bytes markup is decoded with the same codec and not more than once.
+
+Detection order (like browsers do):
+
+1. byte order mark
+2. explicit encoding (`SchemaConfig.encoding`)
+3. `<meta charset>`, `<meta http-equiv="Content-Type">` or xml declaration
+   in the first 1024 bytes
+4. utf-8
+"""
+import codecs
+import re
+from typing import Optional, Tuple
+
+__all__ = ["detect_encoding"]
+
+_BOMS = (
+    # utf-32 BOMs starts with utf-16 BOMs, check it first
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+_PRESCAN_SIZE = 1024
+_RE_META_CHARSET = re.compile(
+    rb"""<meta[^>]+?charset\s*=\s*["']?\s*([\w:.-]+)""", re.IGNORECASE
+)
+_RE_XML_ENCODING = re.compile(rb"""^\s*<\?xml[^>]+?encoding\s*=\s*["']([\w.-]+)""")
+
+
+def _lookup(name: str) -> Optional[str]:
+    """normalized python codec name or None, if codec is unknown"""
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(body: bytes, encoding: Optional[str] = None) -> Tuple[str, int]:
+    """Detect bytes markup encoding
+
+    Args:
+        body: markup bytes
+        encoding: explicit encoding, used if document has not BOM
+
+    Returns:
+        python codec name and BOM length
+    """
+    for bom, name in _BOMS:
+        if body.startswith(bom):
+            return name, len(bom)
+    if encoding:
+        return codecs.lookup(encoding).name, 0
+    head = body[:_PRESCAN_SIZE]
+    match = _RE_XML_ENCODING.match(head) or _RE_META_CHARSET.search(head)
+    if match and (charset := _lookup(match[1].decode("ascii"))):
+        # declaration was found by ascii scan, so it cannot be utf-16 (html5 spec)
+        return ("utf-8" if charset.startswith("utf-16") else charset), 0
+    return "utf-8", 0
@@ -0,0 +1,355 @@
+"""Field method chain compiler.
+
+Converts a list of `MarkupMethod` objects into a single python function,
+which executes the whole chain without per-step dispatch
+(`isinstance` checks, `getattr` and special methods handler lookups).
+
+Consecutive `xpath`/`css` methods are lowered to precompiled lxml XPath
+objects (see `scrape_schema._query`). The first query chain of the plan
+(`head`) receives the parse context memo, so common queries prefixes
+can be evaluated once per document.
+
+Consecutive element-wise string methods (`strip`, `lower`, `replace`, ...)
+are fused to one step, which makes a single pass over the list value
+(see `scrape_schema._peephole`). Plan keeps original methods for repr
+and error messages.
+
+Plans of fields with default value are compiled in guarded mode: steps,
+which would certainly raise an exception on `None` value, empty list index
+or missing dict key, return `Miss` sentinel instead. Field returns default
+value without exception and traceback creation cost.
+
+If the parse context has a deadline (`SchemaConfig.timeout`), it is checked
+between plan steps: `BudgetExceededError` is raised, if it is exceeded.
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from scrape_schema._peephole import fuse_string_methods
+from scrape_schema._query import QueryChain, lower_query_chain
+from scrape_schema.context import ParseContext
+from scrape_schema.exceptions import BudgetExceededError
+from scrape_schema.special_methods.base import (
+    BaseStringMethodStrategy,
+    MarkupMethod,
+    SpecialMethods,
+    SpecialMethodsHandler,
+)
+from scrape_schema.special_methods.methods import (
+    CapitalizeMethod,
+    ChompJsParseMethod,
+    ConcatLeftMethod,
+    ConcatRightMethod,
+    LowerMethod,
+    LStripMethod,
+    ReFindallMethod,
+    ReplaceMethod,
+    ReSearchMethod,
+    RStripMethod,
+    SplitMethod,
+    StripMethod,
+    UpperMethod,
+)
+
+__all__ = ["FieldPlan", "Miss", "compile_plan"]
+
+# Parsel.Selector properties, returned as is without call
+_ATTRIBUTE_NAMES = frozenset({"attrib"})
+# well-known methods, which can be called directly
+_CALLABLE_NAMES = frozenset(
+    {
+        "xpath",
+        "css",
+        "re",
+        "re_first",
+        "get",
+        "getall",
+        "extract",
+        "extract_first",
+        "jmespath",
+        "keys",
+        "values",
+        "items",
+        "__getitem__",
+    }
+)
+# default strategies, which raise an exception for None value
+_NONE_FAILING_STRATEGIES = frozenset(
+    {
+        ConcatLeftMethod,
+        ConcatRightMethod,
+        ReplaceMethod,
+        ReSearchMethod,
+        ReFindallMethod,
+        ChompJsParseMethod,
+        StripMethod,
+        LStripMethod,
+        RStripMethod,
+        LowerMethod,
+        UpperMethod,
+        CapitalizeMethod,
+        SplitMethod,
+    }
+)
+
+
+def _accept_method(markup: Any, method: MarkupMethod) -> Any:
+    """dynamic call method fallback for unknown method names"""
+    class_method = getattr(markup, method.METHOD_NAME)  # type: ignore[arg-type]
+    # Selector.attrib check case or raw dict
+    if isinstance(class_method, (property, dict)):
+        return class_method
+    return class_method(*method.args, **method.kwargs)
+
+
+def _deadline_exceeded(method: MarkupMethod) -> None:
+    raise BudgetExceededError(
+        "timeout", f"parse deadline exceeded before `{method!r}` step"
+    )
+
+
+class Miss:
+    """Guarded plan result: step, which would raise an exception
+
+    Attributes:
+        method: method, which would raise an exception
+    """
+
+    __slots__ = ("method",)
+
+    def __init__(self, method: MarkupMethod):
+        self.method = method
+
+    def __repr__(self):
+        return f"Miss({self.method!r})"
+
+
+class FieldPlan:
+    """Precompiled field method chain
+
+    Attributes:
+        methods: compiled methods chain
+        steps: methods, grouped by generated code lines
+        source: generated python source code
+        head: first step of the plan, if it is a query chain
+        guarded: True, if plan returns `Miss` sentinel instead of exception raising
+    """
+
+    __slots__ = (
+        "methods",
+        "steps",
+        "source",
+        "head",
+        "guarded",
+        "_fn",
+        "_code",
+        "_step_lines",
+    )
+
+    def __init__(
+        self,
+        steps: Sequence[Tuple[MarkupMethod, ...]],
+        source: str,
+        fn: Callable,
+        head: Optional[QueryChain] = None,
+        step_lines: Optional[Dict[int, int]] = None,
+        guarded: bool = False,
+    ):
+        self.steps = tuple(steps)
+        self.methods = tuple(m for step in self.steps for m in step)
+        self.source = source
+        self.head = head
+        self.guarded = guarded
+        self._fn = fn
+        self._code = fn.__code__
+        # generated code line number -> step index
+        self._step_lines = step_lines or {}
+
+    def __call__(self, markup: Any, ctx: Optional[ParseContext] = None) -> Any:
+        if ctx is None:
+            return self._fn(markup, None)
+        return self._fn(markup, ctx.memo, ctx.deadline)
+
+    def failed_method(self, exc: BaseException) -> Optional[MarkupMethod]:
+        """Get the method which throw the exception by traceback line number
+
+        Args:
+            exc: exception, raised from this plan
+
+        Returns:
+            MarkupMethod object or None, if exception raised outside this plan
+        """
+        tb = exc.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code is self._code:
+                i = self._step_lines.get(tb.tb_lineno)
+                if i is not None:
+                    step = self.steps[i]
+                    # QueryChain marks failed query index
+                    j = getattr(exc, "_sc_failed_step", 0)
+                    return step[min(j, len(step) - 1)]
+                return None  # pragma: no cover
+            tb = tb.tb_next
+        return None  # pragma: no cover
+
+    def __repr__(self):
+        return f"FieldPlan({'.'.join(repr(m) for m in self.methods)})"
+
+
+def _call_expr(
+    i: int, method: MarkupMethod, namespace: Dict[str, Any], target: str
+) -> str:
+    """render `target(arg, ..., key=value)` expression and bind arguments"""
+    args = []
+    for j, arg in enumerate(method.args):
+        namespace[f"_a{i}_{j}"] = arg
+        args.append(f"_a{i}_{j}")
+    if method.kwargs:
+        if all(k.isidentifier() for k in method.kwargs):
+            for k, v in method.kwargs.items():
+                namespace[f"_k{i}_{k}"] = v
+                args.append(f"{k}=_k{i}_{k}")
+        else:  # pragma: no cover
+            namespace[f"_k{i}"] = method.kwargs
+            args.append(f"**_k{i}")
+    return f"{target}({', '.join(args)})"
+
+
+def _render_step(
+    i: int,
+    method: MarkupMethod,
+    namespace: Dict[str, Any],
+    handler: SpecialMethodsHandler,
+) -> str:
+    if isinstance(method.METHOD_NAME, SpecialMethods):
+        namespace[f"_s{i}"] = handler.spec_methods_dict[method.METHOD_NAME]
+        namespace[f"_m{i}"] = method
+        return f"v = _s{i}(v, _m{i})"
+    elif method.METHOD_NAME in _ATTRIBUTE_NAMES:
+        return f"v = v.{method.METHOD_NAME}"
+    elif method.METHOD_NAME in _CALLABLE_NAMES:
+        return "v = " + _call_expr(i, method, namespace, f"v.{method.METHOD_NAME}")
+    namespace[f"_m{i}"] = method
+    return f"v = _accept_method(v, _m{i})"
+
+
+def _string_methods_count(
+    methods: Sequence[MarkupMethod], start: int, handler: SpecialMethodsHandler
+) -> int:
+    """count of consecutive element-wise string methods started by `start` index"""
+    i = start
+    while (
+        i < len(methods)
+        and isinstance(methods[i].METHOD_NAME, SpecialMethods)
+        and isinstance(
+            handler.spec_methods_dict.get(methods[i].METHOD_NAME),  # type: ignore[arg-type]
+            BaseStringMethodStrategy,
+        )
+    ):
+        i += 1
+    return i - start
+
+
+def _render_fused_string_methods(
+    i: int,
+    methods: Sequence[MarkupMethod],
+    namespace: Dict[str, Any],
+    handler: SpecialMethodsHandler,
+) -> str:
+    """render string methods as one expression: single list pass or direct calls"""
+    expr = fuse_string_methods(methods, handler, namespace, f"_k{i}", "__operand")
+    return (
+        f"v = [{expr.replace('__operand', 's')} for s in v] "
+        f"if isinstance(v, list) else {expr.replace('__operand', 'v')}"
+    )
+
+
+def _guard(i: int, method: MarkupMethod, handler: SpecialMethodsHandler) -> str:
+    """render condition, when step certainly raises an exception"""
+    name = method.METHOD_NAME
+    if isinstance(name, SpecialMethods):
+        strategy = handler.spec_methods_dict.get(name)
+        return "v is None" if type(strategy) in _NONE_FAILING_STRATEGIES else ""
+    elif name == "__getitem__" and len(method.args) == 1 and not method.kwargs:
+        if type(method.args[0]) is int:
+            return f"v is None or (isinstance(v, list) and not -len(v) <= _a{i}_0 < len(v))"
+        elif type(method.args[0]) is str:
+            return f"v is None or (isinstance(v, dict) and _a{i}_0 not in v)"
+        return "v is None"
+    elif name in _ATTRIBUTE_NAMES or name in _CALLABLE_NAMES:
+        return "v is None"
+    return ""
+
+
+def compile_plan(
+    methods: List[MarkupMethod],
+    handler: SpecialMethodsHandler,
+    guarded: bool = False,
+) -> FieldPlan:
+    """Compile methods chain to python function
+
+    Args:
+        methods: MarkupMethod objects chain
+        handler: special methods handler
+        guarded: return `Miss` sentinel instead of exceptions, if possible
+
+    Returns:
+        FieldPlan object
+    """
+    namespace: Dict[str, Any] = {
+        "_accept_method": _accept_method,
+        "_monotonic": time.monotonic,
+        "_deadline_exceeded": _deadline_exceeded,
+    }
+    lines = ["def __plan(v, memo, deadline=None):"]
+    steps: List[Tuple[MarkupMethod, ...]] = []
+    step_lines: Dict[int, int] = {}
+
+    def emit(n: int, line: str) -> None:
+        lines.append("    " + line)
+        step_lines[len(lines)] = n
+
+    i = 0
+    while i < len(methods):
+        n = len(steps)
+        terminal_miss = False
+        if chain := lower_query_chain(methods, i):
+            step = chain.methods
+            namespace[f"_q{n}"] = chain
+            # only the first chain is evaluated on the document root
+            memo = "memo" if n == 0 else "None"
+            if guarded and chain.may_miss:
+                terminal_miss = True
+                namespace[f"_tmiss{n}"] = Miss(step[-1])
+                line = f"v = _q{n}(v, {memo}, _tmiss{n})"
+            else:
+                line = f"v = _q{n}(v)" if n else "v = _q0(v, memo)"
+        elif (count := _string_methods_count(methods, i, handler)) > 1:
+            step = tuple(methods[i : i + count])
+            line = _render_fused_string_methods(n, step, namespace, handler)
+        else:
+            step = (methods[i],)
+            line = _render_step(n, methods[i], namespace, handler)
+        if n:
+            # time budget is checked between steps
+            namespace[f"_st{n}"] = step[0]
+            emit(
+                n,
+                "if deadline is not None and _monotonic() > deadline: "
+                f"_deadline_exceeded(_st{n})",
+            )
+        if guarded and (condition := _guard(n, step[0], handler)):
+            namespace[f"_miss{n}"] = Miss(step[0])
+            emit(n, f"if {condition}: return _miss{n}")
+        emit(n, line)
+        if terminal_miss:
+            emit(n, f"if v is _tmiss{n}: return v")
+        steps.append(step)
+        i += len(step)
+    lines.append("    return v")
+    source = "\n".join(lines)
+    exec(compile(source, "<scrape_schema plan>", "exec"), namespace)
+    head = namespace.get("_q0")
+    return FieldPlan(
+        steps, source, namespace["__plan"], head, step_lines, guarded=guarded
+    )
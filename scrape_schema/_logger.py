@@ -1,20 +1,11 @@
 import logging
 
-import colorlog
-
 __all__ = ["_logger", "_logger_cast"]
 
-handler = colorlog.StreamHandler()
-_formatter = colorlog.ColoredFormatter(
-    fmt="%(log_color)s %(asctime)s [%(levelname)-8s] %(name)s: %(message)s'"
-)
-
-handler.setFormatter(_formatter)
-
+# library loggers: handlers and levels are configured by application
+# or by `scrape_schema.hooks.enable_logging()`
 _logger = logging.getLogger("scrape_schema")
-_logger.addHandler(handler)
-_logger.setLevel(logging.DEBUG)
+_logger.addHandler(logging.NullHandler())
 
 _logger_cast = logging.getLogger("type_caster")
-_logger_cast.addHandler(handler)
-_logger_cast.setLevel(logging.DEBUG)
+_logger_cast.addHandler(logging.NullHandler())
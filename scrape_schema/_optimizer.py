@@ -0,0 +1,240 @@
+"""Query-chain optimizer.
+
+Rewrites common wasteful Parsel methods chains to cheaper equivalent XPath
+queries. Rules applied only if the result is provably the same:
+
+- `xpath(q).get()` -> `xpath("(q)[1]").get()`
+- `xpath(q).getall()[0]` -> `xpath("(q)[1]").getall()[0]`
+- `xpath(q).getall()[-1]` -> `xpath("(q)[last()]").getall()[-1]`
+- `xpath(q).getall()[i]` -> `xpath("(q)[i+1]").getall()[0]` for absolute query
+- `xpath(q)[0]`, `xpath(q)[-1]` -> `xpath("(q)[1]")[0]`, `xpath("(q)[last()]")[-1]`
+- `xpath(q).attrib.get(key="name")` -> `xpath("(q)[1]/@name").get()`
+
+`xpath(q).attrib["name"]` is not rewritten: it raises KeyError on a missed element
+or attribute, while indexed rewrite would raise IndexError.
+
+Any index rule is applied only for the absolute query in the chain start: relative
+query is evaluated per element of SelectorList, so the i-th result of every
+element is not the i-th result of the whole list. Absolute query result is repeated
+per SelectorList element, so for SelectorList markup only indexes of the first
+repetition give the same result, outer indexes are missed.
+
+`css(q)` methods translated to xpath, if HTML and XML translators give the same query.
+
+Attribute rules are applied only for absolute queries: `.attrib` of SelectorList
+takes the first element only, so relative query evaluated per element may give
+another result.
+"""
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from parsel.csstranslator import GenericTranslator, HTMLTranslator
+
+from scrape_schema.special_methods.base import MarkupMethod
+
+__all__ = ["optimize_methods"]
+
+_RE_PATH_START = re.compile(r"^(\.?/|descendant(-or-self)?::|child::)")
+_RE_TOP_LEVEL_OPERATOR = re.compile(
+    r"[=<>!+,$]"  # compare, arithmetic operators, function arguments, variables
+    r"|(^|\s)(and|or|div|mod)(\s|$)"  # keyword operators
+    r"|(\s|[\])])-|-\s"  # minus operator
+    r"|[\w\])'\".]\s*\*"  # multiply operator
+)
+_RE_NODE_TEST_FN = re.compile(r"([\w-]+)\(")
+_NODE_TEST_FUNCTIONS = frozenset({"text", "node", "comment", "processing-instruction"})
+_NOT_ELEMENT_NODE_TESTS = ("@", "attribute::", "namespace::") + tuple(
+    f"{fn}(" for fn in _NODE_TEST_FUNCTIONS
+)
+_RE_ATTRIBUTE_NAME = re.compile(r"^[A-Za-z_][\w.-]*$")
+
+_HTML_TRANSLATOR = HTMLTranslator()
+_XML_TRANSLATOR = GenericTranslator()
+
+
+def _top_level(query: str) -> Optional[str]:
+    """return query without string literals, predicates and parentheses content.
+
+    None, if query has unbalanced brackets or quotes
+    """
+    result = []
+    depth = 0
+    quote = None
+    for char in query:
+        if quote:
+            if char == quote:
+                quote = None
+            continue
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            if depth == 0:
+                result.append(char)
+            depth += 1
+        elif char in "])":
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0:
+                result.append(char)
+        elif depth == 0:
+            result.append(char)
+    if depth or quote:
+        return None
+    return "".join(result)
+
+
+@lru_cache(maxsize=1024)
+def _is_location_path(query: str) -> bool:
+    """check, that query is a location path, which returns node-set"""
+    query = query.strip()
+    if not _RE_PATH_START.match(query):
+        return False
+    top_level = _top_level(query)
+    if top_level is None or _RE_TOP_LEVEL_OPERATOR.search(top_level):
+        return False
+    return all(fn in _NODE_TEST_FUNCTIONS for fn in _RE_NODE_TEST_FN.findall(top_level))
+
+
+def _is_element_path(query: str) -> bool:
+    """check, that location path last step selects elements"""
+    top_level = _top_level(query.strip())
+    last_step = top_level.rsplit("/", 1)[-1]  # type: ignore[union-attr]
+    return not any(test in last_step for test in _NOT_ELEMENT_NODE_TESTS)
+
+
+@lru_cache(maxsize=1024)
+def _css_to_xpath(query: str) -> Optional[str]:
+    """translate css query, if result not depends on Selector type"""
+    try:
+        html_query = _HTML_TRANSLATOR.css_to_xpath(query)
+        xml_query = _XML_TRANSLATOR.css_to_xpath(query)
+    except Exception:
+        return None
+    return html_query if html_query == xml_query else None
+
+
+def _query(method: MarkupMethod) -> Optional[str]:
+    """extract XPath query from `xpath` or `css` method"""
+    query: Optional[str]
+    if (
+        method.METHOD_NAME == "xpath"
+        and method.args
+        and isinstance(method.args[0], str)
+    ):
+        query = method.args[0]
+    elif method.METHOD_NAME == "css" and len(method.args) == 1 and not method.kwargs:
+        query = _css_to_xpath(method.args[0])
+    else:
+        return None
+    if query is None or not _is_location_path(query):
+        return None
+    return query
+
+
+def _xpath(method: MarkupMethod, query: str) -> MarkupMethod:
+    """create xpath method with new query and same namespaces, variables"""
+    if method.METHOD_NAME == "css":
+        return MarkupMethod("xpath", args=(query, None))
+    return MarkupMethod("xpath", args=(query,) + method.args[1:], kwargs=method.kwargs)
+
+
+def _is_method(method: Optional[MarkupMethod], name: str, *args) -> bool:
+    """check method name and arguments"""
+    if method is None or method.METHOD_NAME != name or method.kwargs:
+        return False
+    return method.args == args
+
+
+def _is_first_or_last_index(method: Optional[MarkupMethod]) -> bool:
+    return _is_method(method, "__getitem__", 0) or _is_method(method, "__getitem__", -1)
+
+
+def _is_index(method: Optional[MarkupMethod]) -> bool:
+    if method is None or method.METHOD_NAME != "__getitem__" or method.kwargs:
+        return False
+    return len(method.args) == 1 and type(method.args[0]) is int
+
+
+def _rewrite(methods: Sequence[MarkupMethod], i: int) -> Optional[tuple]:
+    """try rewrite methods chain started from `i` index.
+
+    Returns:
+        tuple (new methods, count of replaced methods) or None
+    """
+    method = methods[i]
+    if (query := _query(method)) is None:
+        return None
+    step_1 = methods[i + 1] if i + 1 < len(methods) else None
+    step_2 = methods[i + 2] if i + 2 < len(methods) else None
+    # xpath(q).get()
+    if step_1 is not None and step_1.METHOD_NAME == "get" and not step_1.kwargs:
+        return (_xpath(method, f"({query})[1]"), step_1), 2
+    # xpath(q)[0], xpath(q)[-1]
+    if _is_first_or_last_index(step_1):
+        position = "1" if step_1.args[0] == 0 else "last()"  # type: ignore[union-attr]
+        return (_xpath(method, f"({query})[{position}]"), step_1), 2
+    # xpath(q).getall()[0], xpath(q).getall()[-1]
+    if _is_method(step_1, "getall") and _is_first_or_last_index(step_2):
+        position = "1" if step_2.args[0] == 0 else "last()"  # type: ignore[union-attr]
+        return (_xpath(method, f"({query})[{position}]"), step_1, step_2), 3
+    # xpath(q).getall()[i]
+    if (
+        i == 0
+        and query.lstrip().startswith("/")
+        and _is_method(step_1, "getall")
+        and _is_index(step_2)
+        and step_2.args[0] > 0  # type: ignore[union-attr]
+    ):
+        index = step_2.args[0] + 1  # type: ignore[union-attr]
+        first = MarkupMethod("__getitem__", args=(0,))
+        return (_xpath(method, f"({query})[{index}]"), step_1, first), 3
+    # xpath(q).attrib.get(key=name)
+    if (
+        method.METHOD_NAME == "xpath"
+        and query.lstrip().startswith("/")
+        and _is_method(step_1, "attrib")
+        and (name := _attrib_get_key(step_2)) is not None
+        and _is_element_path(query)
+    ):
+        attr_query = f"({query})[1]/@{name}"
+        return (_xpath(method, attr_query), MarkupMethod("get", args=(None,))), 3
+    return None
+
+
+def _attrib_get_key(method: Optional[MarkupMethod]) -> Optional[str]:
+    """attribute name of `attrib.get(name)` or `attrib.get(key=name)` method"""
+    if method is None or method.METHOD_NAME != "get":
+        return None
+    if not method.kwargs and len(method.args) == 1:
+        name = method.args[0]
+    elif not method.args and method.kwargs.keys() == {"key"}:
+        name = method.kwargs["key"]
+    else:
+        return None
+    if isinstance(name, str) and _RE_ATTRIBUTE_NAME.match(name):
+        return name
+    return None
+
+
+def optimize_methods(methods: Sequence[MarkupMethod]) -> List[MarkupMethod]:
+    """Rewrite Parsel methods chain to cheaper equivalent chain
+
+    Args:
+        methods: original methods chain
+
+    Returns:
+        optimized methods chain
+    """
+    result: List[MarkupMethod] = []
+    i = 0
+    while i < len(methods):
+        if rewritten := _rewrite(methods, i):
+            new_methods, count = rewritten
+            result.extend(new_methods)
+            i += count
+        else:
+            result.append(methods[i])
+            i += 1
+    return result
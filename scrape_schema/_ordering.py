@@ -0,0 +1,100 @@
+"""Fields parse order.
+
+By default, schema parses required fields (without default value) before optional
+fields, cheapest first: wrong documents (error pages, another page type) are
+rejected by the first failed required field without optional fields evaluation.
+
+Field cost is a static estimate of its methods chain: descendant queries are more
+expensive than relative XPath queries (CSS selectors are translated to
+`descendant-or-self::` XPath, so they are always descendant), Nested fields parse
+a schema per item, other methods are cheap.
+"""
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple, Union
+
+from scrape_schema.special_methods import MarkupMethod, SpecialMethods
+
+if TYPE_CHECKING:
+    from scrape_schema.base import BaseField
+
+__all__ = ["field_cost", "fields_order"]
+
+_QUERY_METHODS = frozenset({"xpath", "css", "jmespath"})
+_REGEX_METHODS = frozenset({"re", "re_first"})
+_METHODS_COST = {
+    SpecialMethods.FN: 3,
+    SpecialMethods.REGEX_SEARCH: 5,
+    SpecialMethods.REGEX_FINDALL: 5,
+    SpecialMethods.CHOMP_JS_PARSE: 20,
+    SpecialMethods.CHOMP_JS_PARSE_ALL: 20,
+}
+_DESCENDANT_QUERY_COST = 10
+_QUERY_COST = 5
+_NESTED_COST = 50
+
+DECLARED = "declared"
+REQUIRED_FIRST = "required_first"
+
+
+def _method_cost(method: MarkupMethod) -> int:
+    name = method.METHOD_NAME
+    if name is SpecialMethods.FIRST_OF:
+        # scrape_schema._alternatives.Alternatives object
+        return max(field_cost(chain) for chain in method.args[0].chains)
+    if isinstance(name, SpecialMethods):
+        return _METHODS_COST.get(name, 1)
+    if name == "css":
+        return _DESCENDANT_QUERY_COST
+    if name in _QUERY_METHODS:
+        query = method.args[0] if method.args else method.kwargs.get("query", "")
+        if isinstance(query, str) and not query.lstrip().startswith((".", "@")):
+            return _DESCENDANT_QUERY_COST
+        return _QUERY_COST
+    if name in _REGEX_METHODS:
+        return 5
+    return 1
+
+
+def field_cost(field: "BaseField") -> int:
+    """static estimate of the field parse cost"""
+    cost = 0
+    if getattr(field, "__I_AM_NESTED_FIELD__", False):
+        cost += _NESTED_COST
+        field = field._crop_field  # type: ignore[attr-defined]
+    return cost + sum(_method_cost(m) for m in field._stack_methods)
+
+
+def fields_order(
+    fields: Dict[str, "BaseField"], order: Union[str, Sequence[str]]
+) -> Tuple[str, ...]:
+    """Get fields parse order
+
+    Args:
+        fields: schema fields
+        order: `"required_first"` - required fields before optional,
+            cheapest first; `"declared"` - declaration order;
+            sequence of fields names - these fields first, then other fields in the
+            `"required_first"` order
+
+    Raises:
+        ValueError: unknown order or field name
+    """
+    if order == DECLARED:
+        return tuple(fields)
+    if isinstance(order, str):
+        if order != REQUIRED_FIRST:
+            raise ValueError(
+                f"fields_order should be `{DECLARED}`, `{REQUIRED_FIRST}` "
+                f"or fields names sequence, not `{order}`"
+            )
+        order = ()
+    if unknown := [name for name in order if name not in fields]:
+        raise ValueError(f"Unknown fields in fields_order: {unknown}")
+    # sorted is stable: same cost fields are parsed in declaration order
+    rest = sorted(
+        (name for name in fields if name not in order),
+        key=lambda name: (
+            fields[name].default is not Ellipsis,
+            field_cost(fields[name]),
+        ),
+    )
+    return (*order, *rest)
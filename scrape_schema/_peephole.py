@@ -0,0 +1,232 @@
+"""Peephole optimizer for consecutive string special methods.
+
+Merges runs of `REPLACE`, `STRIP`/`L_STRIP`/`R_STRIP`, `CONCAT_L`/`CONCAT_R`,
+`LOWER`, `UPPER` methods to the cheapest equivalent python expression,
+which field plan applies as one step:
+
+- `concat_l(a).concat_r(b).concat_l(c)` -> `c + a + s + b`
+- `lstrip(x).rstrip(x)` -> `strip(x)`, `strip(x).strip(x)` -> `strip(x)`
+- `lower().lower()` -> `lower()`
+- long runs of single-character replaces -> one `str.translate` table
+- long runs of literal replaces -> one precompiled alternation regex
+- other methods -> inlined method calls `s.strip().replace(a, b)`, without
+  special method strategies dispatch
+
+`str.replace` is implemented in C and very fast for a few calls, so translate table
+and regex are used only for long replaces runs.
+
+Only default strategies are merged: custom strategies, registered in handler,
+are called by their `kernel` functions.
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from scrape_schema.special_methods.base import (
+    MarkupMethod,
+    SpecialMethods,
+    SpecialMethodsHandler,
+)
+from scrape_schema.special_methods.methods import (
+    CapitalizeMethod,
+    ConcatLeftMethod,
+    ConcatRightMethod,
+    LowerMethod,
+    LStripMethod,
+    ReplaceMethod,
+    RStripMethod,
+    StripMethod,
+    UpperMethod,
+)
+
+__all__ = ["fuse_string_methods"]
+
+# measured on CPython 3.11: chain of `str.replace` calls is cheaper below
+_TRANSLATE_MIN_COUNT = 20
+_REGEX_MIN_COUNT = 8
+
+_STRIP_SIDES = {StripMethod: "lr", LStripMethod: "l", RStripMethod: "r"}
+_CASE_METHODS = {
+    LowerMethod: "lower",
+    UpperMethod: "upper",
+    CapitalizeMethod: "capitalize",
+}
+_Binder = Callable[[Any], str]
+
+
+class _Op(ABC):
+    """fused operation, rendered as python expression"""
+
+    @abstractmethod
+    def render(self, operand: str, bind: _Binder) -> str:
+        pass  # pragma: no cover
+
+
+class _Kernel(_Op):
+    def __init__(self, kernel: Callable[[Any], Any]):
+        self.kernel = kernel
+
+    def render(self, operand: str, bind: _Binder) -> str:
+        return f"{bind(self.kernel)}({operand})"
+
+
+class _Case(_Op):
+    def __init__(self, name: str):
+        self.name = name
+
+    def render(self, operand: str, bind: _Binder) -> str:
+        return f"{operand}.{self.name}()"
+
+
+class _Strip(_Op):
+    def __init__(self, sides: str, chars: Optional[str]):
+        self.sides = sides
+        self.chars = chars
+
+    def merge(self, other: "_Strip") -> bool:
+        if other.chars != self.chars:
+            return False
+        self.sides = "".join(side for side in "lr" if side in self.sides + other.sides)
+        return True
+
+    def render(self, operand: str, bind: _Binder) -> str:
+        name = {"lr": "strip", "l": "lstrip", "r": "rstrip"}[self.sides]
+        chars = "" if self.chars is None else bind(self.chars)
+        return f"{operand}.{name}({chars})"
+
+
+class _Concat(_Op):
+    def __init__(self, left: str, right: str):
+        self.left = left
+        self.right = right
+
+    def render(self, operand: str, bind: _Binder) -> str:
+        left = f"{bind(self.left)} + " if self.left else ""
+        right = f" + {bind(self.right)}" if self.right else ""
+        # keep TypeError for non-string value
+        if not left and not right:
+            return f"{bind('')} + {operand}"
+        return f"({left}{operand}{right})"
+
+
+class _Replaces(_Op):
+    def __init__(self):
+        self.replaces: List[Tuple[str, str, int]] = []
+
+    def _translate_table(self) -> Optional[Dict[int, str]]:
+        """compose single character replaces to translate table"""
+        if any(len(old) != 1 or count >= 0 for old, _, count in self.replaces):
+            return None
+        table = {}
+        for char in {old for old, _, _ in self.replaces}:
+            result = char
+            for old, new, _ in self.replaces:
+                result = result.replace(old, new)
+            table[ord(char)] = result
+        return table
+
+    def _is_independent(self) -> bool:
+        """check, that simultaneous replace is equal to sequential replaces:
+
+        - olds are not overlapped (and not contains each other)
+        - replaced text cannot produce later olds: news are not empty
+            and not contains chars of later olds
+        """
+        replaces = self.replaces
+        if any(not old or count >= 0 for old, _, count in replaces):
+            return False
+        for i, (old, new, _) in enumerate(replaces):
+            for j, (other, _, _) in enumerate(replaces):
+                if i == j:
+                    continue
+                if old in other or any(
+                    other.startswith(old[k:]) for k in range(1, len(old))
+                ):
+                    return False
+                if j > i and (not new or set(new) & set(other)):
+                    return False
+        return True
+
+    def render(self, operand: str, bind: _Binder) -> str:
+        if len(self.replaces) >= _TRANSLATE_MIN_COUNT and (
+            table := self._translate_table()
+        ):
+            return f"{operand}.translate({bind(table)})"
+        if len(self.replaces) >= _REGEX_MIN_COUNT and self._is_independent():
+            pattern = re.compile(
+                "|".join(re.escape(old) for old, _, _ in self.replaces)
+            )
+            news = {old: new for old, new, _ in self.replaces}
+            if len(set(news.values())) == 1:
+                repl: Any = next(iter(news.values())).replace("\\", "\\\\")
+            else:
+                repl = lambda m: news[m[0]]  # noqa: E731
+            return f"{bind(pattern.sub)}({bind(repl)}, {operand})"
+        for old, new, count in self.replaces:
+            operand = f"{operand}.replace({bind(old)}, {bind(new)}, {bind(count)})"
+        return operand
+
+
+def _merge(ops: List[_Op], method: MarkupMethod, strategy: Any) -> None:
+    """append method to ops, merge with previous operation if possible"""
+    last = ops[-1] if ops else None
+    cls = type(strategy)
+    if cls in _STRIP_SIDES:
+        op = _Strip(_STRIP_SIDES[cls], method.args[0])
+        if not (isinstance(last, _Strip) and last.merge(op)):
+            ops.append(op)
+    elif cls in _CASE_METHODS:
+        name = _CASE_METHODS[cls]
+        # lower and upper are idempotent
+        if not (isinstance(last, _Case) and last.name == name != "capitalize"):
+            ops.append(_Case(name))
+    elif cls is ConcatLeftMethod or cls is ConcatRightMethod:
+        if not isinstance(last, _Concat):
+            ops.append(last := _Concat("", ""))
+        if cls is ConcatLeftMethod:
+            last.left = method.args[0] + last.left
+        else:
+            last.right = last.right + method.args[0]
+    elif cls is ReplaceMethod:
+        if not isinstance(last, _Replaces):
+            ops.append(last := _Replaces())
+        old, new, count = method.args[:3]
+        last.replaces.append((old, new, count))
+    else:
+        ops.append(_Kernel(strategy.kernel(method)))
+
+
+def fuse_string_methods(
+    methods: Sequence[MarkupMethod],
+    handler: SpecialMethodsHandler,
+    namespace: Dict[str, Any],
+    prefix: str,
+    operand: str = "v",
+) -> str:
+    """Merge string methods to one expression
+
+    Args:
+        methods: consecutive string special methods
+        handler: special methods handler
+        namespace: plan namespace, where expression constants are stored
+        prefix: constants names prefix
+        operand: value variable name
+
+    Returns:
+        python expression
+    """
+    ops: List[_Op] = []
+    for method in methods:
+        assert isinstance(method.METHOD_NAME, SpecialMethods)
+        _merge(ops, method, handler.spec_methods_dict[method.METHOD_NAME])
+
+    def bind(value: Any) -> str:
+        name = f"{prefix}_{len(names)}"
+        names.append(name)
+        namespace[name] = value
+        return name
+
+    names: List[str] = []
+    for op in ops:
+        operand = op.render(operand, bind)
+    return operand
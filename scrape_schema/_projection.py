@@ -0,0 +1,173 @@
+"""Fields projection: parse only a subset of schema fields.
+
+Projection spec is a set of fields names or a dict `{name: sub_spec}`, where
+`sub_spec` is a projection of `Nested` field schema or `True` for the whole field:
+
+    MainPage(markup, include={"title": True, "books": {"url", "price"}})
+    MainPage(markup, exclude={"books": {"description"}})
+
+`include` skips `sc_param` properties, which are not requested.
+Fields, which projected `sc_param` depends on (`sc_param(depends=...)`, all
+fields if `depends` is not set), are parsed, but not added to the output.
+
+Projections are validated and compiled once per distinct spec and cached
+in the schema class.
+"""
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Set, Tuple, Type
+
+from scrape_schema._typing import get_args, get_origin
+
+if TYPE_CHECKING:
+    from scrape_schema.base import BaseSchema
+
+__all__ = ["Projection", "get_projection"]
+
+# compiled projections cache size per schema class
+_CACHE_SIZE = 128
+
+_Spec = FrozenSet[Tuple[str, Any]]
+
+
+class Projection:
+    """Compiled fields projection of the schema class
+
+    Attributes:
+        fields: projected fields names in declaration order
+        order: projected fields names in parse order
+        params: projected `sc_param` names
+        output: projected public fields (name, output key) pairs
+        children: projections of Nested fields schemas. None - whole schema
+    """
+
+    __slots__ = ("fields", "order", "params", "output", "children")
+
+    def __init__(
+        self,
+        fields: Tuple[str, ...],
+        order: Tuple[str, ...],
+        params: Tuple[str, ...],
+        output: Tuple[Tuple[str, str], ...],
+        children: Dict[str, Optional["Projection"]],
+    ):
+        self.fields = fields
+        self.order = order
+        self.params = params
+        self.output = output
+        self.children = children
+
+
+def _freeze(spec: Any) -> _Spec:
+    """convert projection spec to hashable normalized form"""
+    if isinstance(spec, dict):
+        return frozenset(
+            (name, True if sub is True or sub is None or sub is ... else _freeze(sub))
+            for name, sub in spec.items()
+        )
+    if isinstance(spec, (set, frozenset, list, tuple)):
+        return frozenset((name, True) for name in spec)
+    raise TypeError(
+        f"Projection should be set or dict of fields names, not {type(spec).__name__}"
+    )
+
+
+def _nested_schema(cls_schema: Type["BaseSchema"], name: str) -> Type["BaseSchema"]:
+    field = cls_schema.__schema_fields__[name]
+    if not getattr(field, "__I_AM_NESTED_FIELD__", False):
+        raise ValueError(
+            f"{cls_schema.__name__}.{name} is not Nested field, sub-projection "
+            "is not allowed"
+        )
+    type_ = field.type_  # type: ignore[attr-defined]
+    return get_args(type_)[0] if get_origin(type_) is list else type_
+
+
+def _compile(
+    cls_schema: Type["BaseSchema"], spec: _Spec, is_include: bool
+) -> Projection:
+    fields = cls_schema.__schema_fields__
+    params = cls_schema.__schema_sc_params__
+    names = {name: sub for name, sub in spec}
+    if unknown := [name for name in names if name not in fields and name not in params]:
+        raise ValueError(f"{cls_schema.__name__}: unknown projection fields {unknown}")
+    children: Dict[str, Optional[Projection]] = {}
+    for name, sub in names.items():
+        if sub is True:
+            continue
+        if name in params:
+            raise ValueError(
+                f"{cls_schema.__name__}.{name} is sc_param, sub-projection is not allowed"
+            )
+        children[name] = _cached(_nested_schema(cls_schema, name), sub, is_include)
+    if is_include:
+        selected = set(names)
+    else:
+        # excluded with sub-projection fields are parsed partially
+        selected = {
+            name for name in (*fields, *params) if names.get(name, False) is not True
+        }
+    parsed = set(selected)
+    for name in params:
+        if name in selected:
+            parsed.update(_param_fields(fields, params, name, set()))
+    return Projection(
+        fields=tuple(name for name in fields if name in parsed),
+        order=tuple(
+            name for name in cls_schema.__schema_parse_order__ if name in parsed
+        ),
+        params=tuple(name for name in params if name in selected),
+        output=tuple(
+            (name, key)
+            for name, key in cls_schema.__schema_output__
+            if name in selected
+        ),
+        children=children,
+    )
+
+
+def _param_fields(
+    fields: Dict[str, Any], params: Dict[str, Any], name: str, seen: Set[str]
+) -> Set[str]:
+    """fields names, which sc_param depends on, including dependencies of params.
+    sc_param without `depends` depends on all fields"""
+    depends = params[name].depends
+    if depends is None:
+        return set(fields)
+    names: Set[str] = set()
+    for dep in depends:
+        if dep in params:
+            if dep not in seen:
+                seen.add(dep)
+                names |= _param_fields(fields, params, dep, seen)
+        else:
+            names.add(dep)
+    return names
+
+
+def get_projection(
+    cls_schema: Type["BaseSchema"], spec: Any, is_include: bool = True
+) -> Projection:
+    """Get compiled projection from the schema class cache
+
+    Args:
+        cls_schema: schema class
+        spec: projection spec: set of fields names or dict with sub-projections
+        is_include: True - include spec, False - exclude spec
+
+    Raises:
+        ValueError: unknown field name or sub-projection of not Nested field
+        TypeError: invalid spec type
+    """
+    return _cached(cls_schema, _freeze(spec), is_include)
+
+
+def _cached(
+    cls_schema: Type["BaseSchema"], spec: _Spec, is_include: bool
+) -> Projection:
+    key = (is_include, spec)
+    cache = cls_schema.__dict__["__sc_projections__"]
+    if (projection := cache.get(key)) is None:
+        projection = _compile(cls_schema, spec, is_include)
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[key] = projection
+    return projection
@@ -10,7 +10,7 @@ from scrape_schema._typing import Self
 class SpecialMethodsProtocol(Protocol):
     """Special methods protocol typing"""
 
-    def sc_parse(self, markup: Any) -> Any:
+    def sc_parse(self, markup: Any, ctx: Any = None) -> Any:
         pass  # pragma: no cover
 
     def fn(self, function: Callable[..., Any]) -> Self:
@@ -84,6 +84,9 @@ class SpecialMethodsProtocol(Protocol):
     def count(self) -> Self:
         pass  # pragma: no cover
 
+    def first_of(self, *chains: Any) -> Self:
+        pass  # pragma: no cover
+
     def __getitem__(self, item) -> Self:
         pass  # pragma: no cover
 
@@ -0,0 +1,631 @@
+"""Precompiled XPath and CSS queries.
+
+CSS queries translated to XPath and all queries compiled to `lxml.etree.XPath`
+objects once, at plan compile time. `QueryChain` evaluates them directly
+against lxml tree nodes, without creating `parsel.Selector` wrappers
+for every intermediate match.
+
+If the markup is not supported (json or text Selector, registered custom namespaces),
+`QueryChain` calls Parsel methods as is.
+
+Common location path prefixes of the first queries of schema fields
+(`//div[@class="price"]/p/text()`, `//div[@class="price"]/span/text()`)
+shared by `share_common_prefixes`: prefix evaluated once per document
+and cached in the parse context memo. Field queries evaluated from cached
+nodes by `$__sc_prefix` variable: `$__sc_prefix/p/text()` is equal
+to the original query by XPath path composition rules.
+
+`parse_all` shares prefixes between fields of several schemas without changing
+schemas queries: `common_prefixes` result is passed in the shared document memo
+by `GROUP_PREFIXES_KEY`.
+"""
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from lxml import etree
+from parsel import Selector, SelectorList
+from parsel.csstranslator import GenericTranslator, HTMLTranslator
+from parsel.utils import extract_regex
+
+from scrape_schema._optimizer import _is_element_path, _is_location_path
+from scrape_schema.special_methods.base import MarkupMethod
+
+__all__ = [
+    "QueryChain",
+    "lower_query_chain",
+    "common_prefixes",
+    "share_common_prefixes",
+    "GROUP_PREFIXES_KEY",
+]
+
+_DEFAULT_NAMESPACES: Dict[str, str] = dict(Selector._default_namespaces)
+_TRANSLATORS = {"html": HTMLTranslator(), "xml": GenericTranslator()}
+_TOSTRING_METHODS = {"html": "html", "xml": "xml"}
+
+# terminal operations, which evaluated without Selector objects
+_GET = "get"
+_GETALL = "getall"
+_ATTRIB = "attrib"
+_ATTRIB_GET = "attrib.get"
+_ATTRIB_GETITEM = "attrib.__getitem__"
+_RE = "re"
+_GETITEM = "__getitem__"
+
+_PREFIX_VARIABLE = "__sc_prefix"
+# memo key of the schemas group queries prefixes (`common_prefixes` result)
+GROUP_PREFIXES_KEY = "__sc_group_prefixes__"
+# positional predicate tails, added by optimizer: `(q)[1]`, `(q)[last()]/@name`
+_RE_POSITION_TAIL = re.compile(r"^\)\[(\d+|last\(\))\](/@[A-Za-z_][\w.-]*)?$")
+
+
+def _serialize(node: Any, method: str) -> str:
+    """same as Selector.get()"""
+    if type(node) is str:
+        return node
+    try:
+        return etree.tostring(node, method=method, encoding="unicode", with_tail=False)
+    except (AttributeError, TypeError):
+        if node is True:
+            return "1"
+        elif node is False:
+            return "0"
+        return str(node)
+
+
+def _compile_xpath(query: str, namespaces: Optional[Mapping[str, str]]) -> etree.XPath:
+    """compile query with used default namespaces and passed namespaces"""
+    all_namespaces = {
+        prefix: uri
+        for prefix, uri in _DEFAULT_NAMESPACES.items()
+        if f"{prefix}:" in query
+    }
+    if namespaces:
+        all_namespaces.update(namespaces)
+    return etree.XPath(query, namespaces=all_namespaces, smart_strings=False)
+
+
+def _top_level_slashes(path: str) -> Optional[List[int]]:
+    """indexes of `/` outside string literals, predicates and parentheses.
+
+    None, if path has unbalanced brackets or quotes or union operator
+    """
+    result = []
+    depth = 0
+    quote = None
+    for i, char in enumerate(path):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif depth == 0 and char == "|":
+            return None
+        elif depth == 0 and char == "/":
+            result.append(i)
+    return None if depth or quote else result
+
+
+def _closing_parenthesis(query: str) -> Optional[int]:
+    """index of parenthesis, which closes the first one"""
+    depth = 0
+    quote = None
+    for i, char in enumerate(query):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+            if depth == 0:
+                return i if char == ")" else None
+    return None
+
+
+def _split_path(query: str) -> Optional[Tuple[str, str, str]]:
+    """split query to location path and wrapper: `(//a/b)[1]` -> `(`, `//a/b`, `)[1]`
+
+    None, if query is not a location path
+    """
+    query = query.strip()
+    head = tail = ""
+    if query.startswith("("):
+        close = _closing_parenthesis(query)
+        if close is None or not _RE_POSITION_TAIL.match(query[close:]):
+            return None
+        head, query, tail = "(", query[1:close], query[close:]
+    if "$" in query or not _is_location_path(query):
+        return None
+    return head, query, tail
+
+
+def _path_prefixes(path: str) -> List[str]:
+    """location path prefixes, which can be shared: `//a//b/c` -> `//a`, `//a//b`.
+
+    Path itself included, if it selects elements.
+    Prefixes without descendant steps are cheap and not returned
+    """
+    if (slashes := _top_level_slashes(path)) is None:
+        return []
+    prefixes = [path[:i] for i in slashes if i > 0 and path[i - 1] != "/"]
+    if _is_element_path(path):
+        prefixes.append(path)
+    return [
+        prefix
+        for prefix in prefixes
+        if ("//" in prefix or "descendant" in prefix) and _is_location_path(prefix)
+    ]
+
+
+class _Prefix:
+    """Shared location path prefix, evaluated once per document root.
+
+    Nodes are cached by the prefix query, so equal prefixes of different
+    schemas share results, if schemas share the memo (`parse_all`)
+    """
+
+    __slots__ = ("query", "parent", "key", "_xpath")
+
+    def __init__(
+        self,
+        query: str,
+        namespaces: Optional[Mapping[str, str]],
+        parent: Optional["_Prefix"] = None,
+    ):
+        self.query = query
+        self.parent = parent
+        self.key = (query, tuple(sorted((namespaces or {}).items())))
+        if parent is not None:
+            query = f"${_PREFIX_VARIABLE}{query[len(parent.query):]}"
+        self._xpath = _compile_xpath(query, namespaces)
+
+    def nodes(self, root: Any, memo: Dict[Any, Any]) -> List[Any]:
+        """evaluate prefix nodes from root or get them from memo"""
+        key = (self.key, root)
+        nodes = memo.get(key)
+        if nodes is None:
+            if self.parent is None:
+                nodes = self._xpath(root)
+            else:
+                nodes = self._xpath(
+                    root, **{_PREFIX_VARIABLE: self.parent.nodes(root, memo)}
+                )
+            memo[key] = nodes
+        return nodes
+
+    def __repr__(self):
+        return f"_Prefix({self.query!r})"
+
+
+class _Query:
+    """Precompiled `xpath` or `css` method"""
+
+    __slots__ = (
+        "method",
+        "namespaces",
+        "variables",
+        "_css",
+        "_query",
+        "_evaluators",
+        "_shared",
+    )
+
+    def __init__(self, method: MarkupMethod):
+        self.method = method
+        self._evaluators: Dict[str, Tuple[str, etree.XPath]] = {}
+        if method.METHOD_NAME == "css":
+            self._css: Optional[str] = method.args[0]
+            self._query: Optional[str] = None
+            self.namespaces: Optional[Mapping[str, str]] = None
+            self.variables: Dict[str, Any] = {}
+        else:
+            self._css = None
+            self._query = method.args[0]
+            self.namespaces = method.args[1] if len(method.args) > 1 else None
+            self.variables = method.kwargs
+        # shared prefix and query, evaluated from its nodes. Replaced by one
+        # assignment: concurrent parses see both old or both new values
+        self._shared: Optional[Tuple[_Prefix, etree.XPath]] = None
+
+    @property
+    def prefix(self) -> Optional[_Prefix]:
+        """shared prefix of this query"""
+        return None if self._shared is None else self._shared[0]
+
+    def evaluator(self, type_: str) -> Optional[Tuple[str, etree.XPath]]:
+        """get compiled XPath object for Selector type
+
+        Returns:
+            tuple of xpath query string and XPath object or None, if query cannot be compiled
+        """
+        if evaluator := self._evaluators.get(type_):
+            return evaluator
+        try:
+            query = (
+                _TRANSLATORS[type_].css_to_xpath(self._css)
+                if self._css is not None
+                else self._query
+            )
+            xpath = _compile_xpath(query, self.namespaces)  # type: ignore[arg-type]
+        except Exception:
+            return None
+        self._evaluators[type_] = evaluator = (query, xpath)  # type: ignore[assignment]
+        return evaluator
+
+    def split(self) -> Optional[Tuple[str, str, str]]:
+        """split query to location path and wrapper (see `_split_path`)"""
+        if self.variables or (evaluator := self.evaluator("html")) is None:
+            return None
+        return _split_path(evaluator[0])
+
+    def rewrite(self, prefix: _Prefix) -> Optional[Tuple[_Prefix, etree.XPath]]:
+        """compile query, evaluated from shared prefix nodes
+
+        Returns:
+            tuple of prefix and compiled query or None, if query cannot be compiled
+        """
+        head, path, tail = self.split()  # type: ignore[misc]
+        query = f"{head}${_PREFIX_VARIABLE}{path[len(prefix.query):]}{tail}"
+        try:
+            return prefix, _compile_xpath(query, self.namespaces)
+        except Exception:  # pragma: no cover
+            return None
+
+    def set_prefix(self, prefix: _Prefix) -> bool:
+        """evaluate query from shared prefix nodes
+
+        Returns:
+            True, if query rewritten
+        """
+        if (shared := self.rewrite(prefix)) is None:  # pragma: no cover
+            return False
+        self._shared = shared
+        return True
+
+    def evaluate(
+        self, nodes: List[Any], type_: str, memo: Optional[Dict[Any, Any]] = None
+    ) -> Tuple[List[Any], str]:
+        """evaluate query for every node and flatten results like SelectorList.xpath"""
+        query, xpath = self._evaluators.get(type_) or self.evaluator(type_)  # type: ignore[misc]
+        shared = self._shared
+        if memo is not None and (group := memo.get(GROUP_PREFIXES_KEY)) is not None:
+            shared = group.get(self, shared)
+        if (
+            memo is not None
+            and shared is not None
+            and len(nodes) == 1
+            # css translated for html type only
+            and (self._css is None or type_ == "html")
+            and isinstance(nodes[0], etree._Element)
+        ):
+            root = nodes[0]
+            prefix, prefix_xpath = shared
+            try:
+                value = prefix_xpath(
+                    root, **{_PREFIX_VARIABLE: prefix.nodes(root, memo)}
+                )
+            except etree.XPathError as exc:  # pragma: no cover
+                raise ValueError(f"XPath error: {exc} in {query}")
+            return value if type(value) is list else [value], query
+        result: List[Any] = []
+        for node in nodes:
+            if isinstance(node, etree._Element):
+                try:
+                    value = xpath(node, **self.variables)
+                except etree.XPathError as exc:
+                    raise ValueError(f"XPath error: {exc} in {query}")
+                if type(value) is list:
+                    result.extend(value)
+                else:
+                    result.append(value)
+            # Selector with text root returns itself only for `.` query
+            elif query.strip() == ".":
+                result.append(node)
+        return result, query
+
+
+def _is_query_method(method: MarkupMethod) -> bool:
+    if method.METHOD_NAME == "css":
+        return len(method.args) == 1 and isinstance(method.args[0], str)
+    elif method.METHOD_NAME == "xpath":
+        return (
+            len(method.args) in (1, 2)
+            and isinstance(method.args[0], str)
+            and (
+                len(method.args) == 1
+                or isinstance(method.args[1], (Mapping, type(None)))
+            )
+        )
+    return False
+
+
+def _terminal(
+    methods: Sequence[MarkupMethod],
+) -> Tuple[Optional[str], Tuple[Any, ...], int]:
+    """detect terminal operation after queries
+
+    Returns:
+        tuple of terminal name, arguments and methods count
+    """
+    if not methods or methods[0].kwargs:
+        return None, (), 0
+    method, args = methods[0], methods[0].args
+    if method.METHOD_NAME == "get" and len(args) <= 1:
+        return _GET, args, 1
+    elif method.METHOD_NAME == "getall" and not args:
+        return _GETALL, (), 1
+    elif method.METHOD_NAME == "re" and len(args) == 2:
+        return _RE, args, 1
+    elif method.METHOD_NAME == "__getitem__" and type(args[0]) is int:
+        return _GETITEM, args, 1
+    elif method.METHOD_NAME == "attrib":
+        if len(methods) > 1 and not methods[1].kwargs and len(methods[1].args) == 1:
+            if methods[1].METHOD_NAME == "get":
+                return _ATTRIB_GET, methods[1].args, 2
+            elif methods[1].METHOD_NAME == "__getitem__":
+                return _ATTRIB_GETITEM, methods[1].args, 2
+        return _ATTRIB, (), 1
+    return None, (), 0
+
+
+class QueryChain:
+    """Consecutive `xpath`, `css` methods and optional terminal method
+    (`get`, `getall`, `attrib`, `re`, `__getitem__`), evaluated on lxml nodes.
+
+    Attributes:
+        methods: original methods of this chain
+    """
+
+    __slots__ = ("methods", "_queries", "_terminal", "_args")
+
+    def __init__(
+        self,
+        methods: Sequence[MarkupMethod],
+        queries: Sequence[_Query],
+        terminal: Optional[str],
+        args: Tuple[Any, ...],
+    ):
+        self.methods = tuple(methods)
+        self._queries = tuple(queries)
+        self._terminal = terminal
+        self._args = args
+
+    @staticmethod
+    def _roots(markup: Any) -> Optional[Tuple[List[Any], str, type, type]]:
+        """extract lxml nodes from Selector or SelectorList
+
+        Returns:
+            tuple of nodes, selector type, Selector and SelectorList classes
+            or None if markup not supported
+        """
+        if isinstance(markup, Selector):
+            if (
+                markup.type not in _TOSTRING_METHODS
+                or markup.namespaces != _DEFAULT_NAMESPACES
+            ):
+                return None
+            return [markup.root], markup.type, markup.__class__, markup.selectorlist_cls
+        elif isinstance(markup, SelectorList):
+            if not markup:
+                return [], "html", Selector, markup.__class__
+            selector = markup[0]
+            type_, cls = selector.type, selector.__class__
+            if type_ not in _TOSTRING_METHODS:
+                return None
+            for sel in markup:
+                if (
+                    sel.type != type_
+                    or sel.__class__ is not cls
+                    or sel.namespaces != _DEFAULT_NAMESPACES
+                ):
+                    return None
+            return [sel.root for sel in markup], type_, cls, markup.__class__
+        return None
+
+    def _fallback(self, markup: Any) -> Any:
+        """call Parsel methods as is"""
+        for method in self.methods:
+            if method.METHOD_NAME == "attrib":
+                markup = markup.attrib
+            else:
+                markup = getattr(markup, method.METHOD_NAME)(*method.args, **method.kwargs)  # type: ignore
+        return markup
+
+    @property
+    def may_miss(self) -> bool:
+        """True, if terminal raises an exception for empty nodes list"""
+        return self._terminal in (_GETITEM, _ATTRIB_GETITEM)
+
+    def __call__(
+        self, markup: Any, memo: Optional[Dict[Any, Any]] = None, miss: Any = None
+    ) -> Any:
+        """evaluate chain
+
+        Args:
+            markup: Selector or SelectorList
+            memo: parse context memo for shared queries prefixes
+            miss: sentinel, returned instead of IndexError and KeyError of terminal
+        """
+        if (roots := self._roots(markup)) is None:
+            return self._fallback(markup)
+        nodes, type_, selector_cls, selector_list_cls = roots
+        query = ""
+        for i, q in enumerate(self._queries):
+            if q.evaluator(type_) is None:
+                return self._fallback(markup)
+            try:
+                # shared prefixes are evaluated from document root only
+                nodes, query = q.evaluate(nodes, type_, memo if i == 0 else None)
+            except Exception as e:
+                e._sc_failed_step = i  # type: ignore[attr-defined]
+                raise
+        try:
+            if miss is not None and self._is_missed(nodes):
+                return miss
+            return self._evaluate_terminal(
+                nodes, type_, query, selector_cls, selector_list_cls
+            )
+        except Exception as e:
+            e._sc_failed_step = len(self._queries)  # type: ignore[attr-defined]
+            raise
+
+    def _is_missed(self, nodes: List[Any]) -> bool:
+        """check, that terminal would raise IndexError or KeyError"""
+        if self._terminal == _GETITEM:
+            return not -len(nodes) <= self._args[0] < len(nodes)
+        elif self._terminal == _ATTRIB_GETITEM:
+            return not nodes or self._args[0] not in nodes[0].attrib
+        return False
+
+    def _evaluate_terminal(
+        self,
+        nodes: List[Any],
+        type_: str,
+        query: str,
+        selector_cls: type,
+        selector_list_cls: type,
+    ) -> Any:
+        terminal, args = self._terminal, self._args
+        if terminal == _GET:
+            if nodes:
+                return _serialize(nodes[0], _TOSTRING_METHODS[type_])
+            return args[0] if args else None
+        elif terminal == _GETALL:
+            method = _TOSTRING_METHODS[type_]
+            return [_serialize(node, method) for node in nodes]
+        elif terminal == _ATTRIB_GET:
+            return nodes[0].attrib.get(args[0]) if nodes else None
+        elif terminal == _ATTRIB_GETITEM:
+            return nodes[0].attrib[args[0]] if nodes else {}[args[0]]
+        elif terminal == _ATTRIB:
+            return dict(nodes[0].attrib) if nodes else {}
+        elif terminal == _RE:
+            method = _TOSTRING_METHODS[type_]
+            regex, replace_entities = args
+            return [
+                s
+                for node in nodes
+                for s in extract_regex(
+                    regex, _serialize(node, method), replace_entities=replace_entities
+                )
+            ]
+        type_ = "xml" if type_ == "xml" else "html"
+        if terminal == _GETITEM:
+            return selector_cls(root=nodes[args[0]], _expr=query, type=type_)
+        return selector_list_cls(
+            [selector_cls(root=node, _expr=query, type=type_) for node in nodes]
+        )
+
+    def __repr__(self):
+        return f"QueryChain({'.'.join(repr(m) for m in self.methods)})"
+
+
+def lower_query_chain(
+    methods: Sequence[MarkupMethod], start: int
+) -> Optional[QueryChain]:
+    """Try build QueryChain from methods started by `start` index
+
+    Args:
+        methods: methods chain
+        start: first method index
+
+    Returns:
+        QueryChain object or None, if method is not `xpath` or `css` or query cannot be compiled
+    """
+    queries: List[_Query] = []
+    i = start
+    while i < len(methods) and _is_query_method(methods[i]):
+        query = _Query(methods[i])
+        if query.evaluator("html") is None:
+            break
+        queries.append(query)
+        i += 1
+    if not queries:
+        return None
+    terminal, args, count = _terminal(methods[i:])
+    return QueryChain(methods[start : i + count], queries, terminal, args)
+
+
+def common_prefixes(
+    chains: Iterable[QueryChain],
+) -> Dict[_Query, Tuple[_Prefix, etree.XPath]]:
+    """Find location path prefixes, shared by first queries of chains.
+    Queries are not changed.
+
+    Prefixes are organized as a tree: longer shared prefix evaluated
+    from the shorter one.
+
+    Args:
+        chains: first query chains of schema fields plans
+
+    Returns:
+        first queries, which can be evaluated from shared prefix nodes:
+        prefix and compiled query
+    """
+    queries: Dict[int, _Query] = {}
+    for chain in chains:
+        queries[id(chain._queries[0])] = chain._queries[0]
+    # (prefix, namespaces) -> queries ids
+    candidates: Dict[Tuple[str, Any], Set[int]] = defaultdict(set)
+    query_prefixes: Dict[int, List[Tuple[str, Any]]] = {}
+    for key, query in queries.items():
+        if (split := query.split()) is None:
+            continue
+        namespaces = tuple(sorted((query.namespaces or {}).items()))
+        query_prefixes[key] = [(p, namespaces) for p in _path_prefixes(split[1])]
+        for candidate in query_prefixes[key]:
+            candidates[candidate].add(key)
+
+    prefixes: Dict[Tuple[str, Any], _Prefix] = {}
+    for prefix, namespaces in sorted(
+        (c for c, keys in candidates.items() if len(keys) > 1),
+        key=lambda c: len(c[0]),
+    ):
+        parent = None
+        for (other, other_namespaces), other_prefix in prefixes.items():
+            if (
+                other_namespaces == namespaces
+                and prefix.startswith(other)
+                and prefix[len(other)] == "/"
+                and (parent is None or len(other) > len(parent.query))
+            ):
+                parent = other_prefix
+        try:
+            prefixes[(prefix, namespaces)] = _Prefix(prefix, dict(namespaces), parent)
+        except Exception:  # pragma: no cover
+            continue
+
+    result: Dict[_Query, Tuple[_Prefix, etree.XPath]] = {}
+    for key, candidates_ in query_prefixes.items():
+        shared = [prefixes[c] for c in candidates_ if c in prefixes]
+        if shared:
+            query = queries[key]
+            rewritten = query.rewrite(max(shared, key=lambda p: len(p.query)))
+            if rewritten is not None:
+                result[query] = rewritten
+    return result
+
+
+def share_common_prefixes(chains: Iterable[QueryChain]) -> List[_Prefix]:
+    """Evaluate first queries of chains from shared prefixes nodes
+    (see `common_prefixes`)
+
+    Args:
+        chains: first query chains of schema fields plans
+
+    Returns:
+        list of used shared prefixes
+    """
+    shared = common_prefixes(chains)
+    for query, value in shared.items():
+        query._shared = value
+    return list({id(prefix): prefix for prefix, _ in shared.values()}.values())
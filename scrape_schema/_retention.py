@@ -0,0 +1,53 @@
+"""Markup and DOM retention policy of parsed schemas.
+
+- `all` - keep document tree (`__selector__`) and markup (`__raw__`)
+- `raw` - keep markup only, `__selector__` re-parses it on every access
+- `compressed` - keep zlib compressed markup, `__raw__` decompresses it
+  and `__selector__` re-parses it on every access
+- `none` - keep nothing, `__raw__` and `__selector__` raise `MarkupNotRetainedError`
+"""
+import zlib
+from typing import Union
+
+__all__ = [
+    "RETAIN_ALL",
+    "RETAIN_RAW",
+    "RETAIN_COMPRESSED",
+    "RETAIN_NONE",
+    "RETAIN_POLICIES",
+    "CompressedMarkup",
+]
+
+RETAIN_ALL = "all"
+RETAIN_RAW = "raw"
+RETAIN_COMPRESSED = "compressed"
+RETAIN_NONE = "none"
+RETAIN_POLICIES = (RETAIN_ALL, RETAIN_RAW, RETAIN_COMPRESSED, RETAIN_NONE)
+
+# fast compression: markup is compressed for every parsed document
+_COMPRESS_LEVEL = 1
+
+
+class CompressedMarkup:
+    """zlib compressed markup"""
+
+    __slots__ = ("data", "encoding", "errors")
+
+    def __init__(self, markup: Union[str, bytes], encoding: str = "utf-8"):
+        """
+        Args:
+            markup: string or bytes markup
+            encoding: bytes markup encoding
+        """
+        if isinstance(markup, str):
+            # lossless round trip of the string
+            markup, encoding = markup.encode("utf-8", "surrogatepass"), "utf-8"
+            self.errors = "surrogatepass"
+        else:
+            # bytes are decoded same as not compressed `__raw__`
+            self.errors = "replace"
+        self.data = zlib.compress(markup, _COMPRESS_LEVEL)
+        self.encoding = encoding
+
+    def decompress(self) -> str:
+        return zlib.decompress(self.data).decode(self.encoding, errors=self.errors)
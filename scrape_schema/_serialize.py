@@ -0,0 +1,49 @@
+"""JSON encoders for schema serializers.
+
+orjson is used, if installed, else build-in json module with the same
+compact utf-8 output. orjson is imported on the first call.
+"""
+import json
+from typing import Any, Callable, Optional
+
+__all__ = ["dumps", "dumps_bytes"]
+
+_UNRESOLVED: Any = object()
+# orjson module, None - if not installed
+orjson: Any = _UNRESOLVED
+
+
+def _orjson() -> Any:
+    global orjson
+    if orjson is _UNRESOLVED:
+        try:
+            import orjson as module
+        except ImportError:  # pragma: no cover
+            orjson = None
+        else:
+            orjson = module
+    return orjson
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """serialize object to utf-8 JSON bytes
+
+    Args:
+        obj: object to serialize
+        default: function, which converts not serializable objects
+    """
+    if (encoder := _orjson()) is not None:
+        return encoder.dumps(obj, default=default)
+    return dumps(obj, default).encode("utf-8")
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """serialize object to JSON string
+
+    Args:
+        obj: object to serialize
+        default: function, which converts not serializable objects
+    """
+    if (encoder := _orjson()) is not None:
+        return encoder.dumps(obj, default=default).decode("utf-8")
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":"))
@@ -1,15 +1,21 @@
 import re
+import time
 import warnings
 from abc import abstractmethod
+from itertools import chain
 from re import RegexFlag
 from typing import (
     Any,
     Callable,
+    Collection,
     Dict,
     Hashable,
+    Iterable,
     List,
     Optional,
     Pattern,
+    Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -17,17 +23,36 @@ from typing import (
 
 from parsel import Selector, SelectorList
 
-from scrape_schema._logger import _logger
+from scrape_schema._alternatives import Alternatives
+from scrape_schema._charset import detect_encoding
+from scrape_schema._compiler import FieldPlan, Miss, _accept_method, compile_plan
+from scrape_schema._optimizer import optimize_methods
+from scrape_schema._ordering import REQUIRED_FIRST, fields_order
+from scrape_schema._projection import Projection, get_projection
 from scrape_schema._protocols import SpecialMethodsProtocol
+from scrape_schema._query import QueryChain, share_common_prefixes
+from scrape_schema._retention import (
+    RETAIN_ALL,
+    RETAIN_COMPRESSED,
+    RETAIN_NONE,
+    RETAIN_POLICIES,
+    CompressedMarkup,
+)
+from scrape_schema._serialize import dumps, dumps_bytes
 from scrape_schema._typing import (
     Annotated,
-    NoneType,
     Self,
     get_args,
     get_origin,
     get_type_hints,
 )
-from scrape_schema.exceptions import SchemaPreValidationError
+from scrape_schema.context import ParseContext, SharedDocument
+from scrape_schema.exceptions import (
+    BudgetExceededError,
+    MarkupNotRetainedError,
+    SchemaPreValidationError,
+)
+from scrape_schema.hooks import HOOKS
 from scrape_schema.special_methods import (
     DEFAULT_SPEC_METHOD_HANDLER,
     MarkupMethod,
@@ -35,16 +60,206 @@ from scrape_schema.special_methods import (
     SpecialMethodsHandler,
 )
 from scrape_schema.type_caster import TypeCaster
-from scrape_schema.validator import markup_pre_validator
+from scrape_schema.validator import (
+    MarkupPreValidator,
+    is_bytes_safe,
+    markup_pre_validator,
+)
 
 
 class sc_param(property):
     """Shortcut for adding property-like descriptors in BaseSchema,
     which will go into the output of the `dict()` method.
 
-    Works like build-in `@property` decorator"""
+    Works like build-in `@property` decorator, value is computed once per instance
+    and cached. Cached value is reset, if a field, which param depends on,
+    is reassigned.
+
+    Args:
+        depends: fields and sc_param names, which param depends on.
+            Projection parses these fields for the param, even if they are
+            not included. None - param depends on all fields
+
+    Usage:
+
+        @sc_param
+        def url(self) -> str:
+            ...
+
+        @sc_param(depends=["url_path"])
+        def url(self) -> str:
+            ...
+    """
+
+    def __init__(
+        self,
+        fget: Optional[Callable[[Any], Any]] = None,
+        fset: Optional[Callable[[Any, Any], None]] = None,
+        fdel: Optional[Callable[[Any], None]] = None,
+        doc: Optional[str] = None,
+        *,
+        depends: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(fget, fset, fdel, doc)
+        self.depends: Optional[Tuple[str, ...]] = (
+            None if depends is None else tuple(depends)
+        )
+        self.name: str = getattr(fget, "__name__", "")
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+
+    def __call__(self, fget: Callable[[Any], Any]) -> "sc_param":
+        # @sc_param(depends=[...]) decorator
+        if self.fget is not None:
+            raise TypeError("sc_param object is not callable")
+        return type(self)(fget, depends=self.depends)
+
+    def getter(self, fget: Callable[[Any], Any]) -> "sc_param":
+        return type(self)(
+            fget, self.fset, self.fdel, self.__doc__, depends=self.depends
+        )
+
+    def setter(self, fset: Callable[[Any, Any], None]) -> "sc_param":
+        return type(self)(
+            self.fget, fset, self.fdel, self.__doc__, depends=self.depends
+        )
+
+    def deleter(self, fdel: Callable[[Any], None]) -> "sc_param":
+        return type(self)(
+            self.fget, self.fset, fdel, self.__doc__, depends=self.depends
+        )
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__sc_param_cache__
+        if cache is None:
+            cache = instance.__sc_param_cache__ = {}
+        elif self.name in cache:
+            return cache[self.name]
+        value = super().__get__(instance, owner)
+        cache[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        super().__set__(instance, value)
+        if instance.__sc_param_cache__:
+            instance.__sc_param_cache__.pop(self.name, None)
+
+    def __delete__(self, instance: Any) -> None:
+        super().__delete__(instance)
+        if instance.__sc_param_cache__:
+            instance.__sc_param_cache__.pop(self.name, None)
+
+
+def _sc_param_deps(
+    fields: Dict[str, "BaseField"], params: Dict[str, sc_param]
+) -> Dict[str, Tuple[str, ...]]:
+    """field or param name -> params, which cached values depend on it"""
+    deps: Dict[str, Set[str]] = {}
+    for name, param in params.items():
+        if param.depends is None:
+            names: Iterable[str] = fields
+        elif unknown := [
+            n for n in param.depends if n not in fields and n not in params
+        ]:
+            raise ValueError(f"sc_param `{name}` depends on unknown names {unknown}")
+        else:
+            names = param.depends
+        for dep in names:
+            deps.setdefault(dep, set()).add(name)
+    # params, which depend on other params, are reset transitively
+    changed = True
+    while changed:
+        changed = False
+        for dependents in deps.values():
+            for name in tuple(dependents):
+                if (more := deps.get(name)) and not more <= dependents:
+                    dependents |= more
+                    changed = True
+    return {name: tuple(sorted(dependents)) for name, dependents in deps.items()}
+
+
+# `parse_dict` and `parse_tuple` output
+_OUTPUT_DICT, _OUTPUT_TUPLE = "dict", "tuple"
+
+
+def _output_values(
+    values: Dict[str, Any],
+    fields_output: Tuple[Tuple[str, str], ...],
+    output: Optional[str],
+    by_alias: bool,
+) -> Union[Dict[str, Any], Tuple[Any, ...]]:
+    """public fields values as `parse_dict` or `parse_tuple` output"""
+    if output == _OUTPUT_TUPLE:
+        return tuple(values[name] for name, _ in fields_output)
+    elif by_alias:
+        return {key: values[name] for name, key in fields_output}
+    return {name: values[name] for name, _ in fields_output}
+
+
+# serializers layout values kinds: plain value, schema, list.
+# Lists may be changed in place: items are checked on every serialization
+_VALUE, _SCHEMA, _LIST = 0, 1, 2
+
+
+def _layout_item(value: Any) -> Tuple[Any, int]:
+    """value and its kind"""
+    if isinstance(value, BaseSchema):
+        return value, _SCHEMA
+    if isinstance(value, list):
+        return value, _LIST
+    return value, _VALUE
+
+
+def _is_schemas(value: List[Any]) -> bool:
+    """not empty list of schemas"""
+    if not value:
+        return False
+    for item in value:
+        if not isinstance(item, BaseSchema):
+            return False
+    return True
+
+
+class _LazyField:
+    """Lazy mode field descriptor: parse field on first access
+    and cache value in the instance `__dict__`"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional["BaseSchema"], owner: Any) -> Any:
+        if instance is None:
+            return owner.__schema_fields__[self.name]
+        name = self.name
+        ctx = instance._sc_ctx
+        ctx.reset_field_state()
+        value = instance._sc_parse_field(name, owner.__schema_fields__[name], ctx)
+        # instance attribute shadows this non-data descriptor
+        instance.__dict__[name] = value
+        return value
+
+
+class _DeferredAttr:
+    """Deferred mode schema class attribute: finalize schema class
+    on first access"""
 
-    pass  # pragma: no cover
+    __slots__ = ("name", "attrs")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+
+    def __get__(self, instance: Optional["BaseSchema"], owner: Any) -> Any:
+        for cls_schema in owner.__mro__:
+            if cls_schema.__dict__.get(self.name) is self:
+                cls_schema._sc_finalize(self.attrs)
+                break
+        return getattr(owner if instance is None else instance, self.name)
 
 
 class BaseField:
@@ -67,19 +282,40 @@ class BaseField:
         self._stack_methods: List[MarkupMethod] = []
         self.default = default
         self.auto_type = auto_type
-        self.is_default = False  # flag check failed parsed value
         self.alias = alias
 
         self._spec_method_handler: SpecialMethodsHandler = DEFAULT_SPEC_METHOD_HANDLER
-        self._last_failed_method: Optional[MarkupMethod] = None
-        self._is_success: bool = True  # False - field is failed, True, no errors
+        self._plan: Optional[FieldPlan] = None  # compiled methods chain
+        self._frozen = False
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                f"`{type(self).__name__}` is frozen and used in schema, "
+                f"cannot assign `{key}` attribute"
+            )
+        super().__setattr__(key, value)
+
+    def _compile(self) -> Any:
+        """Compile methods chain. Called by SchemaMeta at class creation time"""
+        pass  # pragma: no cover
+
+    def _freeze(self) -> None:
+        """Disallow modify field after build schema class.
+
+        Field objects are shared between all parse calls, all runtime state
+        stored in ParseContext object.
+        """
+        if not self._frozen:
+            self._stack_methods = tuple(self._stack_methods)  # type: ignore
+            self._frozen = True
 
     @abstractmethod
     def _prepare_markup(self, markup):
         pass  # pragma: no cover
 
     @abstractmethod
-    def sc_parse(self, markup: Any):
+    def sc_parse(self, markup: Any, ctx: Optional[ParseContext] = None):
         pass  # pragma: no cover
 
 
@@ -98,8 +334,6 @@ class Field(BaseField):
         Raises:
             TypeError if markup is not str, bytes, Selector, SelectorList object
         """
-        self._last_failed_method = None  # reset failed method link
-        _logger.debug("Field markup type: %s", type(markup).__name__)
         if isinstance(markup, (Selector, SelectorList)):
             return markup
         elif isinstance(markup, str):
@@ -108,23 +342,6 @@ class Field(BaseField):
             return Selector(body=markup)
         raise TypeError(f"Unsupported markup type: {type(markup).__name__}")
 
-    @property
-    def success(self) -> bool:
-        """last parsed field status"""
-        return self._is_success
-
-    def _special_method(self, markup: Any, method: MarkupMethod) -> Any:
-        """Handle special method
-
-        Args:
-            markup: variable for special_method
-            method: markup method object
-
-        Returns:
-            method execution result
-        """
-        return self._spec_method_handler.handle(method, markup)
-
     def __repr__(self):
         args = f"auto_type={self.auto_type}, default={self.default}, alias={self.alias}"
         if self._stack_methods:
@@ -134,60 +351,29 @@ class Field(BaseField):
             )
         return f"{self.__class__.__name__}({args})"
 
-    @staticmethod
-    def _accept_method(markup: Any, method: MarkupMethod) -> Any:
-        """call method
+    def _compile(self) -> FieldPlan:
+        """Compile stack methods to FieldPlan callable.
 
-        Args:
-            markup: variable for MarkupMethod
-            method: markup method object
+        Fields with default value compiled in guarded mode
 
         Returns:
-            method execution result
-        """
-        if isinstance(method.METHOD_NAME, str):
-            class_method = getattr(markup, method.METHOD_NAME)
-            # Selector.attrib check case or raw dict
-            if isinstance(class_method, (property, dict)):
-                return class_method
-            # callable
-            return class_method(*method.args, **method.kwargs)
-        raise TypeError(  # pragma: no cover
-            f"`{type(markup).__name__}` is not a valid method name: {method.METHOD_NAME}"
-        )
-
-    @staticmethod
-    def __log_debug_markup_len(markup: Any) -> int:
-        """this method for logging module"""
-        if isinstance(markup, NoneType):  # pragma: no cover
-            return 0
-        elif isinstance(markup, (Selector, SelectorList)):
-            markup = markup.get()
-            return 0 if isinstance(markup, NoneType) else len(markup)
-        return len(str(markup))
-
-    @staticmethod
-    def __log_debug_markup_part(markup: Any, max_len: int = 64) -> str:
-        """this method for logging module"""
-        if isinstance(markup, NoneType):  # pragma: no cover
-            return ""
-        elif isinstance(markup, (Selector, SelectorList)):
-            markup = markup.get()
-            return (
-                ""
-                if isinstance(markup, NoneType)
-                else f"{markup[:max_len]}..."
-                if len(markup) > max_len
-                else markup
+            FieldPlan object
+        """
+        if self._plan is None:
+            self._plan = compile_plan(
+                optimize_methods(self._stack_methods),
+                self._spec_method_handler,
+                guarded=self.default is not Ellipsis,
             )
-        markup = str(markup)
-        return f"{markup[:max_len]}..." if len(markup) > max_len else markup
+        return self._plan
 
-    def _call_stack_methods(self, markup: Any) -> Any:
+    def _call_stack_methods(self, markup: Any, ctx: ParseContext) -> Any:
         """call all passed methods
 
         Args:
             markup: first markup target
+            ctx: parse context. Field success, default flags and failed method
+                are written in this object
 
         Returns:
             result of all executed methods
@@ -196,74 +382,87 @@ class Field(BaseField):
             most often `AttributeError` and `TypeError` due to the absence
             of a method name due to incorrect output data in the call chain
         """
-        self._is_success = True  # reset success parsed flag
-        result = markup
-        _logger.info(
-            "Start parse markup. Stack methods count: %s", len(self._stack_methods)
-        )
-        _logger.debug(
-            "Markup (len=%i) target: %s",
-            self.__log_debug_markup_len(markup),
-            self.__log_debug_markup_part(markup),
-        )
-        for i, method in enumerate(self._stack_methods, 1):
+        ctx.reset_field_state()
+        plan = self._compile()
+        try:
+            if HOOKS.on_step:
+                result = self._trace_stack_methods(markup, ctx)
+            else:
+                result = plan(markup, ctx)
+        except BudgetExceededError:
+            # time budget is exceeded between steps: field is not parsed
+            raise
+        except Exception as e:
+            ctx.is_success = False  # mark failed parse field
+            method = getattr(e, "_sc_failed_method", None) or plan.failed_method(e)
+            ctx.failed_method = method
+            ctx.error_type = type(e)
+            return self._stack_method_error_handler(method, e, markup, ctx)
+        if type(result) is Miss:
+            # guarded plan: step would raise an exception, set default value
+            ctx.is_success = False
+            ctx.is_default = True
+            ctx.failed_method = result.method
+            if HOOKS.on_default:
+                for hook in HOOKS.on_default:
+                    hook(self, result.method, None, self.default)
+            return self.default
+        if self.default is not Ellipsis and result in (None, []):
+            return self.default
+        return result
+
+    def _trace_stack_methods(self, markup: Any, ctx: ParseContext) -> Any:
+        """call methods step-by-step without compiled plan
+        and emit `on_step` hooks events"""
+        deadline = ctx.deadline
+        for i, method in enumerate(self._stack_methods):
+            if i and deadline is not None and time.monotonic() > deadline:
+                raise BudgetExceededError(
+                    "timeout", f"parse deadline exceeded before `{method!r}` step"
+                )
             try:
                 if isinstance(method.METHOD_NAME, SpecialMethods):
-                    result = self._special_method(result, method)
+                    markup = self._spec_method_handler.handle(method, markup)
                 else:
-                    result = self._accept_method(result, method)
-                _logger.debug(
-                    "[%s] %s -> %s", i, method, self.__log_debug_markup_part(result)
-                )
+                    markup = _accept_method(markup, method)
             except Exception as e:
-                self._is_success = False  # mark failed parse field
-                _logger.warning(
-                    "Oops, %s throw exception `%s: %s`",
-                    str(method).lower(),
-                    e.__class__.__name__,
-                    e,
-                )
-                self._last_failed_method = method
-                return self._stack_method_error_handler(method, e, markup)
-        _logger.info("Call methods done. result=%s", result)
-        if self.default is not Ellipsis and result in (None, []):
-            return self.default
-        return result
+                e._sc_failed_method = method  # type: ignore[attr-defined]
+                raise
+            for hook in HOOKS.on_step:
+                hook(self, method, markup)
+        return markup
 
     def _stack_method_error_handler(
-        self, method: Union[MarkupMethod, SpecialMethods], e: Exception, markup
+        self,
+        method: Optional[MarkupMethod],
+        e: Exception,
+        markup: Any,
+        ctx: ParseContext,
     ):
-        _logger.error("Failed call method: %s", method)
-        _logger.error(
-            "Full markup:\nSTART\n%s\nEND",
-            markup.get() if isinstance(markup, (Selector, SelectorList)) else markup,
-        )
         if self.default is Ellipsis:
-            _logger.error(
-                "Method `%r` return traceback: `%s: %s`",
-                method,
-                e.__class__.__name__,
-                e,
-            )
             raise e
-        _logger.info(
-            "Skip type casting and set default value: %s",
-            self.default,
-        )
-        self.is_default = True
+        ctx.is_default = True
+        if HOOKS.on_default:
+            for hook in HOOKS.on_default:
+                hook(self, method, e, self.default)
         return self.default
 
-    def sc_parse(self, markup: Union[str, bytes, Selector, SelectorList]) -> Any:
+    def sc_parse(
+        self,
+        markup: Union[str, bytes, Selector, SelectorList],
+        ctx: Optional[ParseContext] = None,
+    ) -> Any:
         """parse field entrypoint. Execute all passed methods
 
         Args:
             markup: markup target
+            ctx: parse context. If not passed - create new
 
         Returns:
             result of all executed methods
         """
         markup = self._prepare_markup(markup)
-        return self._call_stack_methods(markup)
+        return self._call_stack_methods(markup, ctx or ParseContext())
 
     # build in methods
 
@@ -487,11 +686,42 @@ class Field(BaseField):
         """
         return self.add_method(SpecialMethods.COUNT)  # type: ignore
 
+    def first_of(self, *chains: "Field") -> SpecialMethodsProtocol:
+        """Return a successful result of alternative methods chains.
+
+        Chains are tried in order of their recent success rate, which is counted
+        per field, so a chain of the current site layout is tried first. If several
+        chains match the document, any of them can be returned. Chain fails, if it
+        returns None or empty list or its methods raise an extraction error
+        (IndexError, KeyError, AttributeError, TypeError, ValueError). Errors of
+        `fn` callables are raised.
+
+        Example:
+            Parsel().first_of(
+                Parsel().css("h1.title::text").get(),
+                Parsel().xpath("//div[@id='title']/text()").get(),
+            )
+
+        Args:
+            chains: alternative fields with methods chains, applied to current value
+
+        Returns:
+            any matching chain result or None, if all chains failed
+        """
+        return self.add_method(  # type: ignore
+            SpecialMethods.FIRST_OF, Alternatives(chains)
+        )
+
     def add_method(
         self, method_name: Union[str, SpecialMethods], *args, **kwargs
     ) -> Self:
         """low-level interface adding methods to call stack"""
+        if self._frozen:
+            raise TypeError(
+                f"`{type(self).__name__}` is frozen and used in schema, cannot add methods"
+            )
         self._stack_methods.append(MarkupMethod(method_name, args=args, kwargs=kwargs))
+        self._plan = None  # reset compiled methods chain
         return self
 
     def __getitem__(self, item: Hashable) -> Self:
@@ -503,9 +733,52 @@ class Field(BaseField):
         return self.add_method("__getitem__", item)
 
 
+# instance attributes of slotted schemas
+_SCHEMA_SLOTS = (
+    "_cached_parser",
+    "_markup",
+    "_encoding",
+    "__sc_unparsed__",
+    "__sc_budget_error__",
+    "__sc_projection__",
+    "__sc_param_cache__",
+    "__sc_dict_cache__",
+    "__sc_dict_result__",
+)
+
+
+# schema class attributes, which are set by the class finalization
+_SCHEMA_DEFERRED = (
+    "__schema_fields__",
+    "__schema_annotations__",
+    "__schema_aliases__",
+    "__schema_query_heads__",
+    "__schema_slotted__",
+    "__schema_output__",
+    "__schema_sc_params__",
+    "__schema_param_deps__",
+    "__schema_pre_validators__",
+    "__schema_validators__",
+    "__schema_pattern_validators__",
+    "__schema_bytes_patterns__",
+    "__schema_parse_order__",
+)
+
+
+def _mro_slots(cls: type) -> Set[str]:
+    """all `__slots__` names of the class and base classes"""
+    return {slot for base in cls.__mro__ for slot in vars(base).get("__slots__", ())}
+
+
 class SchemaMeta(type):
     """Metaclass for prefetching fields, field annotations, and field alias keys"""
 
+    @property
+    def __schema_name__(cls) -> str:
+        """schema class name. Hooks get the schema class, if values are parsed
+        without schema object (`parse_dict`, `parse_tuple`)"""
+        return cls.__name__
+
     @staticmethod
     def __is_type_field(attr: Type) -> bool:
         return get_origin(attr) is Annotated and all(
@@ -518,27 +791,105 @@ class SchemaMeta(type):
         return args[0], tuple(arg for arg in args[1:] if isinstance(arg, BaseField))[0]
 
     @staticmethod
-    def __is_attribute_field(cls_schema, name: str) -> bool:
-        if (field := cls_schema.__dict__.get(name)) and isinstance(field, BaseField):
+    def __is_attribute_field(attrs: Dict[str, Any], name: str) -> bool:
+        if (field := attrs.get(name)) and isinstance(field, BaseField):
             return True
         return False
 
     @staticmethod
-    def __parse_attribute_field(cls_schema, name: str) -> Tuple[Type, BaseField]:
-        field = cls_schema.__dict__.get(name)
-        type_ = cls_schema.__annotations__.get(name, Any)
+    def __parse_attribute_field(
+        attrs: Dict[str, Any], name: str
+    ) -> Tuple[Type, BaseField]:
+        field = attrs[name]
+        type_ = attrs.get("__annotations__", {}).get(name, Any)
         return type_, field
 
+    @staticmethod
+    def __is_pre_validator(attr: Any) -> bool:
+        """check @markup_pre_validator decorated method"""
+        if getattr(attr, "__dict__", None) and (
+            pre_validator := attr.__dict__.get("__wrapped__")
+        ):
+            return isinstance(pre_validator, type) and issubclass(
+                pre_validator, markup_pre_validator
+            )
+        return False
+
+    @staticmethod
+    def __slots_namespace(bases, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """slotted schema class namespace: fields attributes are replaced
+        by `__slots__` instance layout"""
+        if "__slots__" in attrs:
+            return attrs
+        fields: Dict[str, None] = {}
+        for base in bases:
+            fields.update(dict.fromkeys(getattr(base, "__schema_fields__", None) or ()))
+        # own fields: `Sc[...]` annotations and `name: type = Field` attributes.
+        # Annotations are not resolved yet: other annotations without value
+        # are slotted too
+        for name in attrs.get("__annotations__", {}):
+            if name not in attrs or isinstance(attrs[name], BaseField):
+                fields[name] = None
+        inherited = {slot for base in bases for slot in _mro_slots(base)}
+        namespace = {k: v for k, v in attrs.items() if k not in fields}
+        namespace["__slots__"] = tuple(
+            name for name in (*fields, *_SCHEMA_SLOTS) if name not in inherited
+        )
+        return namespace
+
     def __new__(mcs, name, bases, attrs):
+        namespace = attrs
+        config = attrs.get("Config") or next(
+            (base.Config for base in bases if hasattr(base, "Config")), None
+        )
+        if getattr(config, "slots", False) and not getattr(config, "deferred", False):
+            # class is created once: `__init_subclass__` of bases is called once
+            namespace = mcs.__slots_namespace(bases, attrs)
+        cls_schema = super().__new__(mcs, name, bases, namespace)
+        if cls_schema.__name__ == "BaseSchema":
+            return cls_schema
+
+        config = cls_schema.Config
+        if config.retain not in RETAIN_POLICIES:
+            raise ValueError(
+                f"{cls_schema.__name__}: unknown retain policy {config.retain!r}, "
+                f"expected one of {RETAIN_POLICIES}"
+            )
+        if config.lazy and config.retain != RETAIN_ALL:
+            raise TypeError(
+                f"{cls_schema.__name__}: lazy mode requires `retain = {RETAIN_ALL!r}`"
+            )
+        if config.slots and config.lazy:
+            raise TypeError(
+                f"{cls_schema.__name__}: lazy mode is not supported with slots"
+            )
+        setattr(cls_schema, "__sc_projections__", {})
+        if config.deferred:
+            if config.slots:
+                raise TypeError(
+                    f"{cls_schema.__name__}: deferred mode is not supported with slots"
+                )
+            # annotations are resolved on first schema attributes access
+            for attr in _SCHEMA_DEFERRED:
+                setattr(cls_schema, attr, _DeferredAttr(attr, attrs))
+            return cls_schema
+        return cls_schema._sc_finalize(attrs)
+
+    def _sc_finalize(cls, attrs: Dict[str, Any]):
+        """resolve annotations, collect fields, compile fields methods chains
+        and pre-validators
+
+        Returns:
+            schema class
+        """
+        mcs = type(cls)
+        cls_schema = cls
+        config = cls_schema.Config  # type: ignore[attr-defined]
         # cache fields, annotations and used parsers for more simplify access
         __schema_fields__: Dict[str, BaseField] = {}  # type: ignore
         __schema_annotations__: Dict[str, Type] = {}  # type: ignore
         __schema_aliases__: Dict[str, str] = {}  # type: ignore
 
-        cls_schema = super().__new__(mcs, name, bases, attrs)
-        if cls_schema.__name__ == "BaseSchema":
-            return cls_schema
-
         # localns={} kwarg avoid TypeError 'function' object is not subscriptable
         for name, value in get_type_hints(
             cls_schema, localns={}, include_extras=True
@@ -547,6 +898,7 @@ class SchemaMeta(type):
                 "__schema_fields__",
                 "__schema_annotations__",
                 "__schema_aliases__",
+                "__schema_parse_order__",
             ):
                 continue  # pragma: no cover
             # Annotated[type, Field]
@@ -557,16 +909,76 @@ class SchemaMeta(type):
                     __schema_aliases__[name] = field.alias
                 __schema_annotations__[name] = field_type
             # attr_name: type = Field
-            elif mcs.__is_attribute_field(cls_schema, name):
-                field_type, field = mcs.__parse_attribute_field(cls_schema, name)
+            elif mcs.__is_attribute_field(attrs, name):
+                field_type, field = mcs.__parse_attribute_field(attrs, name)
                 __schema_fields__[name] = field
                 if field.alias:
                     __schema_aliases__[name] = field.alias
                 __schema_annotations__[name] = field_type
 
+        heads = []
+        for name, field in __schema_fields__.items():
+            if getattr(field, "__I_AM_NESTED_FIELD__", False):
+                field = field._bind_type(__schema_annotations__[name])  # type: ignore
+                __schema_fields__[name] = field
+            # compile fields methods chains once, not in every parse call
+            plan = field._compile()
+            field._freeze()
+            if isinstance(plan, FieldPlan) and plan.head is not None:
+                heads.append(plan.head)
+        # evaluate common queries prefixes once per document
+        share_common_prefixes(heads)
+
+        setattr(cls_schema, "__schema_query_heads__", tuple(heads))
         setattr(cls_schema, "__schema_fields__", __schema_fields__)
         setattr(cls_schema, "__schema_annotations__", __schema_annotations__)
         setattr(cls_schema, "__schema_aliases__", __schema_aliases__)
+        setattr(cls_schema, "__schema_slotted__", "_markup" in _mro_slots(cls_schema))
+        # precomputed instance layout
+        setattr(
+            cls_schema,
+            "__schema_output__",
+            tuple(
+                (name, __schema_aliases__.get(name, name))
+                for name in __schema_fields__
+                if not name.startswith("_")
+            ),
+        )
+        __schema_sc_params__ = {
+            k: v for k, v in attrs.items() if isinstance(v, sc_param)
+        }
+        setattr(cls_schema, "__schema_sc_params__", __schema_sc_params__)
+        setattr(
+            cls_schema,
+            "__schema_param_deps__",
+            _sc_param_deps(__schema_fields__, __schema_sc_params__),
+        )
+        __schema_pre_validators__ = tuple(
+            k
+            for k, v in attrs.items()
+            if not isinstance(v, (BaseField, sc_param)) and mcs.__is_pre_validator(v)
+        )
+        validators = tuple(
+            (k, attrs[k].__sc_validator__) for k in __schema_pre_validators__
+        )
+        setattr(cls_schema, "__schema_pre_validators__", __schema_pre_validators__)
+        setattr(cls_schema, "__schema_validators__", validators)
+        # patterns are checked before the document parse
+        patterns = tuple(v for _, v in validators if v.pattern)
+        setattr(cls_schema, "__schema_pattern_validators__", patterns)
+        setattr(
+            cls_schema,
+            "__schema_bytes_patterns__",
+            all(is_bytes_safe(v.pattern) for v in patterns),
+        )
+        if config.lazy:
+            for name in __schema_fields__:
+                setattr(cls_schema, name, _LazyField(name))
+        setattr(
+            cls_schema,
+            "__schema_parse_order__",
+            fields_order(__schema_fields__, config.fields_order),
+        )
         return cls_schema
 
 
@@ -576,16 +988,80 @@ class SchemaConfig:
     Attributes:
         selector_kwargs: default kwargs for parsel.Selector class
         type_caster: type_caster module
+        max_markup_size: max markup length (characters for str, bytes for bytes).
+            Larger documents are not parsed
+        max_nodes: max count of document elements. Larger documents are not parsed
+        max_nested_items: max count of items in list Nested fields
+        timeout: document parse time budget in seconds, checked between fields,
+            field methods steps and Nested items. Nested schemas share the parent budget
+        lazy: parse fields on first access instead of the schema creation.
+            `dict()` and `repr` parse all remaining fields. Fields errors are raised
+            on access, parse order and timeout are not applied
+        encoding: bytes markup encoding. Used, if document has not BOM.
+            If not set - detect from `<meta charset>` or use utf-8
+        slots: `__slots__` instance layout without `__dict__`: less memory
+            for many small objects. Effective, if parent schemas are slotted too.
+            Not compatible with lazy mode
+        retain: what is kept in the instance after parse.
+            `"all"` - document tree and markup,
+            `"raw"` - markup only, `__selector__` re-parses it on every access,
+            `"compressed"` - zlib compressed markup, decompressed on every
+            `__raw__` access and re-parsed on every `__selector__` access,
+            `"none"` - nothing, `__raw__` and `__selector__` raise
+            `MarkupNotRetainedError`.
+            Nested schemas inherit the policy, if it is not `"all"`.
+            Not compatible with lazy mode
+        fields_order: fields parse order. `"required_first"` - fields without
+            default value first, cheapest first by static estimate, then optional
+            fields. `"declared"` - declaration order. Sequence of fields names -
+            these fields first, then the rest in `"required_first"` order.
+            Fields values are always set in declaration order
+        deferred: resolve annotations, collect fields and compile
+            methods chains on the first schema use instead of the class creation.
+            Annotations may use names, defined after the schema.
+            Not compatible with slots
+
+    If a document exceeds a budget, parse stops: Nested field keeps already parsed
+    items, the remaining fields are set to their default values (None, if default
+    is not set). Unparsed fields names are stored in the `__sc_unparsed__`
+    attribute, the budget error - in `__sc_budget_error__`
     """
 
     selector_kwargs: Dict[str, Any] = {}  # default execute extra kwargs
     type_caster: Optional[TypeCaster] = TypeCaster()  # type_caster class
+    # resource budgets, None - unlimited
+    max_markup_size: Optional[int] = None
+    max_nodes: Optional[int] = None
+    max_nested_items: Optional[int] = None
+    timeout: Optional[float] = None
+    fields_order: Union[str, Sequence[str]] = REQUIRED_FIRST
+    lazy: bool = False
+    slots: bool = False
+    encoding: Optional[str] = None
+    retain: str = RETAIN_ALL
+    deferred: bool = False
 
 
 class BaseSchema(metaclass=SchemaMeta):
     __schema_fields__: Dict[str, BaseField]
     __schema_annotations__: Dict[str, Type]
     __schema_aliases__: Dict[str, str]
+    __schema_parse_order__: Tuple[str, ...]
+    __schema_output__: Tuple[Tuple[str, str], ...]
+    __schema_sc_params__: Dict[str, sc_param]
+    __schema_param_deps__: Dict[str, Tuple[str, ...]]
+    __schema_pre_validators__: Tuple[str, ...]
+    __schema_validators__: Tuple[Tuple[str, MarkupPreValidator], ...]
+    __schema_pattern_validators__: Tuple[MarkupPreValidator, ...]
+    __schema_bytes_patterns__: bool
+    __schema_query_heads__: Tuple[QueryChain, ...]
+    __schema_slotted__: bool
+    __sc_unparsed__: Tuple[str, ...] = ()
+    __sc_budget_error__: Optional[BudgetExceededError] = None
+    __sc_projection__: Optional[Projection] = None
+    __sc_param_cache__: Optional[Dict[str, Any]] = None
+    __sc_dict_cache__: Optional[Tuple[Tuple[Any, int], ...]] = None
+    __sc_dict_result__: Optional[Dict[bool, Dict[str, Any]]] = None
 
     """Main schema class
 
@@ -593,12 +1069,52 @@ class BaseSchema(metaclass=SchemaMeta):
         __schema_fields__: Dict[str, BaseField] access to fields object by key in current schema
         __schema_annotations__: Dict[str, Type] access to fields annotations in current schema
         __schema_aliases__: Dict[str, str] access to fields aliases in current schema
+        __schema_parse_order__: Tuple[str, ...] fields parse order
+        __schema_output__: Tuple[Tuple[str, str], ...] public fields names
+            and output keys (alias or name) in declaration order
+        __schema_sc_params__: Dict[str, sc_param] sc_param properties
+        __schema_param_deps__: Dict[str, Tuple[str, ...]] field or sc_param name -
+            sc_param names, which cached values depend on it
+        __schema_pre_validators__: Tuple[str, ...] pre-validators methods names
+        __schema_validators__: Tuple[Tuple[str, MarkupPreValidator], ...]
+            pre-validators methods names and compiled validators
+        __schema_pattern_validators__: Tuple[MarkupPreValidator, ...] validators
+            with regex pattern, checked before the document parse
+        __schema_bytes_patterns__: bool patterns can be searched in utf-8 bytes
+        __schema_query_heads__: Tuple[QueryChain, ...] fields first queries chains
+        __schema_slotted__: bool instances have `__slots__` layout
+        __sc_unparsed__: fields names, which are not parsed due to exceeded budget
+        __sc_budget_error__: exceeded resource budget error or None
+        __sc_projection__: fields projection, passed to constructor or None
+        __sc_param_cache__: computed sc_param values or None
+        __sc_dict_cache__: serializers values layout or None
+        __sc_dict_result__: `dict()` results of plain values layout by `by_alias`
+            flag or None
 
     """
 
+    # subclasses without `slots` config have instance `__dict__`
+    __slots__ = ()
+
     class Config(SchemaConfig):
         pass
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in self.__schema_fields__ or name in self.__schema_sc_params__:
+            self._sc_reset_caches(name)
+
+    def _sc_reset_caches(self, name: str) -> None:
+        """reset cached serializers layout, `dict()` results and dependent
+        sc_param values after field or sc_param reassign"""
+        object.__setattr__(self, "__sc_dict_cache__", None)
+        object.__setattr__(self, "__sc_dict_result__", None)
+        if (cache := self.__sc_param_cache__) and (
+            params := self.__schema_param_deps__.get(name)
+        ):
+            for param in params:
+                cache.pop(param, None)
+
     @property
     def __sc_params__(self) -> Dict[str, Any]:
         """Magic method for access all @sc_param decorated properties
@@ -607,104 +1123,537 @@ class BaseSchema(metaclass=SchemaMeta):
             dict with all @sc_param decorated properties
 
         """
-        return {
-            k: v for k, v in self.__class__.__dict__.items() if isinstance(v, sc_param)
-        }
+        return self.__schema_sc_params__
 
     @property
     def __selector__(self) -> Union[Selector, SelectorList]:
         """Get available cached Parsel.Selector or SelectorList object
 
+        If document tree is not retained (`SchemaConfig.retain`),
+        the retained markup is parsed again on every access
+
         Returns:
             Parsel SelectorType object
+
+        Raises:
+            MarkupNotRetainedError: markup is not retained
         """
-        return self._cached_parser
+        if (parser := self._cached_parser) is None:
+            kwargs = self.Config.selector_kwargs
+            kwargs = {k: v for k, v in kwargs.items() if k != "encoding"}
+            return Selector(self.__raw__, **kwargs)
+        return parser
 
-    def __init__(self, markup: Union[str, bytes, Selector, SelectorList]):
+    def __init__(
+        self,
+        markup: Union[str, bytes, Selector, SelectorList],
+        *,
+        include: Optional[Union[Set[str], Dict[str, Any]]] = None,
+        exclude: Optional[Union[Set[str], Dict[str, Any]]] = None,
+    ):
         """Create a new object by parsing fields from markup.
 
         Args:
             markup: string, bytes or parsel.Selector object
+            include: parse only these fields: set of names or dict
+                `{name: True or Nested schema projection}`.
+                sc_param properties are skipped, if not included
+            exclude: parse all fields, except these: set of names or dict
+                `{name: True or Nested schema projection}`
         Raises:
             TypeError: if markup is not string, bytes or Selector objects
+            ValueError: if projection contains unknown fields
         """
-        self._cached_parser: Union[Selector, SelectorList]
-        self._markup: str
+        self._sc_init(markup, None, self._sc_projection(include, exclude))
+
+    @classmethod
+    def _sc_projection(
+        cls,
+        include: Optional[Union[Set[str], Dict[str, Any]]],
+        exclude: Optional[Union[Set[str], Dict[str, Any]]],
+    ) -> Optional[Projection]:
+        if include is not None:
+            if exclude is not None:
+                raise TypeError("Pass `include` or `exclude` projection, not both")
+            return get_projection(cls, include, True)
+        elif exclude is not None:
+            return get_projection(cls, exclude, False)
+        return None
+
+    @classmethod
+    def parse_dict(
+        cls,
+        markup: Union[str, bytes, Selector, SelectorList],
+        *,
+        by_alias: bool = True,
+        include: Optional[Union[Set[str], Dict[str, Any]]] = None,
+        exclude: Optional[Union[Set[str], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Parse markup directly to dict, same as `Schema(markup).dict()`.
+
+        Fields values (also Nested) are written to dicts without schema
+        objects creation and the document tree is released after parse.
+        Schema object is created, if schema has sc_param properties in the
+        output or pre-validators: properties and validators methods are
+        called with the object
 
-        self.__init_markup(markup)
-        self.__pre_validate_markup()
-        self.__init_fields()
+        Args:
+            markup: string, bytes or parsel.Selector object
+            by_alias: bool set key by field alias. Default True
+            include: parse only these fields, see `__init__`
+            exclude: parse all fields, except these, see `__init__`
+        Returns:
+            dictionary with all public fields and sc_param properties
+        """
+        projection = cls._sc_projection(include, exclude)
+        return cls._sc_parse_output(markup, None, projection, _OUTPUT_DICT, by_alias)[0]
+
+    @classmethod
+    def parse_tuple(
+        cls,
+        markup: Union[str, bytes, Selector, SelectorList],
+        *,
+        include: Optional[Union[Set[str], Dict[str, Any]]] = None,
+        exclude: Optional[Union[Set[str], Dict[str, Any]]] = None,
+    ) -> Tuple[Any, ...]:
+        """Parse markup directly to tuple, same as `Schema(markup).to_tuple()`.
+
+        Fields values (also Nested) are written to tuples without schema
+        objects creation and the document tree is released after parse.
+        Schema object is created, if schema has sc_param properties in the
+        output or pre-validators: properties and validators methods are
+        called with the object
 
-    def __init_markup(self, markup: Union[str, bytes, Selector, SelectorList]):
-        if isinstance(markup, str):
-            self._markup = markup
-            self._cached_parser = Selector(markup, **self.Config.selector_kwargs)
-        elif isinstance(markup, bytes):
-            self._cached_parser = Selector(body=markup, **self.Config.selector_kwargs)
-            self._markup = markup.decode()
-        elif isinstance(markup, (Selector, SelectorList)):
-            self._markup = markup.get()  # type: ignore
-            self._cached_parser = markup
+        Args:
+            markup: string, bytes or parsel.Selector object
+            include: parse only these fields, see `__init__`
+            exclude: parse all fields, except these, see `__init__`
+        Returns:
+            tuple of values
+        """
+        projection = cls._sc_projection(include, exclude)
+        return cls._sc_parse_output(markup, None, projection, _OUTPUT_TUPLE)[0]
+
+    def _sc_init(
+        self,
+        markup: Union[str, bytes, Selector, SelectorList, SharedDocument],
+        deadline: Optional[float],
+        projection: Optional[Projection] = None,
+        retain: Optional[str] = None,
+        output: Optional[str] = None,
+        by_alias: bool = True,
+    ) -> Any:
+        """parse document with parent schema time budget, fields projection
+        and retention policy (used by Nested field).
+
+        If output is set, returns fields values as dict or tuple (`parse_dict`,
+        `parse_tuple`) instead of the instance attributes set
+        """
+        # None - document tree is not retained
+        self._cached_parser: Optional[Union[Selector, SelectorList]]
+        # original markup, `__raw__` string is created on first access.
+        # None - markup is not retained
+        self._markup: Union[str, bytes, Selector, SelectorList, CompressedMarkup, None]
+
+        if self.__schema_slotted__:
+            # first: read by `__setattr__`
+            self.__sc_param_cache__ = None
+            self.__sc_dict_cache__ = None
+            self.__sc_dict_result__ = None
+            self.__sc_unparsed__ = ()
+            self.__sc_budget_error__ = None
+            self.__sc_projection__ = projection
+        elif projection is not None:
+            self.__sc_projection__ = projection
+        ctx = self._sc_context(markup, deadline)
+        config = self.Config
+        retain = retain or config.retain
+        if retain != RETAIN_ALL:
+            ctx.retain = retain
+        # sc_param properties are computed from the instance attributes
+        values_output = None if self.__projected__()[0] else output
+        ctx.output = values_output
+        # pre-validators are checked before budgets: budgeted parse rejects
+        # the same documents as not budgeted
+        raw_validated = bool(self.__schema_pattern_validators__) and isinstance(
+            ctx.markup, (str, bytes)
+        )
+        if raw_validated:
+            # reject document by patterns before parse
+            markup = self.__pre_validate_raw(markup)  # type: ignore[arg-type]
+        if ctx.budget_error is not None:
+            # too large document is not parsed: css and xpath pre-validators
+            # are skipped, decorated methods get the empty document
+            if type(markup) is SharedDocument:
+                markup = markup.markup
+            elif isinstance(markup, bytes):
+                self._encoding, bom = detect_encoding(markup, config.encoding)
+                markup = markup[bom:] if bom else markup
+            self._markup = markup  # type: ignore[assignment]
+            self._cached_parser = Selector(text="<html></html>")
+            self.__pre_validate_markup(not raw_validated, queries=False)
+            return self.__init_output(ctx, retain, output, by_alias)
+        self._markup, encoding, self._cached_parser = self._sc_document(markup)
+        if encoding is not None:
+            self._encoding = encoding
+        self.__pre_validate_markup(not raw_validated)
+        if ctx.budget_error is None and config.max_nodes is not None:
+            ctx.budget_error = self._sc_nodes_budget(self._cached_parser)
+        return self.__init_output(ctx, retain, output, by_alias)
+
+    @classmethod
+    def _sc_context(
+        cls,
+        markup: Union[str, bytes, Selector, SelectorList, SharedDocument],
+        deadline: Optional[float],
+    ) -> ParseContext:
+        """create parse context: time and markup size budgets"""
+        ctx = ParseContext()
+        if isinstance(markup, SharedDocument):
+            # `parse_all`: queries prefixes results are shared between schemas
+            ctx.memo = markup.memo
+            markup = markup.markup
+        ctx.markup = markup
+        config = cls.Config
+        if config.timeout is not None:
+            own_deadline = time.monotonic() + config.timeout
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        ctx.deadline = deadline
+        ctx.max_nested_items = config.max_nested_items
+        if (
+            config.max_markup_size is not None
+            and isinstance(markup, (str, bytes))
+            and len(markup) > config.max_markup_size
+        ):
+            ctx.budget_error = BudgetExceededError(
+                "max_markup_size",
+                f"{cls.__schema_name__}: markup size {len(markup)} "
+                f"> {config.max_markup_size}",
+            )
+        return ctx
+
+    @classmethod
+    def _sc_parse_output(
+        cls,
+        markup: Union[str, bytes, Selector, SelectorList],
+        deadline: Optional[float],
+        projection: Optional[Projection],
+        output: str,
+        by_alias: bool = True,
+    ) -> Tuple[Any, Optional[BudgetExceededError]]:
+        """parse document to dict or tuple without schema object
+        (`parse_dict`, `parse_tuple` and their Nested fields).
+
+        Schema object is created, if sc_param properties are projected to
+        the output or schema has pre-validators: properties and decorated
+        methods are called with the object
+
+        Returns:
+            values and exceeded budget error or None
+        """
+        params = cls.__schema_sc_params__ if projection is None else projection.params
+        if params or cls.__schema_validators__:
+            schema = cls.__new__(cls)
+            result = schema._sc_init(
+                markup, deadline, projection, None, output, by_alias
+            )
+            return result, schema.__sc_budget_error__
+        ctx = cls._sc_context(markup, deadline)
+        ctx.output = output
+        config = cls.Config
+        selector = None
+        if ctx.budget_error is None:
+            _, _, selector = cls._sc_document(markup)
+            if config.max_nodes is not None:
+                ctx.budget_error = cls._sc_nodes_budget(selector)
+        values, _ = cls._sc_parse_values(cls, selector, ctx, projection)
+        fields_output = (
+            cls.__schema_output__ if projection is None else projection.output
+        )
+        return _output_values(values, fields_output, output, by_alias), ctx.budget_error
+
+    def __init_output(
+        self, ctx: ParseContext, retain: str, output: Optional[str], by_alias: bool
+    ) -> Any:
+        values = self.__init_fields(ctx)
+        if values is not None:
+            return _output_values(values, self.__projected__()[1], output, by_alias)
+        elif output == _OUTPUT_TUPLE:
+            return self.to_tuple()
+        elif output == _OUTPUT_DICT:
+            return self.dict(by_alias=by_alias)
+        self.__apply_retention(retain)
+        return None
+
+    def __apply_retention(self, retain: str) -> None:
+        """release document tree and markup after parse"""
+        if retain == RETAIN_ALL or self.Config.lazy:
+            # lazy fields are parsed from the document tree
+            return
+        if retain == RETAIN_NONE:
+            self._markup = None
         else:
-            raise TypeError(
-                f"Markup support only str, bytes or Selector types, not {type(markup).__name__}"
+            markup = self._markup
+            if isinstance(markup, (Selector, SelectorList)):
+                # serialize markup before the document tree release
+                markup = self.__raw__
+            if retain == RETAIN_COMPRESSED and isinstance(markup, (str, bytes)):
+                encoding = self._encoding if isinstance(markup, bytes) else "utf-8"
+                self._markup = CompressedMarkup(markup, encoding)
+        self._cached_parser = None
+
+    @classmethod
+    def _sc_nodes_budget(
+        cls, selector: Union[Selector, SelectorList]
+    ) -> Optional[BudgetExceededError]:
+        """check `max_nodes` budget of the document tree"""
+        if isinstance(selector, Selector) and selector.type in ("html", "xml"):
+            count = int(selector.root.xpath("count(//*)"))
+            if count > cls.Config.max_nodes:  # type: ignore[operator]
+                return BudgetExceededError(
+                    "max_nodes",
+                    f"{cls.__schema_name__}: document nodes {count} "
+                    f"> {cls.Config.max_nodes}",
+                )
+        return None
+
+    @classmethod
+    def _sc_document(
+        cls, markup: Union[str, bytes, Selector, SelectorList, SharedDocument]
+    ) -> Tuple[
+        Union[str, bytes, Selector, SelectorList],
+        Optional[str],
+        Union[Selector, SelectorList],
+    ]:
+        """parse markup to the document tree
+
+        Returns:
+            markup to retain, utf-8 encoding of not decoded bytes markup
+            (else None) and document tree
+        """
+        if isinstance(markup, SharedDocument):
+            return markup.markup, None, markup.selector
+        elif isinstance(markup, str):
+            return markup, None, Selector(markup, **cls.Config.selector_kwargs)
+        elif isinstance(markup, bytes):
+            kwargs = cls.Config.selector_kwargs
+            encoding, bom = detect_encoding(
+                markup, cls.Config.encoding or kwargs.get("encoding")
             )
+            if bom:
+                markup = markup[bom:]
+            if encoding == "utf-8":
+                # lxml decodes utf-8 itself, `__raw__` is decoded on demand
+                kwargs = {**kwargs, "encoding": encoding}
+                return markup, encoding, Selector(body=markup, **kwargs)
+            # parsel decodes other encodings before parse: decode once
+            # and share string with `__raw__`
+            text = markup.decode(encoding, errors="replace")
+            kwargs = {k: v for k, v in kwargs.items() if k != "encoding"}
+            return text, None, Selector(text, **kwargs)
+        elif isinstance(markup, (Selector, SelectorList)):
+            # serialized on `__raw__` access only
+            return markup, None, markup
+        raise TypeError(
+            f"Markup support only str, bytes or Selector types, not {type(markup).__name__}"
+        )
 
-    def __pre_validate_markup(self):
-        # find @markup_pre_validator decorated methods and validate
-        for k, v in self.__class__.__dict__.items():
-            if isinstance(v, BaseField) or isinstance(v, sc_param):
-                continue
-            if getattr(v, "__dict__", None) and (
-                pre_validator := v.__dict__.get("__wrapped__")
-            ):
-                if issubclass(pre_validator, markup_pre_validator):
-                    if not getattr(self, k)():
-                        msg = f"Validation error in {self.__schema_name__}.{k} method"
-                        raise SchemaPreValidationError(msg)
+    def __pre_validate_raw(
+        self, markup: Union[str, bytes, SharedDocument]
+    ) -> Union[str, bytes, SharedDocument]:
+        """check pre-validators patterns in the markup string or bytes
 
-    def __init_fields(self) -> None:
+        Returns:
+            markup for parse: bytes are decoded once, if patterns
+            cannot be searched in utf-8 bytes
+        """
+        text: Union[str, bytes]
+        if isinstance(markup, SharedDocument):
+            # called only for the shared string markup
+            text = markup.markup  # type: ignore[assignment]
+        elif isinstance(markup, bytes):
+            kwargs = self.Config.selector_kwargs
+            encoding, bom = detect_encoding(
+                markup, self.Config.encoding or kwargs.get("encoding")
+            )
+            if encoding != "utf-8" or not self.__schema_bytes_patterns__:
+                markup = markup[bom:].decode(encoding, errors="replace")
+            text = markup
+        else:
+            text = markup
+        for validator in self.__schema_pattern_validators__:
+            validator.validate_pattern(self, text)
+        return markup
+
+    def __pre_validate_markup(self, check_patterns: bool = True, queries: bool = True):
+        # @markup_pre_validator decorated methods, collected by SchemaMeta
+        for k, validator in self.__schema_validators__:
+            if check_patterns:
+                validator.validate_pattern(self, self.__raw__)
+            if not validator.validate_document(self, queries):
+                msg = f"Validation error in {self.__schema_name__}.{k} method"
+                raise SchemaPreValidationError(msg)
+
+    def __init_fields(self, ctx: ParseContext) -> Optional[Dict[str, Any]]:
         """Parse fields entrypoint.
 
         Automatically called in the `__init__` constructor
+
+        Returns:
+            fields values, if `ctx.output` is set, else None
         """
-        _logger.info(
-            "[%s] Start parse fields count: %s",
-            self.__schema_name__,
-            len(self.__schema_fields__.keys()),
+        if self.Config.lazy and ctx.budget_error is None and ctx.output is None:
+            # fields are parsed on first access by _LazyField descriptors
+            ctx.deadline = None
+            self._sc_ctx = ctx
+            return None
+        projection = self.__sc_projection__
+        values, unparsed = self._sc_parse_values(
+            self, self.__selector__, ctx, projection
         )
-        for name, field in self.__schema_fields__.items():
-            field_type = self.__schema_annotations__[name]
-            _logger.debug("Start parse attribute: `%s.%s`", self.__schema_name__, name)
-            if getattr(field, "__I_AM_NESTED_FIELD__", False):
-                field.type_ = field_type  # type: ignore
-            value = field.sc_parse(self.__selector__)
-            if self.Config.type_caster and field.auto_type and not field.is_default:
-                value = self.Config.type_caster.cast(field_type, value)
-            if not field._is_success and not field.is_default:
-                _logger.error("Parse error in %s.%s field", self.__schema_name__, name)
-
-            # disable default value flag
-            if field.is_default:
-                _logger.error(
-                    "`%s.%s` failed parse in %r method, set default value",
-                    self.__schema_name__,
-                    name,
-                    field._last_failed_method,
-                )  # type: ignore
-                field.is_default = False
-
-            _logger.info("%s.%s = %s", self.__schema_name__, name, value)
-            setattr(self, name, value)
+        if unparsed:
+            self.__sc_unparsed__ = unparsed
+        if ctx.budget_error is not None:
+            self.__sc_budget_error__ = ctx.budget_error
+        if ctx.output is not None:
+            return values
+        # set values in declaration order, independent of the parse order.
+        # caches are empty: skip `__setattr__` caches reset
+        set_value = object.__setattr__
+        fields_names = (
+            self.__schema_fields__ if projection is None else projection.fields
+        )
+        for name in fields_names:
+            set_value(self, name, values[name])
+        return None
+
+    @classmethod
+    def _sc_parse_values(
+        cls,
+        schema: Union["BaseSchema", Type["BaseSchema"]],
+        selector: Optional[Union[Selector, SelectorList]],
+        ctx: ParseContext,
+        projection: Optional[Projection],
+    ) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """parse projected fields in parse order
+
+        Args:
+            schema: schema object or schema class, if parsed without object
+            selector: document tree. None - if budget is exceeded before parse
+
+        Returns:
+            values by fields names and unparsed due to exceeded budget fields names
+        """
+        deadline = ctx.deadline
+        fields = cls.__schema_fields__
+        order = cls.__schema_parse_order__ if projection is None else projection.order
+        values: Dict[str, Any] = {}
+        unparsed: Tuple[str, ...] = ()
+        for name in order:
+            field = fields[name]
+            if ctx.budget_error is None and deadline is not None:
+                if time.monotonic() > deadline:
+                    ctx.budget_error = BudgetExceededError(
+                        "timeout",
+                        f"{cls.__schema_name__}: parse deadline exceeded "
+                        f"before `{name}` field",
+                    )
+            if ctx.budget_error is not None:
+                # mark field as unparsed due to exceeded budget
+                unparsed += (name,)
+                values[name] = None if field.default is Ellipsis else field.default
+                continue
+            try:
+                values[name] = cls._sc_field_value(
+                    schema, selector, name, field, ctx, projection
+                )
+            except BudgetExceededError as e:
+                # deadline is exceeded between the field methods steps
+                ctx.budget_error = e
+                unparsed += (name,)
+                values[name] = None if field.default is Ellipsis else field.default
+        return values, unparsed
+
+    def _sc_parse_field(self, name: str, field: BaseField, ctx: ParseContext) -> Any:
+        """parse and cast field value, emit hooks events"""
+        return self._sc_field_value(
+            self, self.__selector__, name, field, ctx, self.__sc_projection__
+        )
+
+    @classmethod
+    def _sc_field_value(
+        cls,
+        schema: Union["BaseSchema", Type["BaseSchema"]],
+        selector: Any,
+        name: str,
+        field: BaseField,
+        ctx: ParseContext,
+        projection: Optional[Projection],
+    ) -> Any:
+        """parse and cast field value, emit hooks events"""
+        if HOOKS.on_field_start:
+            for hook in HOOKS.on_field_start:
+                hook(schema, name, field)
+        if projection is not None:
+            # Nested field schema projection
+            ctx.projection = projection.children.get(name)
+        try:
+            value = field.sc_parse(selector, ctx)
+        except BudgetExceededError:
+            raise
+        except Exception as e:
+            if HOOKS.on_error:
+                for hook in HOOKS.on_error:
+                    hook(schema, name, e, ctx)
+            raise
+        config = cls.Config
+        if config.type_caster and field.auto_type and not ctx.is_default:
+            field_type = cls.__schema_annotations__[name]
+            result = config.type_caster.cast(field_type, value)
+            if HOOKS.on_cast:
+                for hook in HOOKS.on_cast:
+                    hook(schema, name, field_type, value, result)
+            value = result
+        if HOOKS.on_field_end:
+            for hook in HOOKS.on_field_end:
+                hook(schema, name, value, ctx)
+        return value
 
     @property
     def __raw__(self) -> str:
-        """Get raw string markdown value
+        """Get raw string markdown value.
+
+        Bytes markup is decoded and Selector markup is serialized on first access.
+        Compressed markup (`SchemaConfig.retain`) is decompressed on every access
 
         Returns:
             markup string object
+
+        Raises:
+            MarkupNotRetainedError: markup is not retained
         """
-        return self._markup
+        markup = self._markup
+        if type(markup) is str:
+            return markup
+        if markup is None:
+            raise MarkupNotRetainedError(
+                f"{self.__schema_name__}: markup is not retained "
+                f"(Config.retain = {RETAIN_NONE!r})"
+            )
+        if isinstance(markup, CompressedMarkup):
+            return markup.decompress()
+        raw: str
+        if isinstance(markup, bytes):
+            raw = markup.decode(self._encoding, errors="replace")
+        elif isinstance(markup, SelectorList):
+            raw = markup.get(default="")
+        elif isinstance(markup, Selector):
+            raw = markup.get()
+        else:
+            # str subclass
+            raw = markup
+        self._markup = raw
+        return raw
 
     @staticmethod
     def _to_dict(
@@ -713,12 +1662,22 @@ class BaseSchema(metaclass=SchemaMeta):
         """convert BaseSchema objects to build-in python objects like dict, list"""
         if isinstance(value, BaseSchema):
             return value.dict()
-
-        elif isinstance(value, list):
-            if all(isinstance(val, BaseSchema) for val in value):  # pragma: no cover
-                return [val.dict() for val in value]
+        elif isinstance(value, list) and _is_schemas(value):
+            return [val.dict() for val in value]
         return value
 
+    def __layout__(self) -> Tuple[Tuple[Any, int], ...]:
+        """(value, kind) pairs of projected sc_param and public fields values
+        in the `dict()` order. Cached until a field is reassigned"""
+        if (layout := self.__sc_dict_cache__) is None:
+            params, output = self.__projected__()
+            # public fields (lazy fields are parsed here)
+            layout = tuple(_layout_item(getattr(self, k)) for k in params) + tuple(
+                _layout_item(getattr(self, name)) for name, _ in output
+            )
+            object.__setattr__(self, "__sc_dict_cache__", layout)
+        return layout
+
     def dict(self, *, by_alias: bool = True) -> Dict[str, Any]:
         """Convert schema object to python dict. if field have alias key - set alias key
         Args:
@@ -726,31 +1685,132 @@ class BaseSchema(metaclass=SchemaMeta):
         Returns:
             dictionary with all public fields and sc_param properties
         """
-        result: Dict[str, Any] = {  # type: ignore
-            self.__schema_aliases__.get(k, k): self._to_dict(getattr(self, k))
-            for k, v in self.__sc_params__.items()
-        }
-        # parse public field keys
-        for k, v in self.__dict__.items():
-            if not k.startswith("_") and self.__schema_fields__.get(k):
-                k = self.__schema_aliases__.get(k, k) if by_alias else k
-                result[k] = self._to_dict(v)
+        # result of schema with plain values only is cached until a field
+        # is reassigned, and a copy is returned. Values are not copied
+        result: Dict[str, Any] = {}
+        # nested schemas are converted without recursion, by alias keys
+        stack: List[Tuple[BaseSchema, Dict[str, Any], bool]] = [
+            (self, result, by_alias)
+        ]
+        child: Dict[str, Any]
+        children: List[Dict[str, Any]]
+        while stack:
+            schema, out, alias = stack.pop()
+            if (cache := schema.__sc_dict_result__) is not None and alias in cache:
+                out.update(cache[alias])
+                continue
+            params, output = schema.__projected__()
+            keys = chain(
+                params, (key for _, key in output) if alias else (n for n, _ in output)
+            )
+            plain = True
+            for key, (value, kind) in zip(keys, schema.__layout__()):
+                if kind == _VALUE:
+                    out[key] = value
+                    continue
+                plain = False
+                if kind == _SCHEMA:
+                    out[key] = child = {}
+                    stack.append((value, child, True))
+                elif _is_schemas(value):
+                    out[key] = children = []
+                    for item in value:
+                        children.append(child := {})
+                        stack.append((item, child, True))
+                else:
+                    out[key] = value
+            if plain:
+                if cache is None:
+                    cache = {}
+                    object.__setattr__(schema, "__sc_dict_result__", cache)
+                cache[alias] = out.copy()
         return result
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """Convert schema object to tuple: public fields values in declaration order,
+        then sc_param properties values. Nested schemas are converted to tuples
+
+        Returns:
+            tuple of values
+        """
+        result: List[Any] = []
+        # nested schemas are converted without recursion: values are collected
+        # to lists, which are replaced by tuples after all
+        stack: List[Tuple[BaseSchema, List[Any]]] = [(self, result)]
+        replaces: List[Tuple[List[Any], int, List[Any]]] = []
+        while stack:
+            schema, out = stack.pop()
+            layout = schema.__layout__()
+            count = len(schema.__projected__()[0])
+            for value, kind in chain(layout[count:], layout[:count]):
+                if kind == _SCHEMA:
+                    container, values = out, (value,)
+                elif kind == _LIST and _is_schemas(value):
+                    container, values = [], value
+                    out.append(container)
+                else:
+                    out.append(value)
+                    continue
+                for item in values:
+                    child: List[Any] = []
+                    replaces.append((container, len(container), child))
+                    container.append(child)
+                    stack.append((item, child))
+        # nested lists are replaced before their parents
+        for container, i, child in reversed(replaces):
+            container[i] = tuple(child)
+        return tuple(result)
+
+    def to_json(
+        self,
+        *,
+        by_alias: bool = True,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        """Serialize `dict()` output to JSON string. orjson is used, if installed
+
+        Args:
+            by_alias: bool set key by field alias. Default True
+            default: function, which converts not serializable values
+        Returns:
+            JSON string
+        """
+        return dumps(self.dict(by_alias=by_alias), default)
+
+    def to_json_bytes(
+        self,
+        *,
+        by_alias: bool = True,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> bytes:
+        """Serialize `dict()` output to utf-8 JSON bytes. orjson is used, if installed
+
+        Args:
+            by_alias: bool set key by field alias. Default True
+            default: function, which converts not serializable values
+        Returns:
+            JSON bytes
+        """
+        return dumps_bytes(self.dict(by_alias=by_alias), default)
+
+    def __projected__(
+        self,
+    ) -> Tuple[Collection[str], Tuple[Tuple[str, str], ...]]:
+        """sc_param names and public fields (name, output key) pairs,
+        which are projected to the output"""
+        if (projection := self.__sc_projection__) is None:
+            return self.__schema_sc_params__, self.__schema_output__
+        return projection.params, projection.output
+
     def __repr__(self):
         return f'{self.__schema_name__}({", ".join(self.__repr_args__())})'
 
     def __repr_args__(self) -> List[str]:
-        args: Dict[str, Any] = {  # type: ignore
-            k: getattr(self, k) for k, v in self.__sc_params__.items()
-        }
+        params, output = self.__projected__()
+        args: Dict[str, Any] = {k: getattr(self, k) for k in params}  # type: ignore
         # parse public field keys
-        for k, v in self.__dict__.items():
-            if not k.startswith("_") and self.__schema_fields__.get(k):  # type: ignore
-                if alias := self.__schema_aliases__.get(k):  # type: ignore
-                    args[f"{alias}({k})"] = v
-                else:
-                    args[k] = v
+        for name, key in output:
+            args[name if key == name else f"{key}({name})"] = getattr(self, name)
 
         return [
             f"{k}={repr(v)}"
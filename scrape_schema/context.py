@@ -0,0 +1,101 @@
+"""Per-parse state containers"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
+
+from parsel import Selector, SelectorList
+
+if TYPE_CHECKING:
+    from scrape_schema._projection import Projection
+    from scrape_schema.exceptions import BudgetExceededError
+    from scrape_schema.special_methods import MarkupMethod
+
+__all__ = ["ParseContext", "SharedDocument"]
+
+
+class ParseContext:
+    """Mutable state of one parse call.
+
+    Fields objects are shared between all parses of the schema class,
+    so all runtime flags are stored here, not in fields.
+
+    Attributes:
+        is_success: False if last parsed field throw an exception
+        is_default: True if last parsed field value replaced by default value
+        failed_method: method, which throw exception in last parsed field
+        error_type: exception class of last parsed field failure.
+            None, if failure detected by guarded plan without exception
+        memo: results of common queries prefixes, shared between fields
+            of one document
+        deadline: `time.monotonic()` value, after which parse is stopped.
+            None, if document has no time budget
+        max_nested_items: max count of items in Nested fields. None - unlimited
+        budget_error: exceeded budget error. Parse of the remaining fields
+            is stopped, if set
+        projection: fields projection of the current Nested field schema.
+            None - all fields
+        retain: markup retention policy of Nested schemas, inherited from
+            the parent schema. None - Nested schemas use own config
+        output: Nested schemas output: `"dict"` or `"tuple"` - parse values
+            to dicts or tuples without schema objects. None - schema objects
+        markup: input markup of the parsed document, before decode and parse
+    """
+
+    __slots__ = (
+        "is_success",
+        "is_default",
+        "failed_method",
+        "error_type",
+        "memo",
+        "deadline",
+        "max_nested_items",
+        "budget_error",
+        "projection",
+        "retain",
+        "output",
+        "markup",
+    )
+
+    def __init__(self):
+        self.is_success: bool = True
+        self.is_default: bool = False
+        self.failed_method: Optional["MarkupMethod"] = None
+        self.error_type: Optional[Type[BaseException]] = None
+        self.memo: Dict[Any, Any] = {}
+        self.deadline: Optional[float] = None
+        self.max_nested_items: Optional[int] = None
+        self.budget_error: Optional["BudgetExceededError"] = None
+        self.projection: Optional["Projection"] = None
+        self.retain: Optional[str] = None
+        self.output: Optional[str] = None
+        self.markup: Union[str, bytes, Selector, SelectorList, None] = None
+
+    def reset_field_state(self) -> None:
+        """reset flags before parse next field"""
+        self.is_success = True
+        self.is_default = False
+        self.failed_method = None
+        self.error_type = None
+
+
+class SharedDocument:
+    """Document, parsed once and shared by several schemas (`parse_all`)
+
+    Attributes:
+        selector: document tree
+        markup: decoded markup string or Selector, if document created from Selector
+        memo: common queries prefixes results, shared by all schemas
+    """
+
+    __slots__ = ("selector", "markup", "memo")
+
+    def __init__(
+        self,
+        selector: Union[Selector, SelectorList],
+        markup: Union[str, Selector, SelectorList],
+    ):
+        self.selector = selector
+        self.markup = markup
+        self.memo: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        """markup size for `max_markup_size` budget"""
+        return len(self.markup) if isinstance(self.markup, str) else 0
@@ -0,0 +1,198 @@
+"""Bounded failure diagnostics.
+
+`DiagnosticsHook` records fields failures as compact `FailureRecord` objects
+(schema, field, failed method, exception type and document fingerprint)
+instead of writing full markup to the log.
+
+Markup samples are written to an on-disk ring buffer only:
+
+- once per distinct failure signature (schema, field, method, exception type)
+- not more than `samples_per_minute` samples
+- every sample is truncated to `max_sample_size` bytes
+- not more than `max_samples` files: the oldest sample is overwritten
+
+Documents are fingerprinted by the input markup (`ParseContext.markup`), so
+markup is not decoded or serialized again. Hook state is guarded by a lock:
+one hook is shared by threads and `parse_all` parses.
+
+Example:
+
+    from scrape_schema.diagnostics import DiagnosticsHook
+    from scrape_schema.hooks import register_hook
+
+    diagnostics = register_hook(DiagnosticsHook("/tmp/scrape_schema_samples"))
+    ...
+    for record in diagnostics.records:
+        print(record)
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, NamedTuple, Optional, Tuple, Union
+
+from scrape_schema.hooks import BaseHook
+
+if TYPE_CHECKING:
+    from scrape_schema.base import BaseSchema
+    from scrape_schema.context import ParseContext
+
+__all__ = ["FailureRecord", "DiagnosticsHook"]
+
+# parse context memo key for cached document fingerprint
+_FINGERPRINT_KEY = "__sc_fingerprint__"
+
+
+class FailureRecord(NamedTuple):
+    """Compact field failure record
+
+    Attributes:
+        schema: schema class name
+        field: field name
+        method: failed method repr or None
+        exception: exception class name.
+            None, if failure detected by guarded plan without exception
+        fingerprint: document fingerprint (short blake2b hash of raw markup)
+        is_default: True, if field returned default value
+    """
+
+    schema: str
+    field: str
+    method: Optional[str]
+    exception: Optional[str]
+    fingerprint: str
+    is_default: bool
+
+    @property
+    def signature(self) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """failure signature: same failures of different documents are equal"""
+        return self.schema, self.field, self.method, self.exception
+
+
+def fingerprint(markup: Union[str, bytes]) -> str:
+    """document fingerprint: short hash of raw markup"""
+    if isinstance(markup, str):
+        markup = markup.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(markup, digest_size=8).hexdigest()
+
+
+def _markup(ctx: "ParseContext") -> Union[str, bytes]:
+    """input markup of the document. Selector markup is serialized"""
+    markup = ctx.markup
+    if isinstance(markup, (str, bytes)):
+        return markup
+    return "" if markup is None else markup.get() or ""
+
+
+class DiagnosticsHook(BaseHook):
+    """Record fields failures and sample markup of new failures to disk
+
+    Attributes:
+        records: last failures records
+        counts: failures count by signature
+    """
+
+    def __init__(
+        self,
+        samples_dir: Optional[Union[str, Path]] = None,
+        *,
+        max_records: int = 1000,
+        max_signatures: int = 4096,
+        max_samples: int = 32,
+        max_sample_size: int = 256 * 1024,
+        samples_per_minute: int = 6,
+    ):
+        """
+        Args:
+            samples_dir: markup samples directory. If None - samples are not written
+            max_records: max count of stored records
+            max_signatures: max count of tracked failure signatures
+            max_samples: max count of markup samples files in ring buffer
+            max_sample_size: max sample file size in bytes
+            samples_per_minute: max count of written samples per minute
+        """
+        self.samples_dir = Path(samples_dir) if samples_dir is not None else None
+        self.max_signatures = max_signatures
+        self.max_samples = max_samples
+        self.max_sample_size = max_sample_size
+        self.samples_per_minute = samples_per_minute
+        self.records: Deque[FailureRecord] = deque(maxlen=max_records)
+        self.counts: Counter = Counter()
+        self._sampled: "OrderedDict[Tuple, None]" = OrderedDict()
+        self._sample_times: Deque[float] = deque()
+        self._next_slot = 0
+        self._lock = threading.Lock()
+
+    def on_field_end(
+        self, schema: "BaseSchema", name: str, value: Any, ctx: "ParseContext"
+    ):
+        if not ctx.is_success:
+            self.record(schema, name, ctx)
+
+    def on_error(
+        self, schema: "BaseSchema", name: str, error: Exception, ctx: "ParseContext"
+    ):
+        if ctx.error_type is None:
+            ctx.error_type = type(error)
+        self.record(schema, name, ctx)
+
+    def record(
+        self, schema: "BaseSchema", name: str, ctx: "ParseContext"
+    ) -> FailureRecord:
+        """create failure record and write markup sample, if required"""
+        if (fp := ctx.memo.get(_FINGERPRINT_KEY)) is None:
+            fp = ctx.memo[_FINGERPRINT_KEY] = fingerprint(_markup(ctx))
+        record = FailureRecord(
+            schema=schema.__schema_name__,
+            field=name,
+            method=None if ctx.failed_method is None else repr(ctx.failed_method),
+            exception=None if ctx.error_type is None else ctx.error_type.__name__,
+            fingerprint=fp,
+            is_default=ctx.is_default,
+        )
+        signature = record.signature
+        with self._lock:
+            self.records.append(record)
+            if signature in self.counts or len(self.counts) < self.max_signatures:
+                self.counts[signature] += 1
+            slot = None
+            if self.samples_dir is not None and self._is_sample_required(signature):
+                slot = self._next_slot
+                self._next_slot = (slot + 1) % self.max_samples
+        if slot is not None:
+            self._write_sample(slot, record, _markup(ctx))
+        return record
+
+    def _is_sample_required(self, signature: Tuple) -> bool:
+        """check signature is new and rate limit. Called under lock"""
+        if signature in self._sampled:
+            self._sampled.move_to_end(signature)
+            return False
+        now = time.monotonic()
+        while self._sample_times and now - self._sample_times[0] > 60:
+            self._sample_times.popleft()
+        if len(self._sample_times) >= self.samples_per_minute:
+            return False
+        self._sample_times.append(now)
+        self._sampled[signature] = None
+        if len(self._sampled) > self.max_signatures:
+            self._sampled.popitem(last=False)
+        return True
+
+    def _write_sample(
+        self, slot: int, record: FailureRecord, markup: Union[str, bytes]
+    ) -> None:
+        """write markup sample to the ring buffer slot"""
+        if isinstance(markup, str):
+            markup = markup.encode("utf-8", "surrogatepass")
+        self.samples_dir.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+        path = self.samples_dir / f"sample_{slot:04d}"  # type: ignore[operator]
+        path.with_suffix(".html").write_bytes(markup[: self.max_sample_size])
+        path.with_suffix(".json").write_text(
+            json.dumps(
+                {**record._asdict(), "size": len(markup)},
+                ensure_ascii=False,
+            )
+        )
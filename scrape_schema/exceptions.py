@@ -4,3 +4,20 @@ class ScrapeSchemaError(Exception):
 
 class SchemaPreValidationError(ScrapeSchemaError):
     pass
+
+
+class BudgetExceededError(ScrapeSchemaError):
+    """document exceeded `SchemaConfig` resource budget
+
+    Attributes:
+        budget: exceeded budget name: `max_markup_size`, `max_nodes`,
+            `max_nested_items` or `timeout`
+    """
+
+    def __init__(self, budget: str, msg: str):
+        super().__init__(msg)
+        self.budget = budget
+
+
+class MarkupNotRetainedError(ScrapeSchemaError):
+    """markup or document tree is not kept by `SchemaConfig.retain` policy"""
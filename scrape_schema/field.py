@@ -18,6 +18,7 @@ from scrape_schema._logger import _logger
 from scrape_schema._protocols import AttribProtocol, SpecialMethodsProtocol
 from scrape_schema._typing import Self
 from scrape_schema.base import Field
+from scrape_schema.context import ParseContext
 from scrape_schema.special_methods import SpecialMethods
 
 if TYPE_CHECKING:
@@ -307,8 +308,8 @@ class Callback(Field):
         super().__init__(auto_type=auto_type, default=default, alias=alias)
         self.callback = callback
 
-    def sc_parse(self, _) -> Any:
-        return self._call_stack_methods(self.callback())
+    def sc_parse(self, _, ctx: Optional[ParseContext] = None) -> Any:
+        return self._call_stack_methods(self.callback(), ctx or ParseContext())
 
 
 class RawDLField(Field):
@@ -0,0 +1,271 @@
+"""Parse instrumentation hooks.
+
+Hooks receive structured events of the parse process: field start, every method
+call (step), field end, type cast, fallback to default value and field error.
+
+Schemas and fields check registered hooks lists before every event,
+so if no hooks are registered, instrumentation costs nothing: markup is not
+serialized, log messages are not formatted and loggers are not called.
+
+Example:
+
+    from scrape_schema.hooks import BaseHook, register_hook
+
+    class DefaultsCounter(BaseHook):
+        def __init__(self):
+            self.count = 0
+
+        def on_default(self, field, method, error, default):
+            self.count += 1
+
+    counter = register_hook(DefaultsCounter())
+"""
+import logging
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, TypeVar
+
+if TYPE_CHECKING:
+    from scrape_schema.base import BaseField, BaseSchema
+    from scrape_schema.context import ParseContext
+    from scrape_schema.special_methods import MarkupMethod
+
+__all__ = [
+    "BaseHook",
+    "LoggingHook",
+    "LoggingStepsHook",
+    "register_hook",
+    "unregister_hook",
+    "enable_logging",
+]
+
+_EVENTS = (
+    "on_field_start",
+    "on_step",
+    "on_field_end",
+    "on_cast",
+    "on_default",
+    "on_error",
+)
+HookT = TypeVar("HookT", bound="BaseHook")
+
+
+class BaseHook:
+    """Base hook class. Override required events methods.
+
+    Only overridden methods are called. `schema` argument is the schema class,
+    if values are parsed without schema object (`parse_dict`, `parse_tuple`)
+    """
+
+    def on_field_start(self, schema: "BaseSchema", name: str, field: "BaseField"):
+        """schema starts parse field"""
+
+    def on_step(self, field: "BaseField", method: "MarkupMethod", value: Any):
+        """field method called. `value` - method result
+
+        If any hook overrides this method, fields methods chains are executed
+        step-by-step without compiled plans
+        """
+
+    def on_field_end(
+        self, schema: "BaseSchema", name: str, value: Any, ctx: "ParseContext"
+    ):
+        """schema finished parse field. `value` - final field value"""
+
+    def on_cast(
+        self, schema: "BaseSchema", name: str, type_: Type, value: Any, result: Any
+    ):
+        """field value casted to annotation type"""
+
+    def on_default(
+        self,
+        field: "BaseField",
+        method: Optional["MarkupMethod"],
+        error: Optional[Exception],
+        default: Any,
+    ):
+        """field failed parse and returned default value.
+
+        `error` is None, if guarded plan detected failure without exception
+        """
+
+    def on_error(
+        self, schema: "BaseSchema", name: str, error: Exception, ctx: "ParseContext"
+    ):
+        """field without default value failed parse, `error` will be raised"""
+
+
+class _Hooks:
+    """registered hooks events storage"""
+
+    __slots__ = ("hooks",) + _EVENTS
+
+    # bound methods of hooks, which override the event
+    on_field_start: List[Callable[..., Any]]
+    on_step: List[Callable[..., Any]]
+    on_field_end: List[Callable[..., Any]]
+    on_cast: List[Callable[..., Any]]
+    on_default: List[Callable[..., Any]]
+    on_error: List[Callable[..., Any]]
+
+    def __init__(self):
+        self.hooks: List[BaseHook] = []
+        self._update()
+
+    def _update(self) -> None:
+        for event in _EVENTS:
+            setattr(
+                self,
+                event,
+                [
+                    getattr(hook, event)
+                    for hook in self.hooks
+                    if getattr(type(hook), event) is not getattr(BaseHook, event)
+                ],
+            )
+
+    def register(self, hook: BaseHook) -> None:
+        self.hooks.append(hook)
+        self._update()
+
+    def unregister(self, hook: BaseHook) -> None:
+        self.hooks.remove(hook)
+        self._update()
+
+
+HOOKS = _Hooks()
+
+
+def register_hook(hook: HookT) -> HookT:
+    """register hook for all schemas and fields
+
+    Returns:
+        passed hook
+    """
+    HOOKS.register(hook)
+    return hook
+
+
+def unregister_hook(hook: BaseHook) -> None:
+    """remove registered hook
+
+    Raises:
+        ValueError: if hook is not registered
+    """
+    HOOKS.unregister(hook)
+
+
+class LoggingHook(BaseHook):
+    """Write parse events to `scrape_schema` and `type_caster` loggers"""
+
+    def __init__(self, max_len: int = 64):
+        """
+        Args:
+            max_len: max length of logged values
+        """
+        self.max_len = max_len
+        self.logger = logging.getLogger("scrape_schema")
+        self.logger_cast = logging.getLogger("type_caster")
+
+    def _short(self, value: Any) -> str:
+        value = str(value)
+        return f"{value[:self.max_len]}..." if len(value) > self.max_len else value
+
+    def on_field_start(self, schema: "BaseSchema", name: str, field: "BaseField"):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Start parse attribute: `%s.%s`", schema.__schema_name__, name
+            )
+
+    def on_field_end(
+        self, schema: "BaseSchema", name: str, value: Any, ctx: "ParseContext"
+    ):
+        if not ctx.is_success and not ctx.is_default:
+            self.logger.error(
+                "Parse error in %s.%s field", schema.__schema_name__, name
+            )
+        elif self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "%s.%s = %s", schema.__schema_name__, name, self._short(value)
+            )
+
+    def on_cast(
+        self, schema: "BaseSchema", name: str, type_: Type, value: Any, result: Any
+    ):
+        if self.logger_cast.isEnabledFor(logging.DEBUG):
+            self.logger_cast.debug(
+                "Cast %s.%s to %s: %s -> %s",
+                schema.__schema_name__,
+                name,
+                type_,
+                self._short(value),
+                self._short(result),
+            )
+
+    def on_default(
+        self,
+        field: "BaseField",
+        method: Optional["MarkupMethod"],
+        error: Optional[Exception],
+        default: Any,
+    ):
+        if error is not None:
+            self.logger.warning(
+                "%r throw exception `%s: %s`, set default value: %s",
+                method,
+                error.__class__.__name__,
+                error,
+                default,
+            )
+        else:
+            self.logger.warning(
+                "%r got empty value, set default value: %s", method, default
+            )
+
+    def on_error(
+        self, schema: "BaseSchema", name: str, error: Exception, ctx: "ParseContext"
+    ):
+        self.logger.error(
+            "Parse error in %s.%s field: %r throw exception `%s: %s`",
+            schema.__schema_name__,
+            name,
+            ctx.failed_method,
+            error.__class__.__name__,
+            error,
+        )
+
+
+class LoggingStepsHook(LoggingHook):
+    """LoggingHook, which also writes every method call result in DEBUG level.
+
+    Fields methods chains are executed without compiled plans with this hook
+    """
+
+    def on_step(self, field: "BaseField", method: "MarkupMethod", value: Any):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%r -> %s", method, self._short(value))
+
+
+def enable_logging(level: int = logging.INFO, colored: bool = True) -> LoggingHook:
+    """Register LoggingHook and add stream handler to
+    `scrape_schema` and `type_caster` loggers
+
+    Args:
+        level: loggers level. If DEBUG - register LoggingStepsHook
+        colored: use colorlog formatter
+
+    Returns:
+        registered LoggingHook object
+    """
+    fmt = "%(asctime)s [%(levelname)-8s] %(name)s: %(message)s"
+    if colored:
+        import colorlog
+
+        handler: logging.Handler = colorlog.StreamHandler()
+        handler.setFormatter(colorlog.ColoredFormatter(fmt="%(log_color)s " + fmt))
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(fmt))
+    hook = LoggingStepsHook() if level <= logging.DEBUG else LoggingHook()
+    for logger in (hook.logger, hook.logger_cast):
+        logger.addHandler(handler)
+        logger.setLevel(level)
+    return register_hook(hook)
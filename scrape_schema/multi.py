@@ -0,0 +1,94 @@
+"""Parse one document with several schemas.
+
+The document is decoded and parsed once, every schema gets the shared tree.
+Common queries prefixes of all schemas fields are evaluated once per document.
+"""
+from itertools import chain
+from typing import Any, Dict, List, Sequence, Tuple, Type, Union
+
+from lxml import etree
+from parsel import Selector, SelectorList
+
+from scrape_schema._charset import detect_encoding
+from scrape_schema._query import GROUP_PREFIXES_KEY, _Prefix, _Query, common_prefixes
+from scrape_schema.base import BaseSchema, SchemaConfig
+from scrape_schema.context import SharedDocument
+
+__all__ = ["parse_all"]
+
+_GroupPrefixes = Dict[_Query, Tuple[_Prefix, etree.XPath]]
+# common queries prefixes of schemas groups
+_SHARED_GROUPS: Dict[Tuple[Type[BaseSchema], ...], _GroupPrefixes] = {}
+_SHARED_GROUPS_SIZE = 128
+
+
+def _share_prefixes(schemas: Tuple[Type[BaseSchema], ...]) -> _GroupPrefixes:
+    """common queries prefixes between fields of all schemas.
+
+    Schemas queries are not changed: group prefixes are passed
+    in the shared document memo
+    """
+    if (prefixes := _SHARED_GROUPS.get(schemas)) is None:
+        prefixes = common_prefixes(
+            chain.from_iterable(schema.__schema_query_heads__ for schema in schemas)
+        )
+        if len(_SHARED_GROUPS) >= _SHARED_GROUPS_SIZE:
+            _SHARED_GROUPS.clear()
+        _SHARED_GROUPS[schemas] = prefixes
+    return prefixes
+
+
+def _document(
+    markup: Union[str, bytes, Selector, SelectorList], config: Type[SchemaConfig]
+) -> SharedDocument:
+    if isinstance(markup, (Selector, SelectorList)):
+        return SharedDocument(markup, markup)
+    kwargs = config.selector_kwargs
+    if isinstance(markup, bytes):
+        encoding, bom = detect_encoding(
+            markup, config.encoding or kwargs.get("encoding")
+        )
+        markup = markup[bom:].decode(encoding, errors="replace")
+        kwargs = {k: v for k, v in kwargs.items() if k != "encoding"}
+    elif not isinstance(markup, str):
+        raise TypeError(
+            f"Markup support only str, bytes or Selector types, not {type(markup).__name__}"
+        )
+    return SharedDocument(Selector(markup, **kwargs), markup)
+
+
+def parse_all(
+    markup: Union[str, bytes, Selector, SelectorList],
+    schemas: Sequence[Type[BaseSchema]],
+) -> List[Any]:
+    """Parse document with several schemas.
+
+    Document is parsed once for all schemas with the same `selector_kwargs`
+    and `encoding` config.
+
+    Args:
+        markup: string, bytes or parsel.Selector object
+        schemas: schemas classes
+    Returns:
+        schemas objects in the `schemas` order
+    Raises:
+        TypeError: if markup is not string, bytes or Selector objects
+    """
+    schemas = tuple(schemas)
+    prefixes = _share_prefixes(tuple(dict.fromkeys(schemas)))
+    # documents by selector config
+    documents: List[Tuple[Any, Any, SharedDocument]] = []
+    results = []
+    for cls_schema in schemas:
+        config = cls_schema.Config
+        for kwargs, encoding, document in documents:
+            if kwargs == config.selector_kwargs and encoding == config.encoding:
+                break
+        else:
+            document = _document(markup, config)
+            document.memo[GROUP_PREFIXES_KEY] = prefixes
+            documents.append((config.selector_kwargs, config.encoding, document))
+        schema = cls_schema.__new__(cls_schema)
+        schema._sc_init(document, None)
+        results.append(schema)
+    return results
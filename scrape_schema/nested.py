@@ -1,9 +1,13 @@
+import copy
+import time
 from typing import TYPE_CHECKING, Any, List, Optional, Type, Union, get_args
 
 from parsel import Selector, SelectorList
 
 from scrape_schema._typing import get_origin
 from scrape_schema.base import BaseField, BaseSchema
+from scrape_schema.context import ParseContext
+from scrape_schema.exceptions import BudgetExceededError
 
 if TYPE_CHECKING:
     from scrape_schema._protocols import SpecialMethodsProtocol
@@ -34,14 +38,38 @@ class Nested(BaseField):
         super().__init__()
         self.auto_type = False
         self.type_ = type_
-        self._crop_field = field
+        # protocol is only a typing hint: field is always BaseField
+        self._crop_field: BaseField = field  # type: ignore[assignment]
 
     def _prepare_markup(self, markup):
         raise NotImplementedError(
             "`_prepare_markup` method not allowed in Nested class"
         )  # pragma: no cover
 
-    def sc_parse(self, markup) -> Any:
+    def _compile(self) -> Any:
+        return self._crop_field._compile()
+
+    def _freeze(self) -> None:
+        self._crop_field._freeze()
+        super()._freeze()
+
+    def _bind_type(self, type_: Any) -> "Nested":
+        """Set schema type from annotation. Called by SchemaMeta
+
+        If this field already frozen in another schema with different type -
+        return copy of this field
+        """
+        if self.type_ == type_:
+            return self
+        elif self._frozen:
+            field = copy.copy(self)
+            object.__setattr__(field, "_frozen", False)
+            field.type_ = type_
+            return field
+        self.type_ = type_
+        return self
+
+    def sc_parse(self, markup, ctx: Optional[ParseContext] = None) -> Any:
         if not self.type_:
             raise TypeError("Nested required annotation in schema or `type_` param")
         elif get_origin(self.type_) is list and (
@@ -61,7 +89,15 @@ class Nested(BaseField):
         else:
             cls_schema = self.type_
 
-        chunks = self._crop_field.sc_parse(markup)
+        chunks = self._crop_field.sc_parse(markup, ctx)
+        if ctx is not None and (
+            ctx.deadline is not None
+            or ctx.max_nested_items is not None
+            or ctx.projection is not None
+            or ctx.retain is not None
+            or ctx.output is not None
+        ):
+            return self._context_parse(cls_schema, chunks, ctx)
         if isinstance(chunks, SelectorList) and get_origin(self.type_) is list:
             return [cls_schema(chunk.get()) for chunk in chunks]
         elif get_origin(self.type_) is list:
@@ -69,3 +105,48 @@ class Nested(BaseField):
         elif isinstance(chunks, Selector) and get_origin(self.type_) is not list:
             return cls_schema(chunks.get())
         return cls_schema(chunks)  # pragma: no cover
+
+    def _context_parse(
+        self, cls_schema: Type[BaseSchema], chunks: Any, ctx: ParseContext
+    ) -> Any:
+        """parse items with parent schema budgets (items count and deadline)
+        fields projection, retention policy and output"""
+        projection = ctx.projection
+
+        def parse(chunk: Any) -> Any:
+            if isinstance(chunk, Selector):
+                chunk = chunk.get()
+            if ctx.output is not None:
+                # `parse_dict`, `parse_tuple`: values without schema objects
+                result, error = cls_schema._sc_parse_output(
+                    chunk, ctx.deadline, projection, ctx.output
+                )
+            else:
+                result = cls_schema.__new__(cls_schema)
+                result._sc_init(chunk, ctx.deadline, projection, ctx.retain)
+                error = result.__sc_budget_error__
+            # deadline is shared with parent, other budgets are item-local
+            if error is not None and error.budget == "timeout":
+                ctx.budget_error = error
+            return result
+
+        if get_origin(self.type_) is not list:
+            return parse(chunks)
+        limit = ctx.max_nested_items
+        items = []
+        for i, chunk in enumerate(chunks):
+            if limit is not None and i >= limit:
+                ctx.budget_error = BudgetExceededError(
+                    "max_nested_items",
+                    f"{cls_schema.__name__}: nested items count > {limit}",
+                )
+                break
+            if ctx.deadline is not None and time.monotonic() > ctx.deadline:
+                ctx.budget_error = BudgetExceededError(
+                    "timeout", f"{cls_schema.__name__}: nested items parse timeout"
+                )
+                break
+            items.append(parse(chunk))
+            if ctx.budget_error is not None:
+                break
+        return items
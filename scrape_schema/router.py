@@ -0,0 +1,250 @@
+"""Dispatch documents of mixed types to the matching schema.
+
+`SchemaRouter` collects `markup_pre_validator` conditions of schemas:
+
+1. literal patterns are found by substring search, other regex patterns
+   of all schemas are compiled to one alternation regex and searched in one
+   pass over the markup. Bytes markup is scanned as is, if it is utf-8 and
+   patterns are not sensitive to multibyte characters
+2. css and xpath conditions are checked for schemas, which patterns are found
+3. the first matching schema is created from the same parsed document.
+   If its pre-validator method returns False, the next candidate is tried
+
+The scan is exact: when a pattern is found, it is removed from the alternation
+and the scan restarts from the same position, so a pattern cannot be hidden
+by an overlapping match of another pattern.
+"""
+import re
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from parsel import Selector, SelectorList
+
+from scrape_schema._charset import detect_encoding
+from scrape_schema.base import BaseSchema
+from scrape_schema.context import SharedDocument
+from scrape_schema.exceptions import SchemaPreValidationError
+from scrape_schema.multi import _document
+from scrape_schema.validator import is_bytes_safe, is_literal
+
+__all__ = ["SchemaRouter"]
+
+# compiled alternation regexes cache size per router
+_SCANNERS_CACHE_SIZE = 256
+# leading global inline flags: `(?i)pattern`
+_RE_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+# patterns with group references cannot be combined to one regex
+_RE_GROUP_REFERENCE = re.compile(r"\\\d|\(\?P[<=]")
+
+
+def _scoped(pattern: str) -> str:
+    """convert global inline flags to scoped: `(?i)a` -> `(?i:a)`"""
+    if match := _RE_GLOBAL_FLAGS.match(pattern):
+        return f"(?{match[1]}:{pattern[match.end():]})"
+    return pattern
+
+
+class _Route:
+    __slots__ = ("schema", "patterns", "queries")
+
+    def __init__(
+        self,
+        schema: Type[BaseSchema],
+        patterns: FrozenSet[int],
+        queries: Tuple[Tuple[str, str], ...],
+    ):
+        self.schema = schema
+        self.patterns = patterns
+        self.queries = queries
+
+
+class SchemaRouter:
+    """Pick the matching schema by `markup_pre_validator` conditions
+
+    Schemas are tried in the given order, schemas without conditions
+    match any document.
+
+    Usage:
+
+        router = SchemaRouter([ProductPage, CategoryPage, NotFoundPage])
+        schema = router.parse(response.content)
+    """
+
+    def __init__(self, schemas: Sequence[Type[BaseSchema]]):
+        """
+        Args:
+            schemas: schemas classes in priority order
+        """
+        self.schemas: Tuple[Type[BaseSchema], ...] = tuple(schemas)
+        patterns: Dict[str, int] = {}
+        self._routes: List[_Route] = []
+        for schema in self.schemas:
+            indexes: Set[int] = set()
+            queries: List[Tuple[str, str]] = []
+            for name in schema.__schema_pre_validators__:
+                validator = getattr(getattr(schema, name), "__sc_validator__", None)
+                if validator is None:  # pragma: no cover
+                    continue
+                if validator.pattern:
+                    indexes.add(patterns.setdefault(validator.pattern, len(patterns)))
+                if validator.css:
+                    queries.append(("css", validator.css))
+                if validator.xpath:
+                    queries.append(("xpath", validator.xpath))
+            self._routes.append(_Route(schema, frozenset(indexes), tuple(queries)))
+        self._patterns: Tuple[str, ...] = tuple(patterns)
+        # literal patterns are found by substring search: (str, utf-8 bytes)
+        self._literals: Dict[int, Tuple[str, bytes]] = {
+            i: (p, p.encode("utf-8"))
+            for i, p in enumerate(self._patterns)
+            if is_literal(p)
+        }
+        self._combined: FrozenSet[int] = frozenset(
+            i
+            for i, p in enumerate(self._patterns)
+            if i not in self._literals and not _RE_GROUP_REFERENCE.search(p)
+        )
+        self._bytes_scan = all(is_bytes_safe(p) for p in self._patterns)
+        # patterns, which are searched separately: (str regex, bytes regex)
+        self._separate: Dict[int, Tuple[Pattern[str], Optional[Pattern[bytes]]]] = {
+            i: (
+                re.compile(p),
+                re.compile(p.encode("ascii")) if self._bytes_scan else None,
+            )
+            for i, p in enumerate(self._patterns)
+            if i not in self._combined and i not in self._literals
+        }
+        encodings = {schema.Config.encoding for schema in self.schemas}
+        self._encoding = encodings.pop() if len(encodings) == 1 else None
+        self._scanners: Dict[Tuple[FrozenSet[int], bool], Pattern[Any]] = {}
+
+    def _scanner(self, indexes: FrozenSet[int], is_bytes: bool) -> Pattern[Any]:
+        """alternation regex of patterns, cached by patterns indexes"""
+        key = (indexes, is_bytes)
+        if (scanner := self._scanners.get(key)) is None:
+            pattern = "|".join(
+                f"(?P<p{i}>{_scoped(self._patterns[i])})" for i in sorted(indexes)
+            )
+            scanner = re.compile(pattern.encode("ascii") if is_bytes else pattern)
+            if len(self._scanners) >= _SCANNERS_CACHE_SIZE:
+                self._scanners.clear()
+            self._scanners[key] = scanner
+        return scanner
+
+    def _scan(self, text: Union[str, bytes]) -> Set[int]:
+        """indexes of patterns, found in the text"""
+        is_bytes = isinstance(text, bytes)
+        found: Set[int] = {
+            index
+            for index, literal in self._literals.items()
+            if literal[is_bytes] in text  # type: ignore[operator]
+        }
+        remaining = self._combined
+        pos = 0
+        while remaining:
+            match = self._scanner(remaining, is_bytes).search(text, pos)
+            if match is None:
+                break
+            index = int(match.lastgroup[1:])  # type: ignore[index]
+            found.add(index)
+            remaining = remaining - {index}
+            # other patterns can match at the same position
+            pos = match.start()
+        for index, (str_pattern, bytes_pattern) in self._separate.items():
+            if (bytes_pattern if is_bytes else str_pattern).search(text):  # type: ignore[arg-type, union-attr]
+                found.add(index)
+        return found
+
+    def _text(
+        self, markup: Union[str, bytes, Selector, SelectorList]
+    ) -> Tuple[Union[str, bytes], Union[str, bytes, Selector, SelectorList]]:
+        """text to scan and markup to parse (decoded once, if scanned as string)"""
+        if isinstance(markup, (Selector, SelectorList)):
+            return markup.get() or "", markup
+        elif isinstance(markup, bytes) and self._patterns:
+            encoding, bom = detect_encoding(markup, self._encoding)
+            if encoding == "utf-8" and self._bytes_scan:
+                return markup, markup
+            text = markup[bom:].decode(encoding, errors="replace")
+            return text, text
+        elif isinstance(markup, (str, bytes)):
+            return markup, markup
+        raise TypeError(
+            f"Markup support only str, bytes or Selector types, not {type(markup).__name__}"
+        )
+
+    def _candidates(
+        self, markup: Union[str, bytes, Selector, SelectorList]
+    ) -> Tuple[List[_Route], Union[str, bytes, Selector, SelectorList]]:
+        text, markup = self._text(markup)
+        found = self._scan(text) if self._patterns else set()
+        return [route for route in self._routes if route.patterns <= found], markup
+
+    def _routes_documents(
+        self, markup: Union[str, bytes, Selector, SelectorList]
+    ) -> Iterator[Tuple[_Route, SharedDocument]]:
+        """candidates, which passed css and xpath conditions, with parsed documents"""
+        routes, markup = self._candidates(markup)
+        documents: List[Tuple[Any, Any, SharedDocument]] = []
+        for route in routes:
+            config = route.schema.Config
+            for kwargs, encoding, document in documents:
+                if kwargs == config.selector_kwargs and encoding == config.encoding:
+                    break
+            else:
+                document = _document(markup, config)
+                documents.append((config.selector_kwargs, config.encoding, document))
+            selector = document.selector
+            if all(
+                (selector.css(q) if kind == "css" else selector.xpath(q)).get()
+                for kind, q in route.queries
+            ):
+                yield route, document
+
+    def match(
+        self, markup: Union[str, bytes, Selector, SelectorList]
+    ) -> Optional[Type[BaseSchema]]:
+        """Find the first schema, which pre-validators conditions (pattern, css,
+        xpath) are passed. Pre-validators methods are not called
+
+        Args:
+            markup: string, bytes or parsel.Selector object
+        Returns:
+            schema class or None
+        """
+        for route, _ in self._routes_documents(markup):
+            return route.schema
+        return None
+
+    def parse(self, markup: Union[str, bytes, Selector, SelectorList]) -> BaseSchema:
+        """Parse document with the first matching schema
+
+        Args:
+            markup: string, bytes or parsel.Selector object
+        Returns:
+            schema object
+        Raises:
+            SchemaPreValidationError: no schema matches the document
+            TypeError: if markup is not string, bytes or Selector objects
+        """
+        for route, document in self._routes_documents(markup):
+            schema = route.schema.__new__(route.schema)
+            try:
+                schema._sc_init(document, None)
+            except SchemaPreValidationError:
+                continue
+            return schema
+        names = ", ".join(schema.__name__ for schema in self.schemas)
+        raise SchemaPreValidationError(f"No schema matches the document: {names}")
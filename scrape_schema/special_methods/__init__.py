@@ -29,3 +29,4 @@ DEFAULT_SPEC_METHOD_HANDLER.add_method(SpecialMethods.R_STRIP, RStripMethod())
 DEFAULT_SPEC_METHOD_HANDLER.add_method(SpecialMethods.STRIP, StripMethod())
 DEFAULT_SPEC_METHOD_HANDLER.add_method(SpecialMethods.STR_JOIN, JoinMethod())
 DEFAULT_SPEC_METHOD_HANDLER.add_method(SpecialMethods.SPLIT, SplitMethod())
+DEFAULT_SPEC_METHOD_HANDLER.add_method(SpecialMethods.FIRST_OF, FirstOfMethod())
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Dict, NamedTuple, Protocol, Tuple, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Protocol, Tuple, Union
 
 
 class SpecialMethods(Enum):
@@ -15,6 +15,7 @@ class SpecialMethods(Enum):
         REGEX_FINDALL: execute `re.findall()` method
         CHOMP_JS_PARSE: execute `chompjs.parse_js_object()` method
         CHOMP_JS_PARSE_ALL: execute `chompjs.parse_js_objects()` method
+        FIRST_OF: execute first successful alternative methods chain
     """
 
     # special methods for another methods
@@ -36,6 +37,7 @@ class SpecialMethods(Enum):
     CAPITALIZE = 14
     COUNT = 15
     SPLIT = 16
+    FIRST_OF = 17
 
 
 class MarkupMethod(NamedTuple):
@@ -77,6 +79,28 @@ class BaseSpecialMethodStrategy:
         pass  # pragma: no cover
 
 
+class BaseStringMethodStrategy(BaseSpecialMethodStrategy):
+    """Element-wise string method: applied to string or to every list item.
+
+    Consecutive string methods are fused by the field plan compiler
+    into one loop by `kernel` functions
+    """
+
+    @abstractmethod
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        """get function, which applies method to one string"""
+        pass  # pragma: no cover
+
+    def batch(self, markup: List[Any], method: MarkupMethod) -> List[Any]:
+        """apply method to every list item in a single pass"""
+        return list(map(self.kernel(method), markup))
+
+    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
+        if isinstance(markup, list):
+            return self.batch(markup, method)
+        return self.kernel(method)(markup)
+
+
 class SpecialMethodsHandler:
     def __init__(self):
         """Special method handler"""
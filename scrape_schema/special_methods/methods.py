@@ -1,9 +1,12 @@
 import warnings
-from typing import Any
+from operator import methodcaller
+from typing import Any, Callable
 
-import chompjs
-
-from scrape_schema.special_methods.base import BaseSpecialMethodStrategy, MarkupMethod
+from scrape_schema.special_methods.base import (
+    BaseSpecialMethodStrategy,
+    BaseStringMethodStrategy,
+    MarkupMethod,
+)
 
 __all__ = [
     "FnMethod",
@@ -24,6 +27,7 @@ __all__ = [
     "CountMethod",
     "JoinMethod",
     "SplitMethod",
+    "FirstOfMethod",
 ]
 
 
@@ -43,46 +47,34 @@ class SplitMethod(BaseSpecialMethodStrategy):
         return markup.split(_sep, _max_split)
 
 
-class StripMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.strip(method.args[0]) for m in markup]
-        return markup.strip(method.args[0])
+class StripMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("strip", method.args[0])
 
 
-class RStripMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.rstrip(method.args[0]) for m in markup]
-        return markup.rstrip(method.args[0])
+class RStripMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("rstrip", method.args[0])
 
 
-class LStripMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.lstrip(method.args[0]) for m in markup]
-        return markup.lstrip(method.args[0])
+class LStripMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("lstrip", method.args[0])
 
 
-class LowerMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.lower() for m in markup]
-        return markup.lower()
+class LowerMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("lower")
 
 
-class UpperMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.upper() for m in markup]
-        return markup.upper()
+class UpperMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("upper")
 
 
-class CapitalizeMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m.capitalize() for m in markup]
-        return markup.capitalize()
+class CapitalizeMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("capitalize")
 
 
 class CountMethod(BaseSpecialMethodStrategy):
@@ -104,26 +96,21 @@ class JoinMethod(BaseSpecialMethodStrategy):
         return markup
 
 
-class ConcatLeftMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [method.args[0] + m for m in markup]
-        return method.args[0] + markup
+class ConcatLeftMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        left = method.args[0]
+        return lambda m: left + m
 
 
-class ConcatRightMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        if isinstance(markup, list):
-            return [m + method.args[0] for m in markup]
-        return markup + method.args[0]
+class ConcatRightMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        right = method.args[0]
+        return lambda m: m + right
 
 
-class ReplaceMethod(BaseSpecialMethodStrategy):
-    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
-        __old, __new, __count = method.args[0], method.args[1], method.args[2]
-        if isinstance(markup, list):
-            return [m.replace(__old, __new, __count) for m in markup]
-        return markup.replace(__old, __new, __count)
+class ReplaceMethod(BaseStringMethodStrategy):
+    def kernel(self, method: MarkupMethod) -> Callable[[Any], Any]:
+        return methodcaller("replace", *method.args[:3])
 
 
 class ReSearchMethod(BaseSpecialMethodStrategy):
@@ -148,9 +135,19 @@ class ReFindallMethod(BaseSpecialMethodStrategy):
 
 class ChompJsParseMethod(BaseSpecialMethodStrategy):
     def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
+        import chompjs  # imported on first use: faster package import
+
         return chompjs.parse_js_object(markup, *method.args)
 
 
 class ChompJsParseAllMethod(BaseSpecialMethodStrategy):
     def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
+        import chompjs
+
         return chompjs.parse_js_objects(markup, *method.args)
+
+
+class FirstOfMethod(BaseSpecialMethodStrategy):
+    def __call__(self, markup: Any, method: MarkupMethod, **kwargs):
+        # scrape_schema._alternatives.Alternatives object
+        return method.args[0](markup)
@@ -2,7 +2,6 @@
 import sys
 from typing import Any, Type, Union
 
-from scrape_schema._logger import _logger_cast as _logger
 from scrape_schema._typing import NoneType, get_args, get_origin
 
 
@@ -41,14 +40,6 @@ class TypeCaster:
         if origin is Any or Any in args:
             return value
 
-        _logger.debug(
-            "Cast type start. `value=%s`, type_annotation=%s, `origin=%s`, `args=%s`",
-            value,
-            type_hint,
-            origin,
-            args,
-        )
-
         # None
         if value is None and type_hint is not bool:
             return value
@@ -56,21 +47,10 @@ class TypeCaster:
         if origin is not None and args:
             # list
             if origin is list:
-                _logger.debug(
-                    "List cast %s -> %s",
-                    args[0],
-                    value,
-                )
                 return [self.cast(type_hint=args[0], value=v) for v in value]
             # dict
             elif origin is dict:
                 key_type, value_type = args
-                _logger.debug(
-                    "Dict cast key=%s, value=%s -> %s",
-                    key_type.__name__,
-                    value_type.__name__,
-                    value,
-                )
                 return {
                     self.cast(type_hint=key_type, value=k): self.cast(
                         type_hint=value_type, value=v
@@ -80,7 +60,6 @@ class TypeCaster:
             # Optional
             elif origin is Union:
                 if value is None and NoneType in args:
-                    _logger.debug("Optional cast %s", value)
                     return None
                 # in python3.8 raise TypeError: issubclass() arg 1 must be a class
                 # example _cast_type(Optional[List[int]], [])
@@ -89,9 +68,7 @@ class TypeCaster:
                     return self.cast(type_hint=non_none_args[0], value=value)
         # bool cast
         elif type_hint is bool:
-            _logger.debug("Bool cast %s", value)
             return bool(value)
         else:
             # direct cast
-            _logger.debug("Direct cast %s -> %s", type_hint, value)
             return type_hint(value)
@@ -1,7 +1,7 @@
 """Validator methods and decorators"""
 import re
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Pattern, Union
 
 from parsel import Selector, SelectorList
 
@@ -13,6 +13,23 @@ if TYPE_CHECKING:
 
 __all__ = ["markup_pre_validator"]
 
+# regex syntax characters: patterns without them are literals
+_RE_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# char classes, which match different text in str and utf-8 bytes
+_RE_MULTIBYTE_SENSITIVE = re.compile(r"\\[wWbBdDsS]|(?<!\\)\.|\[\^")
+
+
+def is_literal(pattern: str) -> bool:
+    """pattern has not regex syntax characters"""
+    return not _RE_METACHARS.search(pattern)
+
+
+def is_bytes_safe(pattern: str) -> bool:
+    """pattern matches utf-8 bytes same as decoded string"""
+    return is_literal(pattern) or (
+        pattern.isascii() and not _RE_MULTIBYTE_SENSITIVE.search(pattern)
+    )
+
 
 class MarkupPreValidator:
     """pre validate markup decorator"""
@@ -26,7 +43,8 @@ class MarkupPreValidator:
     ):
         """Pre-validation of markup for the schema.
 
-        If the given pattern returns False, it will throw SchemaPreValidationError
+        If the given pattern returns False, it will throw SchemaPreValidationError.
+        Pattern is checked before the document parse, if markup is str or bytes
 
         Args:
             pattern: regex pattern
@@ -43,29 +61,71 @@ class MarkupPreValidator:
         self.xpath = xpath
         self.css = css
         self.pattern = pattern
+        # compiled once, bytes regex - if utf-8 bytes can be searched as is
+        self._re: Optional[Pattern[str]] = re.compile(pattern) if pattern else None
+        self._bytes_re: Optional[Pattern[bytes]] = (
+            re.compile(pattern.encode("utf-8"))
+            if pattern and is_bytes_safe(pattern)
+            else None
+        )
+        self.func: Optional[Callable[["BaseSchema"], bool]] = None
 
     def __call__(self, func: Callable[["BaseSchema"], bool]):
+        self.func = func
+
         # hack for hook this validator in Schema constructor
         # by __wrapped__ method
         @wraps(MarkupPreValidator)
         def inner(cls_self: "BaseSchema"):
-            if self.pattern and not self._pre_validate_re(cls_self.__raw__):
-                msg = f"Failed validate re `{self.pattern}` in `{cls_self.__schema_name__}`"
-                raise SchemaPreValidationError(msg)
-            if self.css and not self._pre_validate_css(cls_self.__selector__):
-                msg = (
-                    f"Failed validate css `{self.css}` in `{cls_self.__schema_name__}`"
-                )
-                raise SchemaPreValidationError(msg)
-            if self.xpath and not self._pre_validate_xpath(cls_self.__selector__):
-                msg = f"Failed validate xpath `{self.xpath}` in `{cls_self.__schema_name__}`"
-                raise SchemaPreValidationError(msg)
-            return func(cls_self)
+            self.validate_pattern(cls_self, cls_self.__raw__)
+            return self.validate_document(cls_self)
 
+        # validator conditions, used by SchemaMeta and SchemaRouter
+        inner.__sc_validator__ = self  # type: ignore[attr-defined]
         return inner
 
+    def validate_pattern(self, schema: "BaseSchema", markup: Union[str, bytes]) -> None:
+        """check pattern in the markup string or utf-8 bytes
+
+        Raises:
+            SchemaPreValidationError: if pattern is not found
+        """
+        if self._re is None:
+            return
+        if isinstance(markup, bytes):
+            found = self._bytes_re.search(markup)  # type: ignore[union-attr]
+        else:
+            found = self._re.search(markup)
+        if not found:
+            msg = f"Failed validate re `{self.pattern}` in `{schema.__schema_name__}`"
+            raise SchemaPreValidationError(msg)
+
+    def validate_document(self, schema: "BaseSchema", queries: bool = True) -> bool:
+        """check css and xpath queries, call decorated method
+
+        Args:
+            schema: validated schema
+            queries: check css and xpath queries. False - if document is not parsed
+                (`max_markup_size` budget is exceeded)
+
+        Returns:
+            decorated method result
+
+        Raises:
+            SchemaPreValidationError: if query result is empty
+        """
+        if not queries:
+            return self.func(schema)  # type: ignore[misc]
+        if self.css and not self._pre_validate_css(schema.__selector__):
+            msg = f"Failed validate css `{self.css}` in `{schema.__schema_name__}`"
+            raise SchemaPreValidationError(msg)
+        if self.xpath and not self._pre_validate_xpath(schema.__selector__):
+            msg = f"Failed validate xpath `{self.xpath}` in `{schema.__schema_name__}`"
+            raise SchemaPreValidationError(msg)
+        return self.func(schema)  # type: ignore[misc]
+
     def _pre_validate_re(self, markup: str) -> bool:
-        return bool(re.search(self.pattern, markup))  # type: ignore
+        return bool(self._re.search(markup))  # type: ignore
 
     def _pre_validate_css(self, markup: Union[Selector, SelectorList]) -> bool:
         return bool(markup.css(self.css).get())  # type: ignore
@@ -0,0 +1,78 @@
+"""Import and schema classes creation time benchmark.
+
+Every measure runs in a new interpreter:
+
+    python scripts/bench_import.py [classes count]
+
+- import: `import scrape_schema`
+- classes: create schema classes (with Nested fields and sc_param)
+- first parse: parse a document by every schema class
+"""
+import subprocess
+import sys
+import textwrap
+
+CODE = textwrap.dedent(
+    """
+    import time
+
+    start = time.perf_counter()
+    from typing import List
+
+    from scrape_schema import BaseSchema, Nested, Parsel, Sc, sc_param
+    from scrape_schema.base import SchemaConfig
+    imported = time.perf_counter()
+
+    class Config(SchemaConfig):
+        deferred = {deferred}
+
+    schemas = []
+    for i in range({count}):
+        class Item(BaseSchema):
+            Config = Config
+            name: Sc[str, Parsel().xpath("//p/text()").get()]
+            price: Sc[float, Parsel(default=.0).xpath("//b/text()").get()]
+
+        class Page(BaseSchema):
+            Config = Config
+            title: Sc[str, Parsel().xpath("//h1/text()").get().strip()]
+            items: Sc[List[Item], Nested(Parsel().xpath("//li"))]
+            urls: Sc[List[str], Parsel(default=[]).xpath("//a/@href").getall()]
+
+            @sc_param
+            def count(self) -> int:
+                return len(self.items)
+
+        schemas.append(Page)
+    created = time.perf_counter()
+
+    markup = "<h1>Title</h1><ul><li><p>a</p><b>1</b></li></ul><a href='/'>a</a>"
+    for schema in schemas:
+        schema(markup)
+    parsed = time.perf_counter()
+    print(imported - start, created - imported, parsed - created)
+    """
+)
+
+
+def run(count: int, deferred: bool, repeat: int = 5):
+    results = []
+    for _ in range(repeat):
+        code = CODE.format(count=count, deferred=deferred)
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        results.append(tuple(float(v) for v in out.split()))
+    # best of runs
+    return tuple(min(values) for values in zip(*results))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    print(f"{count} schemas: import / classes / first parse, ms")
+    for deferred in (False, True):
+        imported, created, parsed = run(count, deferred)
+        print(
+            f"deferred={deferred!s:<5} {imported * 1000:8.1f} "
+            f"{created * 1000:8.1f} {parsed * 1000:8.1f}"
+        )
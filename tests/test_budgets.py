@@ -0,0 +1,223 @@
+import time
+from typing import List
+
+import pytest
+from parsel import Selector
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, base
+from scrape_schema.base import SchemaConfig
+from scrape_schema.exceptions import SchemaPreValidationError
+from scrape_schema.validator import markup_pre_validator
+
+
+def _sleep(value):
+    time.sleep(0.05)
+    return value
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    price: Sc[int, Parsel(default=-1).xpath("//div[@class='price']/text()").get()]
+
+
+class Items(BaseSchema):
+    first: Sc[str, Parsel().xpath("//p/text()").get()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+    count: Sc[int, Parsel().xpath("//li").getall().count()]
+
+
+def _schema(base, **config):
+    class Config(SchemaConfig):
+        pass
+
+    for k, v in config.items():
+        setattr(Config, k, v)
+    return type(base.__name__, (base,), {"Config": Config})
+
+
+def test_no_budgets():
+    schema = Items(HTML_FOR_SCHEMA)
+    assert schema.__sc_unparsed__ == ()
+    assert schema.__sc_budget_error__ is None
+    assert len(schema.items) == 5
+
+
+def test_max_markup_size():
+    schema = _schema(Items, max_markup_size=100)(HTML_FOR_SCHEMA)
+    # unparsed in parse order: nested field is the most expensive
+    assert schema.__sc_unparsed__ == ("first", "count", "items")
+    assert schema.__sc_budget_error__.budget == "max_markup_size"
+    assert schema.first is None
+    assert schema.__raw__ == HTML_FOR_SCHEMA
+    assert schema.dict() == {"first": None, "items": None, "count": None}
+
+
+def test_max_nodes():
+    schema = _schema(Item, max_nodes=10)(HTML_FOR_SCHEMA)
+    assert schema.__sc_unparsed__ == ("name", "price")
+    assert schema.__sc_budget_error__.budget == "max_nodes"
+    # default value for unparsed fields
+    assert schema.price == -1
+    assert _schema(Item, max_nodes=1000)(HTML_FOR_SCHEMA).name == "audi"
+
+
+def test_max_nested_items():
+    schema = _schema(Items, max_nested_items=2)(HTML_FOR_SCHEMA)
+    assert [item.name for item in schema.items] == ["audi", "ferrari"]
+    assert schema.__sc_budget_error__.budget == "max_nested_items"
+    assert schema.first == "audi"
+    assert schema.count == 5
+    assert schema.__sc_unparsed__ == ()
+
+
+def test_timeout():
+    class Slow(BaseSchema):
+        first: Sc[str, Parsel().xpath("//p/text()").get().fn(_sleep)]
+        second: Sc[str, Parsel().xpath("//p/text()").get()]
+
+        class Config(SchemaConfig):
+            timeout = 0.01
+            fields_order = ("first",)
+
+    schema = Slow(HTML_FOR_SCHEMA)
+    assert schema.first == "audi"
+    assert schema.__sc_unparsed__ == ("second",)
+    assert schema.__sc_budget_error__.budget == "timeout"
+
+
+def test_timeout_between_steps():
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        return _sleep(value)
+
+    class Slow(BaseSchema):
+        name: Sc[str, Parsel(default="x").xpath("//p/text()").get().fn(slow).fn(slow)]
+
+        class Config(SchemaConfig):
+            timeout = 0.01
+
+    schema = Slow(HTML_FOR_SCHEMA)
+    # long methods chain is stopped between steps
+    assert calls == ["audi"]
+    assert schema.name == "x"
+    assert schema.__sc_unparsed__ == ("name",)
+    assert schema.__sc_budget_error__.budget == "timeout"
+    assert Slow.parse_dict(HTML_FOR_SCHEMA) == {"name": "x"}
+
+
+def test_timeout_shared_with_nested():
+    class SlowItem(BaseSchema):
+        name: Sc[str, Parsel().xpath("//p/text()").get().fn(_sleep)]
+
+    class SlowItems(BaseSchema):
+        items: Sc[List[SlowItem], Nested(Parsel().xpath("//ul/li"))]
+        count: Sc[int, Parsel().xpath("//li").getall().count()]
+
+        class Config(SchemaConfig):
+            timeout = 0.01
+            fields_order = "declared"
+
+    schema = SlowItems(HTML_FOR_SCHEMA)
+    assert [item.name for item in schema.items] == ["audi"]
+    assert schema.__sc_unparsed__ == ("count",)
+    assert schema.__sc_budget_error__.budget == "timeout"
+
+
+def test_nested_local_budget():
+    class TinyItem(Item):
+        class Config(SchemaConfig):
+            max_nodes = 1
+
+    class TinyItems(BaseSchema):
+        items: Sc[List[TinyItem], Nested(Parsel().xpath("//ul/li"))]
+        count: Sc[int, Parsel().xpath("//li").getall().count()]
+
+        class Config(SchemaConfig):
+            max_nested_items = 10
+
+    schema = TinyItems(HTML_FOR_SCHEMA)
+    assert len(schema.items) == 5
+    assert schema.items[0].__sc_unparsed__ == ("name", "price")
+    assert schema.__sc_budget_error__ is None
+    assert schema.count == 5
+
+
+@pytest.mark.parametrize("markup", [HTML_FOR_SCHEMA, HTML_FOR_SCHEMA.encode()])
+def test_markup_size_types(markup):
+    assert _schema(Item, max_markup_size=len(markup))(markup).name == "audi"
+
+
+def _validated(**config):
+    class Validated(BaseSchema):
+        class Config(SchemaConfig):
+            pass
+
+        name: Sc[str, Parsel().xpath("//p/text()").get()]
+
+        @markup_pre_validator(pattern="<ul>")
+        def has_list(self):
+            return True
+
+        @markup_pre_validator()
+        def has_name(self):
+            return "<p>" in self.__raw__
+
+        @markup_pre_validator(xpath="//div[@class='price']")
+        def has_price(self):
+            return True
+
+    for k, v in config.items():
+        setattr(Validated.Config, k, v)
+    return Validated
+
+
+@pytest.mark.parametrize(
+    "config", [{}, {"max_markup_size": 10}, {"max_nodes": 1}], ids=str
+)
+@pytest.mark.parametrize(
+    "markup", ["<p>audi</p>", "<ul><li>audi</li></ul>", b"<ul><li>audi</li></ul>"]
+)
+def test_budget_pre_validation(config, markup):
+    # pattern and methods pre-validators reject the same documents
+    with pytest.raises(SchemaPreValidationError):
+        _validated(**config)(markup)
+
+
+@pytest.mark.parametrize("config", [{}, {"max_nodes": 1}], ids=str)
+def test_budget_queries_pre_validation(config):
+    # queries are checked, if the document is parsed
+    with pytest.raises(SchemaPreValidationError):
+        _validated(**config)("<ul><li><p>audi</p></li></ul>")
+
+
+@pytest.mark.parametrize(
+    "config, budget",
+    [({"max_markup_size": 10}, "max_markup_size"), ({"max_nodes": 1}, "max_nodes")],
+)
+def test_budget_validated(config, budget):
+    schema = _validated(**config)(HTML_FOR_SCHEMA)
+    assert schema.__sc_budget_error__.budget == budget
+    assert schema.__sc_unparsed__ == ("name",)
+    assert _validated()(HTML_FOR_SCHEMA).name == "audi"
+
+
+@pytest.mark.parametrize("markup_type", [str, bytes])
+def test_max_markup_size_not_parsed(monkeypatch, markup_type):
+    built = []
+
+    class CountedSelector(Selector):
+        def __init__(self, text=None, *args, body=b"", **kwargs):
+            built.append(len(text or body))
+            super().__init__(text, *args, body=body, **kwargs)
+
+    monkeypatch.setattr(base, "Selector", CountedSelector)
+    markup = "<ul>" + "<li><p>audi</p><div class='price'>1</div></li>" * 2000 + "</ul>"
+    schema = _validated(max_markup_size=100)(
+        markup if markup_type is str else markup.encode()
+    )
+    assert schema.__sc_budget_error__.budget == "max_markup_size"
+    # only the empty document placeholder is built
+    assert built and max(built) < 100
@@ -0,0 +1,108 @@
+import pytest
+from tests.fixtures import HTML
+
+from scrape_schema import BaseSchema, Parsel, Sc
+from scrape_schema._optimizer import optimize_methods
+from scrape_schema.context import ParseContext
+from scrape_schema.exceptions import BudgetExceededError
+from scrape_schema.special_methods import SpecialMethods
+
+
+def _deadline(n):
+    return (
+        "    if deadline is not None and _monotonic() > deadline: "
+        f"_deadline_exceeded(_st{n})"
+    )
+
+
+class CompiledSchema(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get().upper()]
+
+
+def test_plan_compiled_in_class_creation():
+    field = CompiledSchema.__schema_fields__["title"]
+    assert field._plan is not None
+    assert field._plan.methods == tuple(optimize_methods(field._stack_methods))
+
+
+def test_plan_source():
+    plan = Parsel().jmespath("a").get().upper()._compile()
+    assert plan.source.splitlines()[1:] == [
+        "    v = v.jmespath(_a0_0)",
+        _deadline(1),
+        "    v = v.get(_a1_0)",
+        _deadline(2),
+        "    v = _s2(v, _m2)",
+        "    return v",
+    ]
+
+
+def test_plan_source_query_chain():
+    plan = Parsel().css("a").attrib.get("href").upper()._compile()
+    assert plan.source.splitlines()[1:] == [
+        "    v = _q0(v, memo)",
+        _deadline(1),
+        "    v = _s1(v, _m1)",
+        "    return v",
+    ]
+    assert plan.steps[0] == tuple(plan.methods[:3])
+
+
+def test_plan_reset_after_add_method():
+    field = Parsel().xpath("//h1/text()")
+    plan = field._compile()
+    assert field._compile() is plan
+    field.get()
+    assert field._compile() is not plan
+    assert field.sc_parse(HTML) == "Hello, Parsel!"
+
+
+def test_plan_failed_method():
+    field = Parsel().xpath("//h2/text()").get().upper()
+    ctx = ParseContext()
+    with pytest.raises(AttributeError):
+        field.sc_parse(HTML, ctx)
+    assert not ctx.is_success
+    assert ctx.failed_method.METHOD_NAME == SpecialMethods.UPPER
+
+
+def test_plan_unknown_method():
+    assert Parsel().add_method("extract").sc_parse(HTML).startswith("<html>")
+    field = Parsel().add_method("register_namespace", "x", "http://example.com")
+    assert "_accept_method" in field._compile().source
+    assert field.sc_parse(HTML) is None
+
+
+def test_plan_fused_string_methods():
+    field = Parsel().xpath("//li/a/text()").getall().strip().lower().concat_r("!")
+    plan = field._compile()
+    assert plan.source.splitlines()[2] == _deadline(1)
+    assert plan.source.splitlines()[3] == (
+        "    v = [(s.strip().lower() + _k1_0) for s in v] "
+        "if isinstance(v, list) else (v.strip().lower() + _k1_0)"
+    )
+    assert plan.steps[1] == tuple(plan.methods[2:])
+    assert field.sc_parse(HTML) == ["link 1!", "link 2!"]
+
+
+def test_plan_fused_string_methods_str():
+    field = Parsel().xpath("//h1/text()").get().replace("Hello", "Bye").upper()
+    assert field.sc_parse(HTML) == "BYE, PARSEL!"
+
+
+def test_plan_fused_string_methods_failed_method():
+    field = Parsel().xpath("//h2/text()").get().strip().upper()
+    ctx = ParseContext()
+    with pytest.raises(AttributeError):
+        field.sc_parse(HTML, ctx)
+    assert ctx.failed_method.METHOD_NAME == SpecialMethods.STRIP
+
+
+def test_plan_deadline():
+    field = Parsel().xpath("//h1/text()").get().upper()
+    ctx = ParseContext()
+    ctx.deadline = 0.0
+    with pytest.raises(BudgetExceededError, match="UPPER"):
+        field.sc_parse(HTML, ctx)
+    ctx.deadline = None
+    assert field.sc_parse(HTML, ctx) == "HELLO, PARSEL!"
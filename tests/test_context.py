@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc
+from scrape_schema.context import ParseContext
+
+
+class Item(BaseSchema):
+    item: Sc[str, Parsel().xpath("//p/text()").get()]
+    price: Sc[
+        int, Parsel(default=-1).xpath("//div[@class='price']/b/text()").get().upper()
+    ]
+
+
+class Items(BaseSchema):
+    items: Sc[List[Item], Nested(Parsel().xpath("//body/ul").xpath("./li"))]
+
+
+def test_fields_frozen():
+    field = Item.__schema_fields__["item"]
+    with pytest.raises(AttributeError):
+        field.default = "spam"
+    with pytest.raises(TypeError):
+        field.get()
+
+
+def test_nested_type_bound_in_class_creation():
+    assert Items.__schema_fields__["items"].type_ == List[Item]
+
+
+def test_shared_nested_field_copy():
+    nested = Nested(Parsel().xpath("//body/ul").xpath("./li")[0])
+
+    class A(BaseSchema):
+        item: Sc[Item, nested]
+
+    class B(BaseSchema):
+        item: Sc[dict, nested]
+
+    assert A.__schema_fields__["item"] is nested
+    assert B.__schema_fields__["item"] is not nested
+    assert A(HTML_FOR_SCHEMA).item.item == "audi"
+
+
+def test_context_default_flags():
+    ctx = ParseContext()
+    field = Item.__schema_fields__["price"]
+    assert field.sc_parse(HTML_FOR_SCHEMA, ctx) == -1
+    assert ctx.is_default
+    assert not ctx.is_success
+
+
+def test_parse_in_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: Items(HTML_FOR_SCHEMA).dict(), range(32)))
+    assert all(r == results[0] for r in results)
+    assert results[0]["items"][0] == {"item": "audi", "price": -1}
@@ -0,0 +1,128 @@
+from typing import List
+
+import pytest
+from tests.fixtures import HTML
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc
+from scrape_schema._query import _path_prefixes, _split_path
+
+HTML_PRODUCTS = """
+<html><body>
+<div class="product"><p class="name">a</p><p class="price">1</p>
+    <div class="product"><p class="name">nested</p></div>
+</div>
+<div class="product"><p class="name">b</p><p class="price">2</p><i>x</i></div>
+</body></html>
+"""
+
+
+class Product(BaseSchema):
+    name: Sc[
+        str, Parsel().xpath("//div[@class='product']/p[@class='name']/text()").get()
+    ]
+    names: Sc[
+        List[str],
+        Parsel().xpath("//div[@class='product']/p[@class='name']/text()").getall(),
+    ]
+    price: Sc[
+        int, Parsel().xpath("//div[@class='product']/p[@class='price']/text()").get()
+    ]
+    deep: Sc[List[str], Parsel().xpath("//div[@class='product']//p/text()").getall()]
+    first: Sc[str, Parsel().xpath("//div[@class='product']").get()]
+    last_i: Sc[str, Parsel().xpath("(//div[@class='product']/i)[last()]/text()").get()]
+    css_names: Sc[List[str], Parsel().css("div.product > p.name::text").getall()]
+    css_prices: Sc[List[str], Parsel().css("div.product > p.price::text").getall()]
+
+
+class Page(BaseSchema):
+    products: Sc[List[Product], Nested(Parsel().xpath("//body"))]
+    body_p: Sc[List[str], Parsel().xpath("//body/div/p/text()").getall()]
+
+
+def _expected(schema, markup):
+    """reference implementation: call Parsel methods as is"""
+    result = {}
+    for name, field in schema.__schema_fields__.items():
+        value = markup
+        for method in field._stack_methods:
+            value = getattr(value, method.METHOD_NAME)(*method.args, **method.kwargs)
+        result[name] = value
+    return result
+
+
+def test_split_path():
+    assert _split_path("//a/b") == ("", "//a/b", "")
+    assert _split_path("(//a/b)[1]/@href") == ("(", "//a/b", ")[1]/@href")
+    assert _split_path("(//a/b)[last()]") == ("(", "//a/b", ")[last()]")
+    assert _split_path("(//a)[1] | //b") is None
+    assert _split_path("count(//a)") is None
+    assert _split_path("//a[@b=$c]") is None
+
+
+def test_path_prefixes():
+    assert _path_prefixes("//a[@b='/c']/d//e/text()") == [
+        "//a[@b='/c']",
+        "//a[@b='/c']/d",
+        "//a[@b='/c']/d//e",
+    ]
+    assert _path_prefixes("//a/b") == ["//a", "//a/b"]
+    assert _path_prefixes("/html/body/a") == []
+    assert _path_prefixes("//a | //b") == []
+
+
+def test_shared_prefix_tree():
+    queries = {
+        name: field._compile().head._queries[0]
+        for name, field in Product.__schema_fields__.items()
+    }
+    name_prefix = queries["name"].prefix
+    assert name_prefix is queries["names"].prefix
+    assert name_prefix.query == "//div[@class='product']/p[@class='name']"
+    assert name_prefix.parent is queries["price"].prefix
+    assert queries["price"].prefix is queries["first"].prefix
+    assert queries["css_names"].prefix is queries["css_prices"].prefix
+
+
+def test_shared_prefix_same_result():
+    schema = Product(HTML_PRODUCTS)
+    expected = _expected(Product, schema.__selector__)
+    assert expected["names"] == ["a", "nested", "b"]
+    assert expected["deep"] == ["a", "1", "nested", "b", "2"]
+    assert expected["last_i"] == "x"
+    assert schema.name == expected["name"]
+    assert schema.names == expected["names"]
+    assert schema.deep == expected["deep"]
+    assert schema.first == expected["first"]
+    assert schema.last_i == expected["last_i"]
+    assert schema.css_names == expected["css_names"]
+    assert schema.price == 1
+
+
+def test_shared_prefix_evaluated_once(monkeypatch):
+    from scrape_schema import _query
+
+    calls = []
+    original = _query._Prefix.nodes
+
+    def nodes(self, root, memo):
+        calls.append((self.query, (self.key, root) in memo))
+        return original(self, root, memo)
+
+    monkeypatch.setattr(_query._Prefix, "nodes", nodes)
+    Product(HTML_PRODUCTS)
+    evaluated = [query for query, cached in calls if not cached]
+    assert len(evaluated) == len(set(evaluated))
+    assert len(calls) > len(evaluated)
+
+
+def test_shared_prefix_nested():
+    page = Page(HTML_PRODUCTS)
+    assert page.products[0].names == ["a", "nested", "b"]
+    assert page.body_p == ["a", "1", "b", "2"]
+
+
+@pytest.mark.parametrize("markup", [HTML, "<p>text</p>", ""])
+def test_shared_prefix_no_matches(markup):
+    schema = Product(markup)
+    assert schema.names == []
+    assert schema.first is None
@@ -1,7 +1,12 @@
 # mypy: disable-error-code="assignment"
 from typing import List, Optional
 
+import pytest
+from tests.fixtures import HTML
+
 from scrape_schema import BaseSchema, Parsel
+from scrape_schema.base import Field
+from scrape_schema.context import ParseContext
 
 
 class SchemaDefaults(BaseSchema):
@@ -13,3 +18,58 @@ class SchemaDefaults(BaseSchema):
 
 def test_defaults():
     assert SchemaDefaults("a").dict() == {"a": "a", "b": None, "c": [], "d": None}
+
+
+def test_guarded_plan():
+    assert Parsel(default="a").css("a").get().strip()._compile().guarded
+    assert not Parsel().css("a").get().strip()._compile().guarded
+    assert (
+        "return _miss1" in Parsel(default="a").css("a").get().strip()._compile().source
+    )
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        Parsel(default="x").xpath("//h2/text()").get().strip().upper(),
+        Parsel(default="x").xpath("//h2/text()").get().concat_l("a"),
+        Parsel(default="x").xpath("//h2/text()").getall()[0],
+        Parsel(default="x").xpath("//h2/text()").getall()[-1],
+        Parsel(default="x").css("h2")[0].attrib["href"],
+        Parsel(default="x").css("li")[0].attrib["class"],
+        Parsel(default="x").css("li a").attrib["class"],
+        Parsel(default="x").xpath("//h1/text()").get().re_search(r"(\d+)")[1],
+        Parsel(default="x").xpath("//h1/text()").get().split(",")[5],
+    ],
+)
+def test_guarded_default_without_exception(field, monkeypatch):
+    def error_handler(*args, **kwargs):
+        raise AssertionError("exception path called")  # pragma: no cover
+
+    monkeypatch.setattr(Field, "_stack_method_error_handler", error_handler)
+    ctx = ParseContext()
+    assert field.sc_parse(HTML, ctx) == "x"
+    assert ctx.is_default and not ctx.is_success
+    assert ctx.failed_method is not None
+
+
+@pytest.mark.parametrize(
+    "field, expected",
+    [
+        (Parsel(default="x").xpath("//h2/text()").getall().join(","), ""),
+        (Parsel(default="x").xpath("//h2/text()").get().count(), 1),
+        (Parsel(default="x").xpath("//h2/text()").get().fn(lambda v: "y"), "y"),
+        (Parsel(default="x").css("h2").get("y"), "y"),
+        (Parsel(default="x").css("li a")[-1].attrib["href"], "http://scrapy.org"),
+    ],
+)
+def test_guarded_same_result(field, expected):
+    assert field.sc_parse(HTML) == expected
+
+
+def test_guarded_exception_fallback():
+    ctx = ParseContext()
+    field = Parsel(default="x").xpath("//h1/text()").get().re_search("(?P<a>H)")[2]
+    assert field.sc_parse(HTML, ctx) == "x"
+    assert ctx.is_default
+    assert str(ctx.failed_method) == "__getitem__(2)"
@@ -0,0 +1,121 @@
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, parse_all, sc_param
+from scrape_schema.base import SchemaConfig
+
+HTML = "<h1>Title</h1><ul><li>a</li><li>b</li></ul>"
+
+
+class DeferredConfig(SchemaConfig):
+    deferred = True
+
+
+class Page(BaseSchema):
+    class Config(DeferredConfig):
+        pass
+
+    title: Sc[str, Parsel().xpath("//h1/text()").get()]
+    # forward reference: resolved on the first use
+    items: Sc[List["Item"], Nested(Parsel().xpath("//li"))]
+
+    @sc_param
+    def count(self) -> int:
+        return len(self.items)
+
+
+class Item(BaseSchema):
+    class Config(DeferredConfig):
+        pass
+
+    name: Sc[str, Parsel().xpath("//li/text()").get()]
+
+
+def _deferred_schema():
+    class Schema(BaseSchema):
+        class Config(DeferredConfig):
+            pass
+
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+    return Schema
+
+
+def test_not_finalized():
+    schema = _deferred_schema()
+    assert "__schema_fields__" in schema.__dict__
+    assert not isinstance(schema.__dict__["__schema_fields__"], dict)
+
+
+def test_finalize_on_class_access():
+    schema = _deferred_schema()
+    assert list(schema.__schema_fields__) == ["title"]
+    assert isinstance(schema.__dict__["__schema_parse_order__"], tuple)
+
+
+def test_finalize_on_parse():
+    page = Page(HTML)
+    assert page.dict() == {
+        "count": 2,
+        "title": "Title",
+        "items": [{"name": "a"}, {"name": "b"}],
+    }
+    assert Page.parse_dict(HTML)["items"] == [{"name": "a"}, {"name": "b"}]
+
+
+def test_parse_all():
+    page, schema = parse_all(HTML, [Page, _deferred_schema()])
+    assert page.title == schema.title == "Title"
+
+
+def test_subclass_of_finalized_schema():
+    parent = _deferred_schema()
+    parent(HTML)
+
+    class Child(parent):
+        class Config(DeferredConfig):
+            pass
+
+        body: Sc[str, Parsel(default="").xpath("//p/text()").get()]
+
+    assert list(Child.__schema_fields__) == ["title", "body"]
+    assert Child(HTML).dict() == {"title": "Title", "body": ""}
+
+
+def test_unknown_dependency_on_first_use():
+    class Schema(BaseSchema):
+        class Config(DeferredConfig):
+            pass
+
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+        @sc_param(depends=["spam"])
+        def upper(self) -> str:
+            return self.title.upper()
+
+    with pytest.raises(ValueError, match="unknown names"):
+        Schema(HTML)
+
+
+def test_slots_not_supported():
+    with pytest.raises(TypeError, match="deferred"):
+
+        class Schema(BaseSchema):
+            class Config(DeferredConfig):
+                slots = True
+
+            title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, scrape_schema; "
+        "print(*(m for m in ('chompjs', 'colorlog', 'orjson') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,118 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.fixtures import HTML
+
+from scrape_schema import BaseSchema, Parsel, Sc
+from scrape_schema.diagnostics import DiagnosticsHook, FailureRecord, fingerprint
+from scrape_schema.hooks import register_hook, unregister_hook
+
+
+class DiagSchema(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get()]
+    missing: Sc[str, Parsel(default="x").xpath("//h2/text()").get().strip()]
+    missing_exc: Sc[str, Parsel(default="y").xpath("//h1/text()").get().fn(int)]
+
+
+class FailSchema(BaseSchema):
+    bad: Sc[int, Parsel().xpath("//h1/text()").get().fn(int)]
+
+
+@pytest.fixture
+def diagnostics(tmp_path):
+    hook = register_hook(DiagnosticsHook(tmp_path, max_samples=2, max_sample_size=64))
+    yield hook
+    unregister_hook(hook)
+
+
+def test_records(diagnostics):
+    schema = DiagSchema(HTML)
+    assert [r.field for r in diagnostics.records] == ["missing", "missing_exc"]
+    missing, missing_exc = diagnostics.records
+    assert missing.schema == "DiagSchema"
+    assert missing.method == "STRIP()"
+    assert missing.exception is None
+    assert missing_exc.exception == "ValueError"
+    assert missing_exc.is_default
+    assert missing.fingerprint == fingerprint(schema.__raw__)
+
+
+def test_error_record(diagnostics):
+    with pytest.raises(ValueError):
+        FailSchema(HTML)
+    (record,) = diagnostics.records
+    assert record.field == "bad"
+    assert record.exception == "ValueError"
+    assert not record.is_default
+
+
+def test_samples_once_per_signature(diagnostics, tmp_path):
+    for _ in range(3):
+        DiagSchema(HTML)
+    assert diagnostics.counts[diagnostics.records[0].signature] == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "sample_0000.html",
+        "sample_0000.json",
+        "sample_0001.html",
+        "sample_0001.json",
+    ]
+    assert len((tmp_path / "sample_0000.html").read_bytes()) == 64
+    meta = json.loads((tmp_path / "sample_0001.json").read_text())
+    assert meta["field"] == "missing_exc"
+    assert meta["size"] == len(HTML.encode())
+
+
+def test_samples_ring_buffer(diagnostics, tmp_path):
+    DiagSchema(HTML)
+    with pytest.raises(ValueError):
+        FailSchema(HTML)
+    assert len(list(tmp_path.iterdir())) == 4
+    meta = json.loads((tmp_path / "sample_0000.json").read_text())
+    assert meta["schema"] == "FailSchema"
+
+
+def test_samples_rate_limit(tmp_path):
+    hook = register_hook(DiagnosticsHook(tmp_path, samples_per_minute=1))
+    try:
+        DiagSchema(HTML)
+    finally:
+        unregister_hook(hook)
+    assert len(hook.records) == 2
+    assert len(list(tmp_path.glob("*.html"))) == 1
+
+
+def test_no_samples_dir():
+    hook = register_hook(DiagnosticsHook(max_records=1))
+    try:
+        DiagSchema(HTML)
+    finally:
+        unregister_hook(hook)
+    assert list(hook.records) == [
+        FailureRecord(
+            "DiagSchema",
+            "missing_exc",
+            hook.records[0].method,
+            "ValueError",
+            fingerprint(HTML),
+            True,
+        )
+    ]
+
+
+def test_input_markup_fingerprint(diagnostics, monkeypatch):
+    # input markup is hashed as is: `__raw__` is not decoded or serialized
+    monkeypatch.setattr(DiagSchema, "__raw__", property(lambda self: 1 / 0))
+    DiagSchema(HTML.encode())
+    assert {r.fingerprint for r in diagnostics.records} == {fingerprint(HTML.encode())}
+
+
+def test_threads():
+    hook = register_hook(DiagnosticsHook(max_records=10))
+    try:
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(DiagSchema, [HTML] * 200))
+    finally:
+        unregister_hook(hook)
+    assert sum(hook.counts.values()) == 400
+    assert len(hook.records) == 10
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scrape_schema import BaseSchema, Parsel, Sc
+from scrape_schema.special_methods import SpecialMethods
+
+LAYOUT_A = "<html><body><h1 class='title'>A title</h1></body></html>"
+LAYOUT_B = "<html><body><div id='title'>B title</div></body></html>"
+
+
+def _title_field(**kwargs):
+    return Parsel(**kwargs).first_of(
+        Parsel().css("h1.title::text").get(),
+        Parsel().xpath("//div[@id='title']/text()").get(),
+    )
+
+
+class Page(BaseSchema):
+    title: Sc[str, _title_field().upper()]
+
+
+class OtherPage(BaseSchema):
+    title: Sc[str, _title_field()]
+
+
+def _alternatives(schema):
+    method = schema.__schema_fields__["title"]._stack_methods[0]
+    assert method.METHOD_NAME is SpecialMethods.FIRST_OF
+    return method.args[0]
+
+
+def test_first_of():
+    assert Page(LAYOUT_A).title == "A TITLE"
+    assert Page(LAYOUT_B).title == "B TITLE"
+
+
+def test_reorder_by_hit_rate():
+    alternatives = _alternatives(Page)
+    start_tries = list(alternatives.tries)
+    for _ in range(3):
+        Page(LAYOUT_B)
+    assert alternatives.order == (1, 0)
+    # stale chain is not evaluated after reorder
+    assert alternatives.tries[0] - start_tries[0] < 3
+    tries = alternatives.tries[0]
+    Page(LAYOUT_B)
+    assert alternatives.tries[0] == tries
+    for _ in range(5):
+        Page(LAYOUT_A)
+    assert alternatives.order == (0, 1)
+
+
+def test_counters_per_schema_class():
+    before = list(_alternatives(OtherPage).hits)
+    Page(LAYOUT_A)
+    assert _alternatives(OtherPage).hits == before
+
+
+def test_counters_threads():
+    class Schema(BaseSchema):
+        title: Sc[str, _title_field()]
+
+    alternatives = _alternatives(Schema)
+    markups = [LAYOUT_A, LAYOUT_B] * 200
+    with ThreadPoolExecutor(4) as executor:
+        titles = list(executor.map(lambda m: Schema(m).title, markups))
+    assert titles == ["A title", "B title"] * 200
+    # every call counts exactly one hit
+    assert sum(alternatives.hits) == len(markups)
+    assert len(markups) <= sum(alternatives.tries) <= 2 * len(markups)
+
+
+def test_fn_error_raised():
+    def broken(value):
+        raise TypeError("bug")
+
+    class Schema(BaseSchema):
+        title: Sc[
+            str,
+            Parsel().first_of(
+                Parsel().css("h1.title::text").get().fn(broken),
+                Parsel().xpath("//div[@id='title']/text()").get(),
+            ),
+        ]
+
+    with pytest.raises(TypeError, match="bug"):
+        Schema(LAYOUT_A)
+
+
+def test_extraction_error_fails_chain():
+    class Schema(BaseSchema):
+        title: Sc[
+            str,
+            Parsel().first_of(
+                Parsel().xpath("//h1/text()").getall()[3],
+                Parsel().xpath("//h1/text()").get(),
+            ),
+        ]
+
+    assert Schema(LAYOUT_A).title == "A title"
+
+
+def test_all_failed():
+    class Default(BaseSchema):
+        title: Sc[str, _title_field(default="x").upper()]
+
+    class Required(BaseSchema):
+        title: Sc[str, _title_field().upper()]
+
+    markup = "<html><body><p>empty</p></body></html>"
+    assert Default(markup).title == "x"
+    with pytest.raises(AttributeError):
+        Required(markup)
+
+
+def test_first_of_required_chain():
+    with pytest.raises(TypeError):
+        Parsel().first_of()
@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+from parsel import Selector
+from tests.fixtures import HTML
+
+from scrape_schema import BaseSchema, Parsel, Sc
+from scrape_schema.hooks import (
+    HOOKS,
+    BaseHook,
+    LoggingHook,
+    LoggingStepsHook,
+    register_hook,
+    unregister_hook,
+)
+
+
+class HooksSchema(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get().upper()]
+    count: Sc[int, Parsel().xpath("//li").getall().count()]
+    missing: Sc[str, Parsel(default="x").xpath("//h2/text()").get().strip()]
+    missing_exc: Sc[str, Parsel(default="y").xpath("//h1/text()").get().fn(int)]
+
+
+class EventsHook(BaseHook):
+    def __init__(self):
+        self.events = []
+
+    def on_field_start(self, schema, name, field):
+        self.events.append(("start", name))
+
+    def on_field_end(self, schema, name, value, ctx):
+        self.events.append(("end", name, value))
+
+    def on_cast(self, schema, name, type_, value, result):
+        self.events.append(("cast", name, value, result))
+
+    def on_default(self, field, method, error, default):
+        self.events.append(("default", repr(method), type(error), default))
+
+
+class StepsHook(BaseHook):
+    def __init__(self):
+        self.steps = []
+
+    def on_step(self, field, method, value):
+        self.steps.append((repr(method), value))
+
+
+@pytest.fixture
+def hook(request):
+    hook = register_hook(request.param())
+    yield hook
+    unregister_hook(hook)
+
+
+def test_no_hooks_registered():
+    assert HOOKS.hooks == []
+    assert not any(
+        (HOOKS.on_field_start, HOOKS.on_step, HOOKS.on_field_end, HOOKS.on_cast)
+    )
+
+
+def test_no_serialization_without_hooks(monkeypatch):
+    def get(self):
+        raise AssertionError("Selector serialized")  # pragma: no cover
+
+    selector = Selector(HTML)
+    monkeypatch.setattr(Selector, "get", get)
+    for field in HooksSchema.__schema_fields__.values():
+        field.sc_parse(selector)
+
+
+@pytest.mark.parametrize("hook", [EventsHook], indirect=True)
+def test_events(hook):
+    HooksSchema(HTML)
+    assert hook.events[:4] == [
+        ("start", "title"),
+        ("cast", "title", "HELLO, PARSEL!", "HELLO, PARSEL!"),
+        ("end", "title", "HELLO, PARSEL!"),
+        ("start", "count"),
+    ]
+    assert ("default", "STRIP()", type(None), "x") in hook.events
+    assert (
+        "default",
+        repr(HooksSchema.__schema_fields__["missing_exc"]._stack_methods[-1]),
+        ValueError,
+        "y",
+    ) in hook.events
+    assert ("end", "missing", "x") in hook.events
+
+
+@pytest.mark.parametrize("hook", [StepsHook], indirect=True)
+def test_steps(hook):
+    schema = HooksSchema(HTML)
+    assert schema.title == "HELLO, PARSEL!"
+    assert schema.missing == "x"
+    assert ("UPPER()", "HELLO, PARSEL!") in hook.steps
+    assert ("COUNT()", 2) in hook.steps
+
+
+def test_only_overridden_events():
+    hook = register_hook(StepsHook())
+    try:
+        assert HOOKS.on_step == [hook.on_step]
+        assert HOOKS.on_default == []
+    finally:
+        unregister_hook(hook)
+    assert HOOKS.on_step == []
+
+
+@pytest.mark.parametrize("hook_cls", [LoggingHook, LoggingStepsHook])
+def test_logging_hook(caplog, hook_cls):
+    hook = register_hook(hook_cls())
+    try:
+        with caplog.at_level(logging.DEBUG, logger="scrape_schema"):
+            HooksSchema(HTML)
+    finally:
+        unregister_hook(hook)
+    assert "HooksSchema.title = HELLO, PARSEL!" in caplog.text
+    assert "set default value: x" in caplog.text
+    assert "throw exception `ValueError" in caplog.text
+    assert ("get() -> Hello, Parsel!" in caplog.text) is (hook_cls is LoggingStepsHook)
+
+
+def test_logger_default_level():
+    logger = logging.getLogger("scrape_schema")
+    assert logger.level == logging.NOTSET
+    assert all(isinstance(h, logging.NullHandler) for h in logger.handlers)
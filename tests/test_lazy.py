@@ -0,0 +1,96 @@
+from typing import List
+
+import pytest
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, sc_param
+from scrape_schema.base import SchemaConfig
+from scrape_schema.hooks import BaseHook, register_hook, unregister_hook
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    price: Sc[int, Parsel().xpath("//div[@class='price']/text()").get()]
+
+
+class LazyConfig(SchemaConfig):
+    lazy = True
+
+
+class Page(BaseSchema):
+    class Config(LazyConfig):
+        pass
+
+    first: Sc[str, Parsel().xpath("//p/text()").get()]
+    count: Sc[int, Parsel().xpath("//li").getall().count()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+    broken: Sc[str, Parsel().xpath("//h1/text()").get().strip()]
+
+    @sc_param
+    def first_upper(self) -> str:
+        return self.first.upper()
+
+
+class Eager(Page):
+    class Config(SchemaConfig):
+        pass
+
+    broken: Sc[str, Parsel(default="x").xpath("//h1/text()").get().strip()]
+
+
+class FieldsHook(BaseHook):
+    def __init__(self):
+        self.fields = []
+
+    def on_field_start(self, schema, name, field):
+        self.fields.append(name)
+
+
+@pytest.fixture
+def hook():
+    hook = register_hook(FieldsHook())
+    yield hook
+    unregister_hook(hook)
+
+
+def test_lazy_parse_on_access(hook):
+    page = Page(HTML_FOR_SCHEMA)
+    assert hook.fields == []
+    assert page.first == "audi"
+    assert page.first == "audi"
+    assert hook.fields == ["first"]
+    assert page.first_upper == "AUDI"
+    assert page.count == 5
+    assert hook.fields == ["first", "count"]
+
+
+def test_lazy_error_on_access():
+    page = Page(HTML_FOR_SCHEMA)
+    with pytest.raises(AttributeError):
+        page.broken
+    assert page.count == 5
+
+
+def test_lazy_dict(hook):
+    class Lazy(Eager):
+        class Config(LazyConfig):
+            pass
+
+    page = Lazy(HTML_FOR_SCHEMA)
+    assert page.count == 5
+    assert page.dict() == Eager(HTML_FOR_SCHEMA).dict()
+    assert list(page.dict()) == ["first", "count", "items", "broken"]
+    assert repr(page) == repr(Eager(HTML_FOR_SCHEMA)).replace("Eager", "Lazy")
+
+
+def test_lazy_assign():
+    page = Page(HTML_FOR_SCHEMA)
+    page.first = "spam"
+    assert page.first == "spam"
+    assert page.first_upper == "SPAM"
+
+
+def test_eager_subclass_of_lazy():
+    eager = Eager(HTML_FOR_SCHEMA)
+    assert eager.__dict__["first"] == "audi"
+    assert eager.broken == "x"
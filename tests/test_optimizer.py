@@ -0,0 +1,144 @@
+import pytest
+from parsel import Selector
+from tests.fixtures import HTML, HTML_FOR_SCHEMA
+
+from scrape_schema import Parsel
+from scrape_schema._optimizer import optimize_methods
+from scrape_schema.special_methods import MarkupMethod
+
+
+def _queries(field):
+    return [
+        m.args[0]
+        for m in optimize_methods(field._stack_methods)
+        if m.METHOD_NAME == "xpath"
+    ]
+
+
+@pytest.mark.parametrize(
+    "field,expected",
+    [
+        (Parsel().xpath("//li/a").get(), ["(//li/a)[1]"]),
+        (Parsel().xpath("//li/a/@href").getall()[0], ["(//li/a/@href)[1]"]),
+        (Parsel().xpath("//li/a/@href").getall()[-1], ["(//li/a/@href)[last()]"]),
+        (Parsel().xpath("//li")[-1], ["(//li)[last()]"]),
+        (Parsel().xpath("//li/a/text()").getall()[1], ["(//li/a/text())[2]"]),
+        (Parsel().css("li > a").get(), ["(descendant-or-self::li/a)[1]"]),
+        (Parsel().xpath("//li/a").attrib.get(key="href"), ["(//li/a)[1]/@href"]),
+    ],
+)
+def test_rewrite(field, expected):
+    assert _queries(field) == expected
+    assert len(field._stack_methods) >= len(optimize_methods(field._stack_methods))
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        Parsel().xpath("count(//li)").get(),
+        Parsel().xpath("//li/a = 'x'").get(),
+        Parsel().xpath(".//li/a/text()").getall()[1],
+        Parsel().xpath("//ul").xpath("//li/a/text()").getall()[1],
+        Parsel().css("li > a::text").getall()[1],
+        Parsel().xpath("//li/a/text()").getall()[-2],
+        Parsel().xpath("./li/a").attrib.get(key="href"),
+        Parsel().xpath("//li/a/text()").attrib.get(key="href"),
+        Parsel().css("input:checked").get(),
+        Parsel().css("a").attrib["href"],
+        Parsel().xpath("//li/a").attrib["href"],
+    ],
+)
+def test_not_rewrite(field):
+    assert optimize_methods(field._stack_methods) == list(field._stack_methods)
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        Parsel().xpath("//li/a").get(),
+        Parsel().xpath("//li/a/@href").getall()[0],
+        Parsel().xpath("//li/a/@href").getall()[-1],
+        Parsel().xpath("//ul").xpath("./li/a/@href").getall()[-1],
+        Parsel().xpath("//ul/li").xpath("./a/@href").get(),
+        Parsel().xpath("//ul/li").css("a")[-1].attrib,
+        Parsel().xpath("//li/a").attrib.get(key="href"),
+        Parsel().xpath("//li/b").attrib.get(key="href"),
+    ],
+)
+def test_same_result(field):
+    expected = Selector(HTML)
+    for method in field._stack_methods:
+        if method.METHOD_NAME == "attrib":
+            expected = expected.attrib
+        else:
+            expected = getattr(expected, method.METHOD_NAME)(
+                *method.args, **method.kwargs
+            )
+    assert field.sc_parse(HTML) == expected
+    assert field._plan.methods != tuple(field._stack_methods)
+
+
+@pytest.mark.parametrize("query, key", [("//li/b", "href"), ("//li/a", "spam")])
+def test_attrib_getitem_key_error(query, key):
+    with pytest.raises(KeyError):
+        Parsel().xpath(query).attrib[key].sc_parse(HTML)
+
+
+def test_attrib_get_key_kwarg():
+    methods = [
+        MarkupMethod("xpath", args=("//li/a",)),
+        MarkupMethod("attrib"),
+        MarkupMethod("get", kwargs={"key": "href"}),
+    ]
+    assert optimize_methods(methods) == [
+        MarkupMethod("xpath", args=("(//li/a)[1]/@href",)),
+        MarkupMethod("get", args=(None,)),
+    ]
+
+
+def _expected(markup, field):
+    expected = markup
+    try:
+        for method in field._stack_methods:
+            expected = getattr(expected, method.METHOD_NAME)(
+                *method.args, **method.kwargs
+            )
+    except IndexError:
+        return "missed"
+    return expected
+
+
+@pytest.mark.parametrize(
+    "query", ["//li/a/@href", "//li/a/text()", "//div/p | //li", "//li/b"]
+)
+@pytest.mark.parametrize("index", range(6))
+def test_getall_index_same_result(query, index):
+    field = Parsel(default="missed").xpath(query).getall()[index]
+    if index:
+        assert _queries(field) == [f"({query})[{index + 1}]"]
+    assert field.sc_parse(HTML) == _expected(Selector(HTML), field)
+    # first repetition of absolute query result per SelectorList element
+    sel_list = Selector(HTML).xpath("//li")
+    if index < len(Selector(HTML).xpath(query)):
+        assert field.sc_parse(sel_list) == _expected(sel_list, field)
+
+
+def test_default_value():
+    assert Parsel(default="x").xpath("//li/b").attrib["href"].sc_parse(HTML) == "x"
+
+
+def test_same_result_selector_list():
+    sel_list = Selector(HTML_FOR_SCHEMA).xpath("//li")
+    field = Parsel().xpath("./div").attrib.get(key="class")
+    assert field.sc_parse(sel_list) == "price"
+    field = Parsel().xpath("//li/div").attrib.get(key="class")
+    assert field.sc_parse(sel_list) == "price"
+    assert Parsel().xpath("./div/text()").getall()[-1].sc_parse(sel_list) == "25000"
+
+
+def test_keep_namespaces_and_variables():
+    methods = [MarkupMethod("xpath", args=("//a[@x=$v]", {"x": "y"}), kwargs={"v": 1})]
+    methods.append(MarkupMethod("get", args=(None,)))
+    assert optimize_methods(methods)[0] == MarkupMethod(
+        "xpath", args=("(//a[@x=$v])[1]", {"x": "y"}), kwargs={"v": 1}
+    )
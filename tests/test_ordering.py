@@ -0,0 +1,97 @@
+from typing import List
+
+import pytest
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc
+from scrape_schema._ordering import field_cost
+from scrape_schema.base import SchemaConfig
+
+CALLS: List[str] = []
+
+
+def _track(name):
+    def wrapper(value):
+        CALLS.append(name)
+        return value
+
+    return wrapper
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath(".//p/text()").get()]
+
+
+class Page(BaseSchema):
+    optional: Sc[str, Parsel(default="x").xpath("//p/text()").get().fn(_track("opt"))]
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+    expensive: Sc[
+        List[str],
+        Parsel().xpath("//li").xpath("./p/text()").getall().fn(_track("exp")),
+    ]
+    cheap: Sc[str, Parsel().xpath("//p/text()").get().fn(_track("cheap"))]
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def test_field_cost():
+    fields = Page.__schema_fields__
+    assert field_cost(fields["cheap"]) < field_cost(fields["expensive"])
+    assert field_cost(fields["expensive"]) < field_cost(fields["items"])
+
+
+def test_css_query_cost():
+    relative = Parsel().xpath("./p").get()
+    assert field_cost(Parsel().css(".price").get()) > field_cost(relative)
+    assert field_cost(Parsel().css("@x").get()) > field_cost(relative)
+
+
+def test_required_first():
+    assert Page.__schema_parse_order__ == ("cheap", "expensive", "items", "optional")
+    page = Page(HTML_FOR_SCHEMA)
+    assert CALLS == ["cheap", "exp", "opt"]
+    # values are set in declaration order
+    assert list(page.dict()) == ["optional", "items", "expensive", "cheap"]
+
+
+def test_required_failure_skips_optional():
+    class Fail(Page):
+        missing: Sc[str, Parsel().xpath("//h1/text()").get().strip()]
+
+    with pytest.raises(AttributeError):
+        Fail(HTML_FOR_SCHEMA)
+    assert "opt" not in CALLS
+
+
+def test_declared_order():
+    class Declared(Page):
+        class Config(SchemaConfig):
+            fields_order = "declared"
+
+    Declared(HTML_FOR_SCHEMA)
+    assert CALLS == ["opt", "exp", "cheap"]
+
+
+def test_explicit_order():
+    class Explicit(Page):
+        class Config(SchemaConfig):
+            fields_order = ["optional", "expensive"]
+
+    assert Explicit.__schema_parse_order__ == (
+        "optional",
+        "expensive",
+        "cheap",
+        "items",
+    )
+
+
+@pytest.mark.parametrize("order", ["spam", ["spam"]])
+def test_invalid_order(order):
+    with pytest.raises(ValueError):
+
+        class Invalid(Page):
+            class Config(SchemaConfig):
+                fields_order = order
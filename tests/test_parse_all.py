@@ -0,0 +1,146 @@
+from typing import List
+
+import pytest
+from parsel import Selector
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, parse_all
+from scrape_schema.base import SchemaConfig
+
+HTML = """<html><head><title>Страница</title></head><body>
+<nav class="bc"><a>home</a><a>catalog</a></nav>
+<div class="product"><h1>Product</h1><span class="price">10</span>
+<ul><li>a</li><li>b</li></ul></div>
+</body></html>"""
+
+
+class Product(BaseSchema):
+    name: Sc[str, Parsel().xpath("//div[@class='product']/h1/text()").get()]
+    price: Sc[int, Parsel().xpath("//div[@class='product']/span/text()").get()]
+
+
+class Crumbs(BaseSchema):
+    crumbs: Sc[List[str], Parsel().xpath("//nav[@class='bc']/a/text()").getall()]
+    tags: Sc[List[str], Parsel().xpath("//div[@class='product']/ul/li/text()").getall()]
+
+
+class Tag(BaseSchema):
+    text: Sc[str, Parsel().xpath("//li/text()").get()]
+
+
+class Meta(BaseSchema):
+    title: Sc[str, Parsel().xpath("//title/text()").get()]
+    tags: Sc[List[Tag], Nested(Parsel().xpath("//li"))]
+
+
+SCHEMAS = [Product, Crumbs, Meta]
+
+
+@pytest.mark.parametrize("markup", [HTML, HTML.encode(), Selector(HTML)])
+def test_parse_all(markup):
+    results = parse_all(markup, SCHEMAS)
+    assert [type(result) for result in results] == SCHEMAS
+    assert [result.dict() for result in results] == [
+        schema(HTML).dict() for schema in SCHEMAS
+    ]
+
+
+def test_shared_document():
+    results = parse_all(HTML.encode(), SCHEMAS)
+    selector = results[0].__selector__
+    assert all(result.__selector__ is selector for result in results)
+    # decoded once
+    assert all(result.__raw__ is results[0].__raw__ for result in results)
+    assert results[0].__raw__ == HTML
+
+
+def test_shared_prefixes(monkeypatch):
+    from scrape_schema import _query
+
+    calls = []
+    original = _query._Prefix.nodes
+
+    def nodes(self, root, memo):
+        if (self.key, root) not in memo:
+            calls.append(self.query)
+        return original(self, root, memo)
+
+    parse_all(HTML, SCHEMAS)
+    monkeypatch.setattr(_query._Prefix, "nodes", nodes)
+    parse_all(HTML, SCHEMAS)
+    # `//div[@class='product']` is shared by Product and Crumbs fields
+    assert calls.count("//div[@class='product']") == 1
+
+
+def _class_prefixes(schemas):
+    return [
+        query._shared
+        for schema in schemas
+        for head in schema.__schema_query_heads__
+        for query in head._queries
+    ]
+
+
+def test_schemas_queries_not_changed():
+    before = _class_prefixes(SCHEMAS)
+    parse_all(HTML, SCHEMAS)
+    parse_all(HTML, [Product, Crumbs])
+    after = _class_prefixes(SCHEMAS)
+    assert all(a is b for a, b in zip(before, after))
+
+
+def test_groups_do_not_override(monkeypatch):
+    from scrape_schema import _query
+
+    parse_all(HTML, [Product, Crumbs])
+    parse_all(HTML, [Product, Meta])
+    calls = []
+    original = _query._Prefix.nodes
+
+    def nodes(self, root, memo):
+        if (self.key, root) not in memo:
+            calls.append(self.query)
+        return original(self, root, memo)
+
+    monkeypatch.setattr(_query._Prefix, "nodes", nodes)
+    product, crumbs = parse_all(HTML, [Product, Crumbs])
+    assert calls.count("//div[@class='product']") == 1
+    assert product.dict() == Product(HTML).dict()
+    assert crumbs.dict() == Crumbs(HTML).dict()
+
+
+def test_different_configs():
+    class XmlProduct(Product):
+        class Config(SchemaConfig):
+            selector_kwargs = {"type": "xml"}
+
+    html, xml = parse_all(HTML, [Product, XmlProduct])
+    assert html.__selector__.type == "html"
+    assert xml.__selector__.type == "xml"
+    assert xml.dict() == html.dict()
+
+
+def test_retention_is_per_schema():
+    class Released(Product):
+        class Config(SchemaConfig):
+            retain = "none"
+
+    released, product = parse_all(HTML, [Released, Product])
+    assert released._cached_parser is None
+    assert product.__selector__ is not None
+    assert product.__raw__ is HTML
+
+
+def test_budgets():
+    class Limited(Product):
+        class Config(SchemaConfig):
+            max_markup_size = 10
+
+    limited, product = parse_all(HTML, [Limited, Product])
+    assert limited.__sc_budget_error__.budget == "max_markup_size"
+    assert limited.__raw__ is HTML
+    assert product.name == "Product"
+
+
+def test_invalid_markup():
+    with pytest.raises(TypeError):
+        parse_all(1, SCHEMAS)  # type: ignore[arg-type]
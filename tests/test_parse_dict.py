@@ -0,0 +1,173 @@
+import gc
+import weakref
+from typing import List
+
+import pytest
+from parsel import Selector
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, base, sc_param
+from scrape_schema.base import SchemaConfig
+from scrape_schema.hooks import BaseHook, register_hook, unregister_hook
+
+HTML = """
+<h1>Title</h1>
+<ul>
+<li><p>a</p><b>1</b></li>
+<li><p>b</p><b>2</b></li>
+</ul>
+"""
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    count: Sc[int, Parsel(alias="cnt").xpath("//b/text()").get()]
+
+
+class Page(BaseSchema):
+    title: Sc[str, Parsel(alias="header").xpath("//h1/text()").get()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//li"))]
+    first: Sc[Item, Nested(Parsel().xpath("//li")[0])]
+    _hidden: Sc[str, Parsel().xpath("//p/text()").get()]
+
+
+class ParamItem(Item):
+    @sc_param
+    def double(self) -> int:
+        return self.count * 2
+
+
+class ParamPage(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get()]
+    items: Sc[List[ParamItem], Nested(Parsel().xpath("//li"))]
+
+
+def _no_instances(monkeypatch):
+    def dict_(self, *_, **__):  # pragma: no cover
+        raise AssertionError("schema object is created")
+
+    monkeypatch.setattr(BaseSchema, "dict", dict_)
+    monkeypatch.setattr(BaseSchema, "to_tuple", dict_)
+    monkeypatch.setattr(BaseSchema, "_sc_init", dict_)
+
+
+def test_parse_dict(monkeypatch):
+    expected = Page(HTML).dict()
+    _no_instances(monkeypatch)
+    assert Page.parse_dict(HTML) == expected
+    assert Page.parse_dict(HTML.encode()) == expected
+    assert list(Page.parse_dict(HTML, by_alias=False)) == ["title", "items", "first"]
+
+
+def test_parse_tuple(monkeypatch):
+    expected = Page(HTML).to_tuple()
+    _no_instances(monkeypatch)
+    assert (
+        Page.parse_tuple(HTML)
+        == expected
+        == (
+            "Title",
+            [("a", 1), ("b", 2)],
+            ("a", 1),
+        )
+    )
+
+
+def test_projection(monkeypatch):
+    include = {"items": {"count"}, "title": True}
+    expected = Page(HTML, include=include).dict()
+    _no_instances(monkeypatch)
+    assert Page.parse_dict(HTML, include=include) == expected
+    assert Page.parse_tuple(HTML, exclude={"items", "first"}) == ("Title",)
+
+
+def test_sc_param_schema(monkeypatch):
+    expected = ParamPage(HTML).dict()
+    created = []
+    sc_init = BaseSchema._sc_init
+
+    def counted(self, *args, **kwargs):
+        created.append(type(self).__name__)
+        return sc_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(BaseSchema, "_sc_init", counted)
+    assert ParamPage.parse_dict(HTML) == expected
+    # only schemas with sc_param properties are created
+    assert created == ["ParamItem", "ParamItem"]
+    assert ParamPage.parse_dict(HTML)["items"][1] == {
+        "double": 4,
+        "name": "b",
+        "cnt": 2,
+    }
+    assert ParamPage.parse_tuple(HTML) == ("Title", [("a", 1, 2), ("b", 2, 4)])
+
+
+def test_lazy_and_budgets():
+    class Limited(Page):
+        class Config(SchemaConfig):
+            lazy = True
+            max_nested_items = 1
+
+    result = Limited.parse_dict(HTML)
+    assert result["items"] == [{"name": "a", "cnt": 1}]
+    assert result["header"] == "Title"
+
+
+def test_invalid_projection():
+    with pytest.raises(TypeError, match="not both"):
+        Page.parse_dict(HTML, include={"title"}, exclude={"items"})
+
+
+def test_projected_sc_param_without_depends():
+    class LinkPage(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+        url: Sc[str, Parsel().xpath("//p/text()").get()]
+
+        @sc_param
+        def full_url(self) -> str:
+            return f"https://example.com/{self.url}"
+
+    assert LinkPage.parse_dict(HTML, include={"full_url"}) == {
+        "full_url": "https://example.com/a"
+    }
+    assert LinkPage.parse_tuple(HTML, exclude={"url"}) == (
+        "Title",
+        "https://example.com/a",
+    )
+
+
+def test_selector_released(monkeypatch):
+    trees = []
+
+    class TrackedSelector(Selector):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            trees.append(weakref.ref(self))
+
+    monkeypatch.setattr(base, "Selector", TrackedSelector)
+    result = Page.parse_dict(HTML)
+    gc.collect()
+    assert trees and all(ref() is None for ref in trees)
+    assert result["items"][1] == {"name": "b", "cnt": 2}
+
+
+def test_hooks_get_schema_class():
+    class Names(BaseHook):
+        def __init__(self):
+            self.names = []
+
+        def on_field_end(self, schema, name, value, ctx):
+            self.names.append(f"{schema.__schema_name__}.{name}")
+
+    hook = register_hook(Names())
+    try:
+        Page.parse_tuple(HTML)
+    finally:
+        unregister_hook(hook)
+    assert set(hook.names) == {
+        "Page.title",
+        "Page.items",
+        "Page.first",
+        "Page._hidden",
+        "Item.name",
+        "Item.count",
+    }
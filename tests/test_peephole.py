@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from scrape_schema import Parsel
+from scrape_schema._peephole import _REGEX_MIN_COUNT, _TRANSLATE_MIN_COUNT, _Op
+from scrape_schema.special_methods import (
+    DEFAULT_SPEC_METHOD_HANDLER,
+    SpecialMethods,
+    SpecialMethodsHandler,
+    StripMethod,
+)
+
+VALUES = ["  Hello,\n\tWorld!  ", "aabbcc", "", "xXx  yyy\r\n", "ẞtraße ΣΑΣ"]
+
+
+def _reference(field, value):
+    """apply special methods one by one by strategies"""
+    for method in field._stack_methods:
+        value = DEFAULT_SPEC_METHOD_HANDLER.handle(method, value)
+    return value
+
+
+def _random_field(rnd):
+    field = Parsel()
+    for _ in range(rnd.randint(2, 12)):
+        name = rnd.choice(
+            [
+                "replace",
+                "strip",
+                "lstrip",
+                "rstrip",
+                "concat_l",
+                "concat_r",
+                "lower",
+                "upper",
+            ]
+        )
+        chars = rnd.choice([None, " ", "x", "\n "])
+        text = rnd.choice(["", "a", "b", "x", " ", "ab", "bc", "\n", "ß"])
+        if name == "replace":
+            field = field.replace(text or "a", rnd.choice(["", "b", "x", "AB", "a"]))
+        elif name in ("strip", "lstrip", "rstrip"):
+            field = getattr(field, name)(chars)
+        elif name in ("concat_l", "concat_r"):
+            field = getattr(field, name)(text)
+        else:
+            field = getattr(field, name)()
+    return field
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_fused_equal_to_strategies(seed):
+    field = _random_field(random.Random(seed))
+    for value in VALUES:
+        assert field._compile()(value) == _reference(field, value)
+    assert field._compile()(VALUES) == _reference(field, VALUES)
+
+
+def test_translate_table():
+    chars = "abcdefghijklmnopqrstuvwxyz"[:_TRANSLATE_MIN_COUNT]
+    field = Parsel()
+    for old, new in zip(chars, chars[1:] + "!"):
+        field = field.replace(old, new)
+    assert ".translate(" in field._compile().source
+    for value in VALUES + [chars]:
+        assert field._compile()(value) == _reference(field, value)
+
+
+def test_alternation_regex():
+    field = Parsel()
+    for i in range(_REGEX_MIN_COUNT):
+        field = field.replace(f"<{i}>", "_" if i % 2 else "\\")
+    assert ".translate(" not in field._compile().source
+    assert ".replace(" not in field._compile().source
+    value = "".join(f"<{i}> x <{i}>" for i in range(_REGEX_MIN_COUNT))
+    assert field._compile()(value) == _reference(field, value)
+
+
+@pytest.mark.parametrize(
+    "replaces",
+    [
+        # overlapped olds
+        [("ab", "x"), ("bc", "y")],
+        # new contains later old chars
+        [("a", "bc"), ("bc", "z")],
+        # removed text joins later old
+        [("x", ""), ("ab", "z")],
+    ],
+)
+def test_dependent_replaces_not_merged(replaces):
+    field = Parsel()
+    for i in range(_REGEX_MIN_COUNT):
+        old, new = replaces[i % len(replaces)]
+        field = field.replace(old * (i // len(replaces) + 1), new)
+    assert ".replace(" in field._compile().source
+    for value in ["abc", "axbc", "aaxbb", "abcabc"]:
+        assert field._compile()(value) == _reference(field, value)
+
+
+def test_merged_strip_and_concat():
+    field = Parsel().lstrip().rstrip().concat_l("b").concat_l("a").concat_r("c")
+    source = field._compile().source
+    assert ".strip()" in source and "lstrip" not in source
+    assert field._compile()(" x ") == "abxc"
+
+
+def test_keep_original_chain():
+    field = Parsel().strip().strip().lower().lower()
+    plan = field._compile()
+    assert plan.methods == tuple(field._stack_methods)
+    assert repr(field).count("STRIP") == 2
+
+
+def test_custom_strategy_kernel():
+    class UnderscoreStripMethod(StripMethod):
+        def kernel(self, method):
+            return lambda s: s.strip("_")
+
+    handler = SpecialMethodsHandler()
+    handler.spec_methods_dict.update(DEFAULT_SPEC_METHOD_HANDLER.spec_methods_dict)
+    handler.add_method(SpecialMethods.STRIP, UnderscoreStripMethod())
+    field = Parsel().strip().upper()
+    object.__setattr__(field, "_spec_method_handler", handler)
+    assert field._compile()("__a__") == "A"
+
+
+def test_op_render_required():
+    class NoRender(_Op):
+        pass
+
+    with pytest.raises(TypeError):
+        _Op()  # type: ignore[abstract]
+    with pytest.raises(TypeError):
+        NoRender()  # type: ignore[abstract]
@@ -0,0 +1,143 @@
+from typing import List
+
+import pytest
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, sc_param
+from scrape_schema.hooks import BaseHook, register_hook, unregister_hook
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    price: Sc[int, Parsel().xpath("//div[@class='price']/text()").get()]
+
+    @sc_param
+    def label(self) -> str:
+        return f"{self.name}: {self.price}"
+
+
+class Page(BaseSchema):
+    first: Sc[str, Parsel().xpath("//p/text()").get()]
+    count: Sc[int, Parsel().xpath("//li").getall().count()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+
+    @sc_param(depends=["first"])
+    def first_upper(self) -> str:
+        return self.first.upper()
+
+
+class FieldsHook(BaseHook):
+    def __init__(self):
+        self.fields = []
+
+    def on_field_start(self, schema, name, field):
+        self.fields.append(f"{schema.__schema_name__}.{name}")
+
+
+@pytest.fixture
+def hook():
+    hook = register_hook(FieldsHook())
+    yield hook
+    unregister_hook(hook)
+
+
+def test_include(hook):
+    page = Page(HTML_FOR_SCHEMA, include={"count"})
+    assert hook.fields == ["Page.count"]
+    assert page.dict() == {"count": 5}
+    assert repr(page) == "Page(count:int=5)"
+
+
+def test_include_nested(hook):
+    page = Page(
+        HTML_FOR_SCHEMA,
+        include={"items": {"price"}, "first": True, "first_upper": True},
+    )
+    assert "Item.name" not in hook.fields
+    assert page.dict() == {
+        "first_upper": "AUDI",
+        "first": "audi",
+        "items": [{"price": p} for p in (10000, 99999999, 50000, 20000, 25000)],
+    }
+
+
+def test_include_sc_param():
+    page = Page(HTML_FOR_SCHEMA, include={"items": {"name", "price", "label"}})
+    assert page.dict()["items"][0] == {
+        "label": "audi: 10000",
+        "name": "audi",
+        "price": 10000,
+    }
+
+
+def test_exclude(hook):
+    page = Page(HTML_FOR_SCHEMA, exclude={"count": True, "items": {"price", "label"}})
+    assert "Page.count" not in hook.fields
+    assert "Item.price" not in hook.fields
+    assert page.dict() == {
+        "first_upper": "AUDI",
+        "first": "audi",
+        "items": [
+            {"name": n} for n in ("audi", "ferrari", "bentley", "ford", "suzuki")
+        ],
+    }
+
+
+def test_projection_cached():
+    Page(HTML_FOR_SCHEMA, include={"items": {"price"}})
+    cache = Page.__dict__["__sc_projections__"]
+    size = len(cache)
+    page = Page(HTML_FOR_SCHEMA, include={"items": ["price"]})
+    assert len(cache) == size
+    assert page.__sc_projection__ in cache.values()
+    assert Page(HTML_FOR_SCHEMA).__sc_projection__ is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"include": {"spam"}}, ValueError),
+        ({"include": {"first": {"spam"}}}, ValueError),
+        ({"include": {"first_upper": {"spam"}}}, ValueError),
+        ({"include": {"items": {"spam"}}}, ValueError),
+        ({"include": "first"}, TypeError),
+        ({"include": {"first"}, "exclude": {"count"}}, TypeError),
+    ],
+)
+def test_invalid_projection(kwargs, error):
+    with pytest.raises(error):
+        Page(HTML_FOR_SCHEMA, **kwargs)
+
+
+class LinkPage(BaseSchema):
+    title: Sc[str, Parsel().xpath("//p/text()").get()]
+    url: Sc[str, Parsel().xpath("//a/@href").get()]
+
+    # without `depends`: depends on all fields
+    @sc_param
+    def full_url(self) -> str:
+        return f"https://example.com{self.url}"
+
+
+LINK_HTML = '<p>title</p><a href="/path">link</a>'
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"include": {"full_url"}}, {"full_url": "https://example.com/path"}),
+        (
+            {"include": {"title", "full_url"}},
+            {"full_url": "https://example.com/path", "title": "title"},
+        ),
+        (
+            {"exclude": {"url"}},
+            {"full_url": "https://example.com/path", "title": "title"},
+        ),
+    ],
+)
+def test_sc_param_without_depends(kwargs, expected):
+    page = LinkPage(LINK_HTML, **kwargs)
+    assert page.dict() == expected
+    assert page.url == "/path"
+    assert LinkPage.parse_dict(LINK_HTML, **kwargs) == expected
@@ -0,0 +1,107 @@
+import pytest
+from parsel import Selector
+from tests.fixtures import HTML, HTML_FOR_SCHEMA
+
+from scrape_schema import Parsel
+from scrape_schema._query import QueryChain, lower_query_chain
+from scrape_schema.context import ParseContext
+
+XML = """<?xml version="1.0"?>
+<root><Item id="1">a</Item><Item id="2">b</Item><item id="3">c</item></root>
+"""
+
+
+def _parsel(markup, methods):
+    """reference implementation: call Parsel methods as is"""
+    for method in methods:
+        if method.METHOD_NAME == "attrib":
+            markup = markup.attrib
+        else:
+            markup = getattr(markup, method.METHOD_NAME)(*method.args, **method.kwargs)
+    return markup
+
+
+FIELDS = [
+    Parsel().xpath("//li/a").get(),
+    Parsel().xpath("//li/a/@href").getall(),
+    Parsel().xpath("//li/a/text()").getall(),
+    Parsel().xpath("count(//li)").get(),
+    Parsel().xpath("//li").xpath("./a").xpath("@href").getall(),
+    Parsel().xpath("//li/a/text()").xpath(".").getall(),
+    Parsel().xpath("//li/a/text()").xpath("./b").getall(),
+    Parsel().css("li > a::attr(href)").getall(),
+    Parsel().css("ul").css("a").attrib,
+    Parsel().css("li a").attrib.get(key="href"),
+    Parsel().css("li b").attrib.get(key="href"),
+    Parsel().css("li a").re(r"Link \d"),
+    Parsel().css("li")[-1].xpath("a/text()").get(),
+    Parsel().css("li").getall()[-1],
+    Parsel().xpath("//a[@href=$url]/text()", url="http://scrapy.org").get(),
+    Parsel().xpath("//li[re:test(., 'Link 2')]/a/@href").get(),
+    Parsel().xpath("//body/h2").get(default="missing"),
+]
+
+
+@pytest.mark.parametrize("field", FIELDS)
+def test_same_result(field):
+    for markup in (
+        Selector(HTML),
+        Selector(HTML).xpath("//ul"),
+        Selector(HTML).css("li"),
+    ):
+        assert field.sc_parse(markup) == _parsel(markup, field._stack_methods)
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        Parsel().xpath("//Item/@id").getall(),
+        Parsel().css("Item::text").getall(),
+        Parsel().xpath("//Item").get(),
+    ],
+)
+def test_same_result_xml(field):
+    markup = Selector(XML, type="xml")
+    assert field.sc_parse(markup) == _parsel(markup, field._stack_methods)
+
+
+def test_selector_list_result():
+    chunks = Parsel().xpath("//body/ul").xpath("./li").sc_parse(HTML_FOR_SCHEMA)
+    assert [c.xpath("./p/text()").get() for c in chunks] == [
+        "audi",
+        "ferrari",
+        "bentley",
+        "ford",
+        "suzuki",
+    ]
+    assert chunks[0]._expr == "./li"
+
+
+def test_fallback_json():
+    assert Parsel().jmespath("a").xpath("//b").get().sc_parse('{"a": "c"}') is None
+
+
+def test_fallback_custom_namespace():
+    markup = Selector('<root xmlns:x="http://x"><x:a>1</x:a></root>', type="xml")
+    markup.register_namespace("x", "http://x")
+    assert Parsel().xpath("//x:a/text()").get().sc_parse(markup) == "1"
+
+
+def test_lower_query_chain():
+    field = Parsel().xpath("//ul").css("a").attrib.get(key="href").upper()
+    chain = lower_query_chain(field._stack_methods, 0)
+    assert isinstance(chain, QueryChain)
+    assert chain.methods == tuple(field._stack_methods[:4])
+    assert lower_query_chain(field._stack_methods, 4) is None
+    # invalid query not lowered, raise error in runtime
+    assert lower_query_chain(Parsel().xpath("//[")._stack_methods, 0) is None
+    with pytest.raises(ValueError):
+        Parsel().xpath("//[").get().sc_parse(HTML)
+
+
+def test_failed_method():
+    field = Parsel().xpath("//li").css("b")[0].get()
+    ctx = ParseContext()
+    with pytest.raises(IndexError):
+        field.sc_parse(HTML, ctx)
+    assert ctx.failed_method.METHOD_NAME == "__getitem__"
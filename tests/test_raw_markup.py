@@ -0,0 +1,94 @@
+import codecs
+
+import pytest
+from parsel import Selector
+
+from scrape_schema import BaseSchema, Parsel, Sc
+from scrape_schema._charset import detect_encoding
+from scrape_schema.base import SchemaConfig
+from scrape_schema.validator import markup_pre_validator
+
+TEXT = "<html><body><p>Привет, мир</p></body></html>"
+
+
+class Schema(BaseSchema):
+    text: Sc[str, Parsel().xpath("//p/text()").get()]
+
+
+@pytest.mark.parametrize(
+    "body, explicit, expected",
+    [
+        (b"<p>a</p>", None, ("utf-8", 0)),
+        (codecs.BOM_UTF8 + b"<p>a</p>", "cp1251", ("utf-8", 3)),
+        (codecs.BOM_UTF16_LE + "<p>a</p>".encode("utf-16-le"), None, ("utf-16-le", 2)),
+        (b'<meta charset="windows-1251"><p>a</p>', None, ("cp1251", 0)),
+        (b'<meta charset="windows-1251"><p>a</p>', "koi8-r", ("koi8-r", 0)),
+        (
+            b'<meta http-equiv="Content-Type" content="text/html; charset=KOI8-R">',
+            None,
+            ("koi8-r", 0),
+        ),
+        (b'<?xml version="1.0" encoding="ISO-8859-1"?><a/>', None, ("iso8859-1", 0)),
+        (b'<meta charset="utf-16">', None, ("utf-8", 0)),
+        (b'<meta charset="spam">', None, ("utf-8", 0)),
+    ],
+)
+def test_detect_encoding(body, explicit, expected):
+    assert detect_encoding(body, explicit) == expected
+
+
+def test_str_markup():
+    schema = Schema(TEXT)
+    assert schema.__raw__ is schema._markup
+
+
+def test_utf8_bytes_decoded_lazily():
+    body = codecs.BOM_UTF8 + TEXT.encode()
+    schema = Schema(body)
+    assert schema.text == "Привет, мир"
+    assert isinstance(schema._markup, bytes)
+    assert schema.__raw__ == TEXT
+    assert schema.__raw__ is schema._markup
+
+
+def test_meta_charset_bytes():
+    text = TEXT.replace("<html>", '<html><meta charset="windows-1251">')
+    schema = Schema(text.encode("cp1251"))
+    assert schema.text == "Привет, мир"
+    assert schema.__raw__ == text
+
+
+def test_config_encoding():
+    class Koi8Schema(Schema):
+        class Config(SchemaConfig):
+            encoding = "koi8-r"
+
+    schema = Koi8Schema(TEXT.encode("koi8-r"))
+    assert schema.text == "Привет, мир"
+    assert schema.__raw__ == TEXT
+
+
+def test_selector_serialized_lazily(monkeypatch):
+    selector = Selector(TEXT)
+    calls = []
+    get = Selector.get
+
+    def tracked_get(self):
+        calls.append(self)
+        return get(self)
+
+    monkeypatch.setattr(Selector, "get", tracked_get)
+    schema = Schema(selector)
+    assert schema.text == "Привет, мир"
+    assert calls == []
+    assert "Привет, мир" in schema.__raw__
+    assert calls == [selector]
+
+
+def test_pre_validator_raw_bytes():
+    class Validated(Schema):
+        @markup_pre_validator(pattern="мир")
+        def validate(self):
+            return True
+
+    assert Validated(TEXT.encode()).text == "Привет, мир"
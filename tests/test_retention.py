@@ -0,0 +1,157 @@
+from typing import List
+
+import pytest
+from parsel import Selector
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, sc_param
+from scrape_schema._retention import CompressedMarkup
+from scrape_schema.base import SchemaConfig
+from scrape_schema.exceptions import MarkupNotRetainedError
+
+HTML = """
+<html><body>
+<h1>Главная</h1>
+<ul><li>a</li><li>b</li></ul>
+</body></html>
+"""
+
+
+class Item(BaseSchema):
+    text: Sc[str, Parsel().xpath("//li/text()").get()]
+
+
+class Page(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+
+    @sc_param
+    def title_upper(self) -> str:
+        return self.__selector__.xpath("//h1/text()").get().upper()
+
+
+def _retained(retain_, slots_=False):
+    # sc_param properties are not inherited, declare schema again
+    class Retained(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+        items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+        title_upper = Page.title_upper
+
+        class Config(SchemaConfig):
+            retain = retain_
+            slots = slots_
+
+    return Retained
+
+
+def test_retain_all():
+    schema = Page(HTML)
+    assert schema.__selector__ is schema._cached_parser
+    assert schema.__raw__ is HTML
+    assert schema.items[0].__raw__ == "<li>a</li>"
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_retain_raw(slots):
+    schema = _retained("raw", slots)(HTML)
+    assert schema._cached_parser is None
+    assert schema.__raw__ is HTML
+    # document tree is parsed again on access
+    assert schema.__selector__.xpath("//h1/text()").get() == "Главная"
+    assert schema.dict() == {
+        "title": "Главная",
+        "items": [{"text": "a"}, {"text": "b"}],
+        "title_upper": "ГЛАВНАЯ",
+    }
+    item = schema.items[0]
+    assert item._cached_parser is None
+    assert item.__raw__ == "<li>a</li>"
+
+
+@pytest.mark.parametrize("markup", [HTML, HTML.encode(), Selector(HTML)])
+def test_retain_compressed(markup):
+    schema = _retained("compressed")(markup)
+    assert schema._cached_parser is None
+    assert isinstance(schema._markup, CompressedMarkup)
+    assert "<h1>Главная</h1>" in schema.__raw__
+    assert schema.title_upper == "ГЛАВНАЯ"
+    assert isinstance(schema.items[1]._markup, CompressedMarkup)
+    assert schema.items[1].__raw__ == "<li>b</li>"
+
+
+def test_retain_compressed_bytes_encoding():
+    text = HTML.replace("<html>", '<html><meta charset="koi8-r">')
+    schema = _retained("compressed")(text.encode("koi8-r"))
+    assert schema.title == "Главная"
+    assert schema.__raw__ == text
+
+
+def test_retain_compressed_invalid_utf8():
+    # latin-1 without charset declaration: decoded as utf-8 with replacement
+    markup = "<html><body><h1>café</h1><ul><li>a</li></ul></body></html>".encode(
+        "latin-1"
+    )
+    raw = _retained("raw")(markup)
+    schema = _retained("compressed")(markup)
+    assert isinstance(schema._markup, CompressedMarkup)
+    assert schema.__raw__ == raw.__raw__
+    assert "\ufffd" in schema.__raw__
+    assert schema.__selector__.xpath("//li/text()").get() == "a"
+    assert schema.title_upper == raw.title_upper
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_retain_none(slots):
+    schema = _retained("none", slots)(HTML)
+    assert schema._cached_parser is None
+    assert schema._markup is None
+    assert schema.title == "Главная"
+    assert [item.text for item in schema.items] == ["a", "b"]
+    with pytest.raises(MarkupNotRetainedError, match="markup is not retained"):
+        schema.__raw__
+    with pytest.raises(MarkupNotRetainedError):
+        schema.__selector__
+    with pytest.raises(MarkupNotRetainedError):
+        schema.items[0].__raw__
+    # sc_param, which uses document tree, cannot be evaluated
+    with pytest.raises(MarkupNotRetainedError):
+        schema.dict()
+
+
+def test_nested_own_policy():
+    class NoneItem(Item):
+        class Config(SchemaConfig):
+            retain = "none"
+
+    class Parent(BaseSchema):
+        items: Sc[List[NoneItem], Nested(Parsel().xpath("//ul/li"))]
+
+    schema = Parent(HTML)
+    assert schema.__raw__ is HTML
+    assert schema.items[0]._markup is None
+
+
+def test_retain_budget_error():
+    class Limited(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+        class Config(SchemaConfig):
+            retain = "none"
+            max_markup_size = 10
+
+    schema = Limited(HTML)
+    assert schema.__sc_budget_error__.budget == "max_markup_size"
+    assert schema._markup is None
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError, match="unknown retain policy"):
+        _retained("spam")
+
+
+def test_lazy_policy():
+    with pytest.raises(TypeError, match="lazy mode"):
+
+        class Lazy(Page):
+            class Config(SchemaConfig):
+                lazy = True
+                retain = "raw"
@@ -0,0 +1,160 @@
+import pytest
+from parsel import Selector
+
+from scrape_schema import BaseSchema, Parsel, Sc, SchemaRouter
+from scrape_schema.exceptions import SchemaPreValidationError
+from scrape_schema.validator import markup_pre_validator
+
+PRODUCT = '<html><body><div class="product"><h1>Phone</h1></div></body></html>'
+CATEGORY = '<html><body><ul class="category"><li>Phones</li></ul></body></html>'
+NOT_FOUND = "<html><title>404 Not Found</title></html>"
+REVIEW = '<html><body><div class="product"><h1>Phone</h1><p class="review">ok</p></div></body></html>'
+
+
+class Product(BaseSchema):
+    name: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+    @markup_pre_validator(pattern=r'class="product"')
+    def validate(self):
+        return True
+
+
+class Review(BaseSchema):
+    review: Sc[str, Parsel().xpath("//p/text()").get()]
+
+    @markup_pre_validator(pattern=r'class="product"')
+    def validate_product(self):
+        return True
+
+    @markup_pre_validator(css="p.review")
+    def validate_review(self):
+        return True
+
+
+class Category(BaseSchema):
+    items: Sc[list, Parsel().xpath("//li/text()").getall()]
+
+    @markup_pre_validator(pattern='(?i)CLASS="category"', xpath="//ul")
+    def validate(self):
+        return True
+
+
+class NotFound(BaseSchema):
+    title: Sc[str, Parsel().xpath("//title/text()").get()]
+
+    @markup_pre_validator(pattern=r"<title>\d+ Not Found")
+    def validate(self):
+        return True
+
+
+class Fallback(BaseSchema):
+    html: Sc[str, Parsel().xpath("//html").get()]
+
+
+ROUTER = SchemaRouter([Review, Product, Category, NotFound])
+
+
+@pytest.mark.parametrize(
+    "markup, expected",
+    [
+        (PRODUCT, Product),
+        (REVIEW, Review),
+        (CATEGORY, Category),
+        (NOT_FOUND, NotFound),
+    ],
+)
+@pytest.mark.parametrize("convert", [str, str.encode, Selector])
+def test_route(markup, expected, convert):
+    markup = convert(markup)
+    assert ROUTER.match(markup) is expected
+    schema = ROUTER.parse(markup)
+    assert type(schema) is expected
+    assert schema.dict() == expected(markup).dict()
+
+
+def test_no_match():
+    assert ROUTER.match("<p>spam</p>") is None
+    with pytest.raises(SchemaPreValidationError, match="No schema matches"):
+        ROUTER.parse("<p>spam</p>")
+    router = SchemaRouter([Product, Fallback])
+    assert type(router.parse("<p>spam</p>")) is Fallback
+
+
+def test_validator_method_result():
+    class Rejected(BaseSchema):
+        name: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+        @markup_pre_validator(pattern="product")
+        def validate(self):
+            return False
+
+    router = SchemaRouter([Rejected, Product])
+    assert router.match(PRODUCT) is Rejected
+    assert type(router.parse(PRODUCT)) is Product
+
+
+def test_overlapped_patterns():
+    class A(BaseSchema):
+        @markup_pre_validator(pattern="abcd")
+        def validate(self):
+            return True
+
+    class B(BaseSchema):
+        @markup_pre_validator(pattern="bc")
+        def validate(self):
+            return True
+
+    class C(BaseSchema):
+        @markup_pre_validator(pattern="ab")
+        def validate(self):
+            return True
+
+    # `bc` is inside `abcd` match, `ab` starts at the same position
+    router = SchemaRouter([A, B, C])
+    assert router._scan("xabcdx") == {0, 1, 2}
+    assert router._scan(b"xabcdx") == {0, 1, 2}
+    assert SchemaRouter([B, C]).match("<p>abc</p>") is B
+
+
+def test_bytes_scan():
+    class Unicode(BaseSchema):
+        @markup_pre_validator(pattern="Привет.мир")
+        def validate(self):
+            return True
+
+    assert SchemaRouter([Review, Product, Category])._bytes_scan
+    assert not ROUTER._bytes_scan  # `\d` matches unicode digits in str
+    router = SchemaRouter([Unicode, Product])
+    assert not router._bytes_scan
+    text = "<p>Привет, мир</p>"
+    assert router.match(text.encode("cp1251")) is None
+    text = '<meta charset="cp1251"><p>Привет мир</p>'
+    assert router.match(text.encode("cp1251")) is Unicode
+
+
+def test_group_reference_pattern():
+    class Quoted(BaseSchema):
+        @markup_pre_validator(pattern=r"(['\"])quoted\1")
+        def validate(self):
+            return True
+
+    router = SchemaRouter([Quoted, Product])
+    assert router.match("<a href='quoted'>") is Quoted
+    assert router.match(b'<a href="quoted">') is Quoted
+    assert router.match(PRODUCT.encode()) is Product
+
+
+def test_literal_patterns():
+    class Unicode(BaseSchema):
+        @markup_pre_validator(pattern="Привет")
+        def validate(self):
+            return True
+
+    router = SchemaRouter([Unicode, Product])
+    assert router._literals == {
+        0: ("Привет", "Привет".encode()),
+        1: ('class="product"', b'class="product"'),
+    }
+    assert router._bytes_scan
+    assert router.match("<p>Привет</p>".encode()) is Unicode
+    assert router.match(PRODUCT.encode()) is Product
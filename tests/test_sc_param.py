@@ -0,0 +1,141 @@
+import pytest
+
+from scrape_schema import BaseSchema, Parsel, Sc, sc_param
+from scrape_schema.base import SchemaConfig
+
+HTML = '<html><body><h1>Title</h1><a href="/path">link</a><p>10</p></body></html>'
+
+
+def _schema(slots_=False, calls=None):
+    calls = [] if calls is None else calls
+
+    class Schema(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+        path: Sc[str, Parsel().xpath("//a/@href").get()]
+        count: Sc[int, Parsel().xpath("//p/text()").get()]
+
+        class Config(SchemaConfig):
+            slots = slots_
+
+        @sc_param(depends=["path"])
+        def url(self) -> str:
+            calls.append("url")
+            return f"https://example.com{self.path}"
+
+        @sc_param(depends=["url"])
+        def secure_url(self) -> str:
+            calls.append("secure_url")
+            return self.url.replace("https", "wss")
+
+        @sc_param
+        def summary(self) -> str:
+            calls.append("summary")
+            return f"{self.title}: {self.count}"
+
+    return Schema
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_cached(slots):
+    calls = []
+    schema = _schema(slots, calls)(HTML)
+    first = schema.dict()
+    assert schema.dict() == first
+    repr(schema)
+    assert sorted(calls) == ["secure_url", "summary", "url"]
+    assert first["url"] == "https://example.com/path"
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_invalidate_on_reassign(slots):
+    calls = []
+    schema = _schema(slots, calls)(HTML)
+    schema.dict()
+    calls.clear()
+    schema.title = "New"
+    # url does not depend on title
+    assert schema.url == "https://example.com/path"
+    assert schema.summary == "New: 10"
+    assert calls == ["summary"]
+    calls.clear()
+    schema.path = "/other"
+    assert schema.secure_url == "wss://example.com/other"
+    assert schema.summary == "New: 10"
+    # summary depends on all fields
+    assert calls == ["secure_url", "url", "summary"]
+
+
+def test_deps_map():
+    schema_cls = _schema()
+    assert schema_cls.__schema_param_deps__ == {
+        "title": ("summary",),
+        "path": ("secure_url", "summary", "url"),
+        "count": ("summary",),
+        "url": ("secure_url",),
+    }
+
+
+def test_unknown_dependency():
+    with pytest.raises(ValueError, match="unknown names"):
+
+        class Schema(BaseSchema):
+            title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+            @sc_param(depends=["spam"])
+            def upper(self) -> str:
+                return self.title.upper()
+
+
+def test_projection_parses_dependencies():
+    schema_cls = _schema()
+    schema = schema_cls(HTML, include={"secure_url"})
+    assert schema.dict() == {"secure_url": "wss://example.com/path"}
+    assert schema.path == "/path"
+    assert not hasattr(schema, "title")
+
+
+def test_setter():
+    class Schema(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+
+        @sc_param
+        def name(self) -> str:
+            return getattr(self, "_name", self.title)
+
+        @name.setter
+        def name(self, value: str) -> None:
+            self._name = value
+
+    schema = Schema(HTML)
+    assert schema.name == "Title"
+    schema.name = "Other"
+    assert schema.name == "Other"
+    assert schema.dict() == {"name": "Other", "title": "Title"}
+
+
+def test_setter_deleter_depends():
+    class Schema(BaseSchema):
+        title: Sc[str, Parsel().xpath("//h1/text()").get()]
+        path: Sc[str, Parsel().xpath("//a/@href").get()]
+
+        @sc_param(depends=["title"])
+        def name(self) -> str:
+            return getattr(self, "_name", self.title)
+
+        @name.setter
+        def name(self, value: str) -> None:
+            self._name = value
+
+        @name.deleter
+        def name(self) -> None:
+            del self._name
+
+    assert Schema.name.depends == ("title",)
+    assert Schema.__schema_param_deps__ == {"title": ("name",)}
+    schema = Schema(HTML, include={"name"})
+    assert schema.dict() == {"name": "Title"}
+    assert not hasattr(schema, "path")
+    schema.name = "Other"
+    assert schema.name == "Other"
+    del schema.name
+    assert schema.name == "Title"
@@ -0,0 +1,178 @@
+import json
+import sys
+from typing import List
+
+import pytest
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, _serialize, sc_param
+from scrape_schema.base import SchemaConfig
+
+HTML = """
+<h1>Заголовок</h1>
+<ul>
+<li><p>a</p><b>1</b></li>
+<li><p>b</p><b>2</b></li>
+</ul>
+"""
+
+
+class Item(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    count: Sc[int, Parsel(alias="cnt").xpath("//b/text()").get()]
+
+
+class Page(BaseSchema):
+    title: Sc[str, Parsel().xpath("//h1/text()").get()]
+    items: Sc[List[Item], Nested(Parsel().xpath("//li"))]
+    first: Sc[Item, Nested(Parsel().xpath("//li")[0])]
+    tags: Sc[List[str], Parsel(default=[]).xpath("//i/text()").getall()]
+
+    @sc_param
+    def total(self) -> int:
+        return sum(item.count for item in self.items)
+
+
+EXPECTED = {
+    "total": 3,
+    "title": "Заголовок",
+    "items": [{"name": "a", "cnt": 1}, {"name": "b", "cnt": 2}],
+    "first": {"name": "a", "cnt": 1},
+    "tags": [],
+}
+
+
+def test_dict():
+    page = Page(HTML)
+    assert page.dict() == EXPECTED
+    assert page.dict(by_alias=False)["first"] == {"name": "a", "cnt": 1}
+    assert page.first.dict(by_alias=False) == {"name": "a", "count": 1}
+
+
+def test_dict_returns_new_objects():
+    page = Page(HTML)
+    result = page.dict()
+    result["spam"] = 1
+    result["items"][0]["name"] = "spam"
+    assert page.dict() == EXPECTED
+
+
+def test_dict_cache_reset():
+    page = Page(HTML)
+    assert page.dict()["title"] == "Заголовок"
+    page.title = "New"
+    page.items = page.items[:1]
+    assert page.dict()["title"] == "New"
+    assert page.dict()["total"] == 1
+    page.first.name = "z"
+    assert page.dict()["first"] == {"name": "z", "cnt": 1}
+
+
+def test_dict_result_cache():
+    item = Item("<p>a</p><b>1</b>")
+    result = item.dict()
+    assert item.__sc_dict_result__ == {True: {"name": "a", "cnt": 1}}
+    result["name"] = "spam"
+    assert item.dict() == {"name": "a", "cnt": 1}
+    assert item.dict() is not item.dict()
+    assert item.dict(by_alias=False) == {"name": "a", "count": 1}
+    item.count = 2
+    assert item.__sc_dict_result__ is None
+    assert item.dict() == {"name": "a", "cnt": 2}
+
+
+def test_dict_result_cache_plain_values_only():
+    page = Page(HTML)
+    page.dict()
+    # nested schemas and lists may be changed without reassign
+    assert page.__sc_dict_result__ is None
+    assert page.first.__sc_dict_result__ == {True: {"name": "a", "cnt": 1}}
+    page.first.__sc_dict_result__[True]["name"] = "cached"
+    assert page.dict()["first"] == {"name": "cached", "cnt": 1}
+
+
+def test_to_tuple():
+    page = Page(HTML)
+    assert page.to_tuple() == (
+        "Заголовок",
+        [("a", 1), ("b", 2)],
+        ("a", 1),
+        [],
+        3,
+    )
+
+
+def test_to_tuple_projection():
+    page = Page(HTML, include={"first": {"count"}, "total": True, "items": True})
+    assert page.to_tuple() == ([("a", 1), ("b", 2)], (1,), 3)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_serialize, "orjson", None)
+    elif _serialize._orjson() is None:  # pragma: no cover
+        pytest.skip("orjson is not installed")
+    page = Page(HTML)
+    assert json.loads(page.to_json()) == EXPECTED
+    assert json.loads(page.to_json_bytes()) == EXPECTED
+    assert "Заголовок" in page.to_json()
+    assert page.to_json_bytes().decode() == page.to_json()
+    assert page.first.to_json(by_alias=False) == '{"name":"a","count":1}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_default(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_serialize, "orjson", None)
+    elif _serialize._orjson() is None:  # pragma: no cover
+        pytest.skip("orjson is not installed")
+
+    class Schema(BaseSchema):
+        tags: Sc[set, Parsel(auto_type=False).xpath("//p/text()").getall().fn(set)]
+
+    schema = Schema(HTML)
+    with pytest.raises(TypeError):
+        schema.to_json()
+    assert json.loads(schema.to_json(default=sorted)) == {"tags": ["a", "b"]}
+
+
+def test_slots():
+    class SlottedItem(Item):
+        class Config(SchemaConfig):
+            slots = True
+
+    item = SlottedItem("<p>a</p><b>1</b>")
+    assert item.dict() == {"name": "a", "cnt": 1}
+    item.name = "b"
+    assert item.dict() == {"name": "b", "cnt": 1}
+    assert item.to_tuple() == ("b", 1)
+
+
+def test_list_changed_in_place():
+    page = Page(HTML)
+    page.dict()
+    page.tags.append(page.first)
+    assert page.dict()["tags"] == [{"name": "a", "cnt": 1}]
+    assert page.to_tuple()[3] == [("a", 1)]
+    page.tags.clear()
+    assert page.dict()["tags"] == []
+
+
+class Node(BaseSchema):
+    name: Sc[str, Parsel().xpath("//p/text()").get()]
+    children: Sc[List[Item], Nested(Parsel(default=[]).xpath("//i"))]
+
+
+def test_deep_nesting():
+    depth = sys.getrecursionlimit() * 2
+    root = node = Node("<p>0</p>")
+    for i in range(1, depth):
+        node.children = [Node(f"<p>{i}</p>")]
+        node = node.children[0]
+    result = root.dict()
+    values = root.to_tuple()
+    for i in range(depth):
+        assert result["name"] == values[0] == str(i)
+        result = result["children"][0] if result["children"] else None
+        values = values[1][0] if values[1] else None
+    assert result is values is None
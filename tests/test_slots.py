@@ -0,0 +1,142 @@
+import sys
+from typing import List
+
+import pytest
+from tests.fixtures import HTML_FOR_SCHEMA
+
+from scrape_schema import BaseSchema, Nested, Parsel, Sc, sc_param
+from scrape_schema.base import SchemaConfig
+from scrape_schema.validator import markup_pre_validator
+
+
+class SlotsConfig(SchemaConfig):
+    slots = True
+
+
+class Item(BaseSchema):
+    class Config(SlotsConfig):
+        pass
+
+    name: Sc[str, Parsel(alias="title").xpath("//p/text()").get()]
+    price: int = Parsel().xpath("//div[@class='price']/text()").get()
+
+    @sc_param
+    def label(self) -> str:
+        return f"{self.name}: {self.price}"
+
+    @markup_pre_validator(xpath="//p")
+    def is_item(self) -> bool:
+        return True
+
+    def __repr__(self):
+        # zero-arguments super(): class cell is bound to the slotted class
+        return super().__repr__()
+
+
+class ItemDict(BaseSchema):
+    name: Sc[str, Parsel(alias="title").xpath("//p/text()").get()]
+    price: int = Parsel().xpath("//div[@class='price']/text()").get()
+
+    @sc_param
+    def label(self) -> str:
+        return f"{self.name}: {self.price}"
+
+
+class Page(BaseSchema):
+    class Config(SlotsConfig):
+        pass
+
+    items: Sc[List[Item], Nested(Parsel().xpath("//ul/li"))]
+
+
+def test_slots_layout():
+    item = Item(HTML_FOR_SCHEMA)
+    assert not hasattr(item, "__dict__")
+    assert item.name == "audi"
+    assert item.price == 10000
+    assert "name" in Item.__slots__
+
+
+def test_slots_output():
+    assert Item(HTML_FOR_SCHEMA).dict() == ItemDict(HTML_FOR_SCHEMA).dict()
+    assert repr(Item(HTML_FOR_SCHEMA)) == repr(ItemDict(HTML_FOR_SCHEMA)).replace(
+        "ItemDict", "Item"
+    )
+    assert Item(HTML_FOR_SCHEMA).dict(by_alias=False)["name"] == "audi"
+    assert Page(HTML_FOR_SCHEMA).dict()["items"][1]["title"] == "ferrari"
+
+
+def test_precomputed_layout():
+    assert Item.__schema_output__ == (("name", "title"), ("price", "price"))
+    assert list(Item.__schema_sc_params__) == ["label"]
+    assert Item.__schema_pre_validators__ == ("is_item",)
+    assert Item.__schema_slotted__
+    assert not ItemDict.__schema_slotted__
+
+
+def test_slots_memory():
+    slotted, regular = Item(HTML_FOR_SCHEMA), ItemDict(HTML_FOR_SCHEMA)
+    assert sys.getsizeof(slotted) < sys.getsizeof(regular) + sys.getsizeof(
+        regular.__dict__
+    )
+
+
+def test_slots_inheritance():
+    class Child(Item):
+        count: Sc[int, Parsel().xpath("//li").getall().count()]
+
+    class Regular(Item):
+        class Config(SchemaConfig):
+            pass
+
+    child = Child(HTML_FOR_SCHEMA)
+    assert not hasattr(child, "__dict__")
+    assert child.count == 5
+    assert "_markup" not in Child.__slots__
+    regular = Regular(HTML_FOR_SCHEMA)
+    assert regular.__dict__ == {}
+    assert regular.__sc_unparsed__ == ()
+
+
+def test_slots_budget_and_projection():
+    class Limited(BaseSchema):
+        class Config(SlotsConfig):
+            max_nodes = 1
+
+        name: Sc[str, Parsel().xpath("//p/text()").get()]
+
+    limited = Limited(HTML_FOR_SCHEMA)
+    assert limited.__sc_unparsed__ == ("name",)
+    assert limited.name is None
+    assert Item(HTML_FOR_SCHEMA, include={"price"}).dict() == {"price": 10000}
+
+
+def test_slots_lazy_not_supported():
+    with pytest.raises(TypeError):
+
+        class Lazy(BaseSchema):
+            class Config(SlotsConfig):
+                lazy = True
+
+            name: Sc[str, Parsel().xpath("//p/text()").get()]
+
+
+def test_slots_class_created_once():
+    created = []
+
+    class Base(BaseSchema):
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            created.append(cls)
+
+    class Slotted(Base):
+        class Config(SlotsConfig):
+            pass
+
+        name: Sc[str, Parsel().xpath("//p/text()").get()]
+        price: int = Parsel().xpath("//div[@class='price']/text()").get()
+
+    assert created == [Slotted]
+    assert Slotted.__slots__[:2] == ("name", "price")
+    assert list(Slotted.__schema_fields__) == ["name", "price"]
+    assert Slotted(HTML_FOR_SCHEMA).price == 10000
@@ -2,6 +2,7 @@ import pytest
 from tests.fixtures import HTML, HTML_SCRIPT
 
 from scrape_schema import Parsel
+from scrape_schema.special_methods import SpecialMethods
 
 
 def test_fn():
@@ -276,3 +277,27 @@ def test_re_findall_group_fail():
 def test_re_findall_value_fail():
     with pytest.raises(TypeError):
         Parsel(raw=True).split().re_findall(r"\d+").sc_parse("test 100 120")
+
+
+def test_string_methods_batch():
+    from scrape_schema.special_methods import (
+        ConcatLeftMethod,
+        MarkupMethod,
+        ReplaceMethod,
+        StripMethod,
+    )
+
+    markup = [" a ", " b"]
+    assert StripMethod().batch(markup, MarkupMethod(SpecialMethods.STRIP, (None,))) == [
+        "a",
+        "b",
+    ]
+    method = MarkupMethod(SpecialMethods.REPLACE, (" ", "_", -1))
+    assert ReplaceMethod()(markup, method) == ["_a_", "_b"]
+    assert ReplaceMethod()(" a ", method) == "_a_"
+    assert ConcatLeftMethod()(
+        markup, MarkupMethod(SpecialMethods.CONCAT_L, ("+",))
+    ) == [
+        "+ a ",
+        "+ b",
+    ]
@@ -104,3 +104,59 @@ def test_re_validation():
 def test_failed_re_validation():
     with pytest.raises(SchemaPreValidationError):
         ValidatedSchemaRe(Selector("<title>hello</title>"))
+
+
+class ValidatedSchemaReUnicode(BaseSchema):
+    item: str = Parsel().xpath("//p/text()").get()
+
+    @markup_pre_validator(pattern=r"<p>\w+</p>")
+    def validate(self):
+        return True
+
+
+def _count_selectors(monkeypatch):
+    import scrape_schema.base
+
+    calls = []
+
+    class CountedSelector(Selector):
+        def __init__(self, *args, **kwargs):
+            calls.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(scrape_schema.base, "Selector", CountedSelector)
+    return calls
+
+
+@pytest.mark.parametrize("markup", ["<title>hello</title>", b"<title>hello</title>"])
+def test_failed_re_validation_without_parse(monkeypatch, markup):
+    calls = _count_selectors(monkeypatch)
+    with pytest.raises(
+        SchemaPreValidationError, match="Failed validate re `<p>audi</p>`"
+    ):
+        ValidatedSchemaRe(markup)
+    assert calls == []
+
+
+def test_re_validation_bytes():
+    assert ValidatedSchemaRe.__schema_bytes_patterns__
+    ValidatedSchemaRe(HTML_FOR_SCHEMA.encode("utf-8"))
+
+
+def test_re_validation_decoded_bytes():
+    assert not ValidatedSchemaReUnicode.__schema_bytes_patterns__
+    schema = ValidatedSchemaReUnicode("<p>ёжик</p>".encode("utf-8"))
+    assert schema.item == "ёжик"
+    markup = '<meta charset="cp1251"><p>ёжик</p>'.encode("cp1251")
+    schema = ValidatedSchemaReUnicode(markup)
+    assert schema.item == "ёжик"
+    with pytest.raises(SchemaPreValidationError):
+        ValidatedSchemaReUnicode("<p>ё ж</p>".encode("utf-8"))
+
+
+def test_compiled_validators():
+    name, validator = ValidatedSchemaRe.__schema_validators__[0]
+    assert name == "markup_not_title"
+    assert ValidatedSchemaRe.__schema_pattern_validators__ == (validator,)
+    assert validator._re.pattern == r"<p>audi</p>"
+    assert ValidatedSchemaXpath.__schema_pattern_validators__ == ()